@@ -3,12 +3,14 @@ Menu API routes
 Implements Phase 2 menu system API endpoints
 """
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from src.database import get_db
 from src.models import menu as menu_models
 from src.services.menu import menu_service, menu_validator
+from src.services.tts.prerender import prerender_menu
 from src.utils import logger
 
 router = APIRouter(prefix="/api/v1/menu", tags=["menu"])
@@ -64,11 +66,22 @@ async def get_menu(menu_id: int, db: Session = Depends(get_db)):
     return menu
 
 
+@router.get("/menus/{menu_id}/full", response_model=menu_models.FullMenuResponse)
+async def get_full_menu(menu_id: int, db: Session = Depends(get_db)):
+    """Get menu with all categories, items, variants and add-ons in one response"""
+    body = menu_service.get_full_menu_json(db, menu_id)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    return Response(content=body, media_type="application/json")
+
+
 @router.post("/menus/{menu_id}/publish", response_model=menu_models.MenuResponse)
-async def publish_menu(menu_id: int, db: Session = Depends(get_db)):
-    """Publish menu"""
+async def publish_menu(menu_id: int, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    """Publish menu and pre-render its TTS in the background"""
     try:
-        menu = menu_service.publish_menu(db, menu_id)
+        # Validation and the snapshot build are blocking; keep them off the event loop
+        menu = await run_in_threadpool(menu_service.publish_menu, db, menu_id)
+        background_tasks.add_task(prerender_menu, menu_id)
         return menu
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -80,7 +93,7 @@ async def publish_menu(menu_id: int, db: Session = Depends(get_db)):
 @router.get("/menus/{menu_id}/validate", response_model=menu_models.MenuValidationResult)
 async def validate_menu(menu_id: int, db: Session = Depends(get_db)):
     """Validate menu structure"""
-    return menu_validator.validate_menu(db, menu_id)
+    return await run_in_threadpool(menu_validator.validate_menu, db, menu_id)
 
 
 # ============== CATEGORY ENDPOINTS ==============
@@ -125,7 +138,7 @@ async def create_item(item: menu_models.ItemCreate, db: Session = Depends(get_db
 @router.get("/items/{item_id}", response_model=menu_models.ItemResponse)
 async def get_item(item_id: int, db: Session = Depends(get_db)):
     """Get item by ID"""
-    item = menu_service.get_item(db, item_id)
+    item = menu_service.get_item_node(db, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     return item
@@ -2,10 +2,13 @@
 NLU API routes
 Implements Phase 3 NLU endpoints
 """
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from src.config import settings
 from src.database import get_db
 from src.models.nlu import NLURequest, NLUResponse, KeywordMatch
 from src.services.nlu import nlu_service, keyword_service
@@ -15,40 +18,43 @@ router = APIRouter(prefix="/api/v1/nlu", tags=["nlu"])
 
 
 @router.post("/process", response_model=NLUResponse)
-async def process_text(request: NLURequest, db: Session = Depends(get_db)):
+async def process_text(
+    request: NLURequest,
+    http_response: Response,
+    x_nlu_deadline_ms: Optional[int] = Header(default=None, ge=0),
+    db: Session = Depends(get_db)
+):
     """
     Process text for NLU (intent classification + slot extraction)
 
+    The tier that produced the answer is returned in X-NLU-Tier and the
+    per-tier latency in Server-Timing. X-NLU-Degraded is "true" when the
+    LLM missed the deadline (or was unavailable) and a lower-tier answer
+    was returned.
+
     Args:
         request: NLU request with text and context
+        http_response: Response used to attach routing headers
+        x_nlu_deadline_ms: Optional per-request latency budget (X-NLU-Deadline-Ms)
         db: Database session
 
     Returns:
         NLU response with intent, slots, and entities
     """
     try:
-        # Process with NLU service
-        response = await nlu_service.process(request)
-
-        # If branch_id provided, match keywords
-        if request.branch_id:
-            keyword_matches = keyword_service.match_keywords(
-                text=request.text,
-                language=request.language,
-                branch_id=request.branch_id,
-                db=db,
-                limit=5
-            )
-            response.matched_keywords = [
-                f"{match.item_name_en} ({match.confidence:.2f})"
-                for match in keyword_matches
-            ]
+        # Process with NLU service (matches branch keywords when branch_id is set)
+        response, trace = await nlu_service.process_traced(request, db, deadline_ms=x_nlu_deadline_ms)
+        http_response.headers["X-NLU-Tier"] = trace.final_tier or "none"
+        http_response.headers["X-NLU-Degraded"] = "true" if trace.degraded else "false"
+        http_response.headers["Server-Timing"] = trace.server_timing()
 
         logger.info(
             "NLU processed",
             intent=response.intent.intent_type.value,
             confidence=response.intent.confidence,
-            slots_count=len(response.slots)
+            slots_count=len(response.slots),
+            tier=trace.final_tier,
+            degraded=trace.degraded
         )
 
         return response
@@ -58,6 +64,47 @@ async def process_text(request: NLURequest, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/process/batch")
+async def process_batch(requests: List[NLURequest], db: Session = Depends(get_db)):
+    """
+    Process many utterances in one call
+
+    Identical requests are processed once and each branch keyword index is
+    resolved once for the whole batch. Results stream back as NDJSON, one line per
+    request: {"index": <position in the batch>, "result": <NLUResponse>}.
+
+    Args:
+        requests: NLU requests (at most NLU_BATCH_MAX_SIZE)
+        db: Database session
+
+    Returns:
+        Streaming NDJSON response
+
+    Raises:
+        HTTPException: 413 if the batch is larger than NLU_BATCH_MAX_SIZE
+    """
+    if len(requests) > settings.nlu_batch_max_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch of {len(requests)} requests exceeds the limit of {settings.nlu_batch_max_size}"
+        )
+
+    branch_ids = {request.branch_id for request in requests if request.branch_id}
+    keyword_indexes = {}
+    if branch_ids and settings.enable_keyword_matching:
+        # Resolved up front: the session is closed before the stream is consumed
+        keyword_indexes = keyword_service.get_indexes(db, branch_ids)
+
+    logger.info("NLU batch started", requests=len(requests), branches=len(branch_ids))
+
+    async def stream():
+        async for index, response in nlu_service.process_batch(requests, keyword_indexes):
+            line = {"index": index, "result": response.model_dump(mode="json")}
+            yield json.dumps(line, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @router.post("/keywords/match", response_model=List[KeywordMatch])
 async def match_keywords(
     text: str,
@@ -113,5 +160,10 @@ async def nlu_health_check():
         "service": "nlu",
         "status": nlu_service.status.value,
         "model_loaded": nlu_service.model is not None,
-        "fallback_available": True
+        "fallback_available": True,
+        "prompt_cache": nlu_service.prompt_cache.get_stats(),
+        "llm_executor": nlu_service.llm.get_stats(),
+        "result_cache": nlu_service.result_cache.get_stats(),
+        "tiers": nlu_service.tier_stats.get_stats(),
+        "keyword_index": keyword_service.get_stats()
     }
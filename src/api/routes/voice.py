@@ -12,13 +12,15 @@ from src.models import (
     TranscriptionResponse,
     TTSRequest,
     TTSResponse,
+    AudioFormat,
     LanguageCode,
     HealthCheckResponse
 )
 from src.services.stt import stt_service
 from src.services.tts import tts_service
+from src.services.tts.audio_formats import MEDIA_TYPES, FILE_EXTENSIONS, output_sample_rate
 from src.services.language import language_detector
-from src.utils import logger
+from src.utils import logger, ServiceSaturatedError
 
 router = APIRouter(prefix="/api/v1/voice", tags=["voice"])
 
@@ -64,6 +66,10 @@ async def transcribe_audio(
 
         return result
 
+    except ServiceSaturatedError as e:
+        logger.warning("STT saturated, rejecting request", error=str(e))
+        raise HTTPException(status_code=503, detail=str(e))
+
     except Exception as e:
         logger.error("Transcription failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
@@ -92,25 +98,89 @@ async def generate_speech(request: TTSRequest):
             "Speech generated",
             text_length=len(request.text),
             language=request.language.value,
-            duration=response.duration
+            duration=response.duration,
+            format=response.format,
+            size_bytes=len(response.audio_data)
         )
 
         # Return as streaming audio response
+        output_format = AudioFormat(response.format)
         return StreamingResponse(
             audio_buffer,
-            media_type="audio/wav",
+            media_type=MEDIA_TYPES[output_format],
             headers={
-                "Content-Disposition": "attachment; filename=speech.wav",
+                "Content-Disposition": f"attachment; filename=speech.{FILE_EXTENSIONS[output_format]}",
                 "X-Audio-Duration": str(response.duration),
-                "X-Sample-Rate": str(response.sample_rate)
+                "X-Sample-Rate": str(response.sample_rate),
+                "X-Audio-Format": response.format
             }
         )
 
+    except ServiceSaturatedError as e:
+        logger.warning("TTS saturated, rejecting request", error=str(e))
+        raise HTTPException(status_code=503, detail=str(e))
+
     except Exception as e:
         logger.error("Speech generation failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"Speech generation failed: {str(e)}")
 
 
+@router.post("/tts/stream")
+async def stream_speech(request: TTSRequest):
+    """
+    Stream speech as it is synthesized
+
+    Audio is sent with chunked transfer encoding as raw mono 16-bit
+    little-endian PCM (or μ-law when requested); the first sentence plays
+    while the rest is still being generated.
+
+    Args:
+        request: TTS request with text and configuration
+
+    Returns:
+        Chunked PCM audio response
+    """
+    # Containers cannot be chunked; the WAV default streams as raw PCM
+    output_format = AudioFormat.PCM if request.output_format == AudioFormat.WAV else request.output_format
+    stream = tts_service.generate_speech_streaming(
+        request.text,
+        request.language,
+        request.voice_config,
+        output_format=output_format,
+        sample_rate=request.sample_rate
+    )
+
+    # Pull the first chunk before committing to a 200 so saturation and
+    # model errors still map to proper status codes
+    try:
+        first_chunk = await stream.__anext__()
+    except StopAsyncIteration:
+        first_chunk = b""
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ServiceSaturatedError as e:
+        logger.warning("TTS saturated, rejecting request", error=str(e))
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error("Speech streaming failed", error=str(e))
+        raise HTTPException(status_code=500, detail=f"Speech generation failed: {str(e)}")
+
+    async def body():
+        yield first_chunk
+        async for chunk in stream:
+            yield chunk
+
+    sample_rate = output_sample_rate(output_format, request.sample_rate, tts_service.output_sample_rate)
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[output_format],
+        headers={
+            "X-Sample-Rate": str(sample_rate),
+            "X-Audio-Format": output_format.value
+        }
+    )
+
+
 @router.get("/stt/health", response_model=HealthCheckResponse)
 async def stt_health_check():
     """
@@ -150,7 +220,7 @@ async def clear_tts_cache():
         Number of items cleared
     """
     try:
-        count = tts_service.clear_cache()
+        count = tts_service.clear_cache(include_disk=True)
         logger.info("TTS cache cleared", count=count)
         return {"message": f"Cleared {count} cached items", "count": count}
     except Exception as e:
@@ -1,17 +1,25 @@
 """
 WebSocket handler for real-time voice interaction
 """
+import time
 import asyncio
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Set
 from fastapi import WebSocket, WebSocketDisconnect
 import numpy as np
 
-from src.services.stt import stt_service
+from src.config import settings
+from src.services.stt import (
+    stt_service,
+    StreamingTranscriber,
+    UtteranceEndpointer,
+    EndpointEventType
+)
 from src.services.tts import tts_service
+from src.services.tts.audio_formats import output_sample_rate
 from src.services.language import language_detector
 from src.services.interruption import interruption_detector
-from src.models import TTSRequest, LanguageCode, VoiceInterruptionEvent
+from src.models import TTSRequest, LanguageCode, AudioFormat, VoiceInterruptionEvent
 from src.utils import logger
 
 
@@ -20,14 +28,18 @@ class VoiceWebSocketHandler:
     WebSocket handler for real-time voice interaction
 
     Handles:
-    - Real-time STT streaming
+    - Real-time STT streaming (partial and final transcripts)
+    - Server-side utterance endpointing (one STT job per utterance)
     - Real-time TTS streaming
-    - Voice interruption detection
+    - Voice interruption detection (cancels in-flight TTS on barge-in)
     - Bidirectional audio streaming
     """
 
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
+        self.streaming_sessions: Dict[str, StreamingTranscriber] = {}
+        self.endpointers: Dict[str, UtteranceEndpointer] = {}
+        self.tts_tasks: Dict[str, Set[asyncio.Task]] = {}
 
     async def connect(self, websocket: WebSocket, client_id: str):
         """
@@ -40,6 +52,12 @@ class VoiceWebSocketHandler:
         await websocket.accept()
         self.active_connections[client_id] = websocket
 
+        if settings.stt_streaming_enabled:
+            self.streaming_sessions[client_id] = StreamingTranscriber(stt_service)
+
+        if settings.stt_endpointing_enabled:
+            self.endpointers[client_id] = UtteranceEndpointer()
+
         logger.info(
             "WebSocket connected",
             client_id=client_id,
@@ -53,6 +71,11 @@ class VoiceWebSocketHandler:
         Args:
             client_id: Client identifier
         """
+        self.cancel_tts(client_id)
+        self.tts_tasks.pop(client_id, None)
+        self.streaming_sessions.pop(client_id, None)
+        self.endpointers.pop(client_id, None)
+
         if client_id in self.active_connections:
             del self.active_connections[client_id]
             logger.info(
@@ -78,7 +101,9 @@ class VoiceWebSocketHandler:
 
         Message Format (to client):
         {
-            "type": "transcription" | "speech" | "interruption" | "error",
+            "type": "transcription" | "partial_transcription" |
+                    "final_transcription" | "speech" | "interruption" |
+                    "tts_start" | "tts_complete" | "tts_cancelled" | "error",
             "data": {...}
         }
         """
@@ -143,16 +168,58 @@ class VoiceWebSocketHandler:
         """
         Process audio chunk for STT
 
+        Frames go through the connection's endpointer first; STT only runs
+        once an utterance has ended (or incrementally while it is open when
+        streaming is enabled).
+
         Args:
             websocket: WebSocket connection
             audio_data: Raw audio bytes
             client_id: Client identifier
         """
         try:
-            # Convert audio bytes to numpy array
-            # Assuming 16-bit PCM, 16kHz
-            audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
-            audio_array = audio_array / 32768.0  # Normalize to [-1, 1]
+            await self._check_interruption(audio_data, client_id)
+
+            session = self.streaming_sessions.get(client_id)
+            endpointer = self.endpointers.get(client_id)
+
+            if endpointer is None:
+                # No endpointing: every frame is treated as an utterance
+                if session is not None:
+                    await self.process_streaming_audio(websocket, session, self._to_float(audio_data))
+                else:
+                    await self.process_utterance(websocket, audio_data, client_id)
+                return
+
+            for event in endpointer.process(audio_data):
+                if event.type == EndpointEventType.SPEECH_END:
+                    if session is not None:
+                        await self.flush_streaming_session(websocket, client_id)
+                    else:
+                        await self.process_utterance(websocket, event.audio, client_id)
+                elif session is not None:
+                    await self.process_streaming_audio(websocket, session, self._to_float(event.audio))
+
+        except Exception as e:
+            logger.error("Audio processing failed", client_id=client_id, error=str(e))
+            await self.send_error(websocket, f"Audio processing failed: {str(e)}")
+
+    async def process_utterance(
+        self,
+        websocket: WebSocket,
+        audio_data: bytes,
+        client_id: str
+    ):
+        """
+        Transcribe a complete utterance and send the result
+
+        Args:
+            websocket: WebSocket connection
+            audio_data: Raw 16-bit PCM utterance audio
+            client_id: Client identifier
+        """
+        try:
+            audio_array = self._to_float(audio_data)
 
             # Transcribe audio
             result = await stt_service.transcribe(audio_array, sample_rate=16000)
@@ -171,20 +238,110 @@ class VoiceWebSocketHandler:
                 }
             })
 
-            # Check for interruption if TTS is speaking
-            if interruption_detector.is_speaking:
-                interruption = await interruption_detector.detect_interruption(
-                    audio_data,
-                    sample_rate=16000
-                )
-                if interruption:
-                    # Interruption will be handled by callback
-                    pass
-
         except Exception as e:
-            logger.error("Audio processing failed", client_id=client_id, error=str(e))
+            logger.error("Utterance transcription failed", client_id=client_id, error=str(e))
             await self.send_error(websocket, f"Audio processing failed: {str(e)}")
 
+    async def process_streaming_audio(
+        self,
+        websocket: WebSocket,
+        session: StreamingTranscriber,
+        audio_array: np.ndarray
+    ):
+        """
+        Feed audio to the connection's streaming transcriber
+
+        Args:
+            websocket: WebSocket connection
+            session: Streaming transcriber for this connection
+            audio_array: Normalized float32 audio
+        """
+        update = await session.insert_audio(audio_array)
+        if update is None:
+            return
+
+        if update.final_text:
+            await self.send_final_transcription(websocket, update)
+
+        await self.send_message(websocket, {
+            "type": "partial_transcription",
+            "data": {
+                "text": update.partial_text,
+                "committed_text": update.committed_text,
+                "language": update.language
+            }
+        })
+
+    async def flush_streaming_session(self, websocket: WebSocket, client_id: str):
+        """
+        Commit whatever the streaming transcriber still holds
+
+        Args:
+            websocket: WebSocket connection
+            client_id: Client identifier
+        """
+        session = self.streaming_sessions.get(client_id)
+        if session is None:
+            return
+
+        update = await session.finish()
+        if update.final_text:
+            await self.send_final_transcription(websocket, update)
+
+    async def flush_endpointer(self, websocket: WebSocket, client_id: str):
+        """
+        Close any open utterance when the client stops sending audio
+
+        Args:
+            websocket: WebSocket connection
+            client_id: Client identifier
+        """
+        endpointer = self.endpointers.get(client_id)
+        event = endpointer.flush() if endpointer is not None else None
+
+        if client_id in self.streaming_sessions:
+            await self.flush_streaming_session(websocket, client_id)
+        elif event is not None:
+            await self.process_utterance(websocket, event.audio, client_id)
+
+    async def send_final_transcription(self, websocket: WebSocket, update):
+        """
+        Send newly stable text to the client
+
+        Args:
+            websocket: WebSocket connection
+            update: StreamingUpdate with final text
+        """
+        lang_result = language_detector.detect_language(update.committed_text)
+
+        await self.send_message(websocket, {
+            "type": "final_transcription",
+            "data": {
+                "text": update.final_text,
+                "committed_text": update.committed_text,
+                "language": lang_result.detected_language.value,
+                "is_code_switching": lang_result.is_code_switching
+            }
+        })
+
+    @staticmethod
+    def _to_float(audio_data: bytes) -> np.ndarray:
+        """Convert 16-bit PCM bytes to float32 audio normalized to [-1, 1]"""
+        return np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+
+    async def _check_interruption(self, audio_data: bytes, client_id: str):
+        """Check for interruption if TTS is speaking"""
+        if interruption_detector.is_speaking:
+            interruption = await interruption_detector.detect_interruption(
+                audio_data,
+                sample_rate=16000
+            )
+            if interruption:
+                # Client is notified by callback; stop synthesizing audio nobody will hear
+                cancelled = self.cancel_tts(client_id)
+                if cancelled:
+                    logger.info("TTS cancelled on interruption", client_id=client_id, jobs=cancelled)
+
     async def process_text_message(
         self,
         websocket: WebSocket,
@@ -202,12 +359,29 @@ class VoiceWebSocketHandler:
         msg_type = data.get("type")
 
         if msg_type == "tts_request":
-            # Generate TTS
-            await self.handle_tts_request(websocket, data, client_id)
+            # Generate TTS in the background so audio (and barge-in) keeps flowing
+            self.start_tts(websocket, data, client_id)
 
         elif msg_type == "config":
             # Update configuration
-            logger.info("Configuration updated", client_id=client_id, config=data.get("data"))
+            config = data.get("data") or {}
+            if "streaming" in config:
+                if config["streaming"]:
+                    self.streaming_sessions[client_id] = StreamingTranscriber(
+                        stt_service,
+                        language=config.get("language")
+                    )
+                else:
+                    await self.flush_streaming_session(websocket, client_id)
+                    self.streaming_sessions.pop(client_id, None)
+
+            if "endpointing" in config:
+                if config["endpointing"]:
+                    self.endpointers.setdefault(client_id, UtteranceEndpointer())
+                else:
+                    self.endpointers.pop(client_id, None)
+
+            logger.info("Configuration updated", client_id=client_id, config=config)
             await self.send_message(websocket, {
                 "type": "config_ack",
                 "data": {"status": "ok"}
@@ -215,7 +389,9 @@ class VoiceWebSocketHandler:
 
         elif msg_type == "stop":
             # Stop current operation
+            self.cancel_tts(client_id)
             interruption_detector.set_speaking_state(False)
+            await self.flush_endpointer(websocket, client_id)
             await self.send_message(websocket, {
                 "type": "stop_ack",
                 "data": {"status": "stopped"}
@@ -224,6 +400,41 @@ class VoiceWebSocketHandler:
         else:
             logger.warning("Unknown message type", type=msg_type, client_id=client_id)
 
+    def start_tts(self, websocket: WebSocket, data: Dict[str, Any], client_id: str) -> asyncio.Task:
+        """
+        Run a TTS request as a cancellable task owned by the connection
+
+        Args:
+            websocket: WebSocket connection
+            data: Request data
+            client_id: Client identifier
+
+        Returns:
+            The TTS task
+        """
+        task = asyncio.create_task(self.handle_tts_request(websocket, data, client_id))
+        tasks = self.tts_tasks.setdefault(client_id, set())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        return task
+
+    def cancel_tts(self, client_id: str) -> int:
+        """
+        Cancel a connection's queued and in-flight TTS
+
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            Number of TTS tasks cancelled
+        """
+        cancelled = 0
+        for task in list(self.tts_tasks.get(client_id, ())):
+            if not task.done():
+                task.cancel()
+                cancelled += 1
+        return cancelled
+
     async def handle_tts_request(
         self,
         websocket: WebSocket,
@@ -233,6 +444,9 @@ class VoiceWebSocketHandler:
         """
         Handle TTS generation request
 
+        With "stream": true the audio is sent as PCM chunks while it is
+        being synthesized; otherwise as a single WAV frame.
+
         Args:
             websocket: WebSocket connection
             data: Request data
@@ -251,36 +465,96 @@ class VoiceWebSocketHandler:
             request = TTSRequest(
                 text=text,
                 language=LanguageCode(language),
-                voice_config=voice_config
+                voice_config=voice_config,
+                output_format=AudioFormat(data.get("output_format", AudioFormat.WAV.value)),
+                sample_rate=data.get("sample_rate")
             )
 
             # Set speaking state for interruption detection
             interruption_detector.set_speaking_state(True)
 
-            # Generate speech
-            response = await tts_service.generate_speech(request)
+            if data.get("stream"):
+                await self.stream_tts(websocket, request)
+            else:
+                # Generate speech
+                response = await tts_service.generate_speech(request)
 
-            # Send audio data
-            await websocket.send_bytes(response.audio_data)
+                # Send audio data
+                await websocket.send_bytes(response.audio_data)
 
-            # Send metadata
-            await self.send_message(websocket, {
-                "type": "tts_complete",
-                "data": {
-                    "duration": response.duration,
-                    "sample_rate": response.sample_rate,
-                    "format": response.format
-                }
-            })
+                # Send metadata
+                await self.send_message(websocket, {
+                    "type": "tts_complete",
+                    "data": {
+                        "duration": response.duration,
+                        "sample_rate": response.sample_rate,
+                        "format": response.format
+                    }
+                })
 
             # Reset speaking state
             interruption_detector.set_speaking_state(False)
 
+        except asyncio.CancelledError:
+            interruption_detector.set_speaking_state(False)
+            await self.send_message(websocket, {"type": "tts_cancelled", "data": {}})
+            raise
+
         except Exception as e:
             logger.error("TTS request failed", client_id=client_id, error=str(e))
             await self.send_error(websocket, f"TTS failed: {str(e)}")
             interruption_detector.set_speaking_state(False)
 
+    async def stream_tts(self, websocket: WebSocket, request: TTSRequest):
+        """
+        Stream synthesized speech as binary PCM frames
+
+        Sends "tts_start" with the PCM format, one binary frame per audio
+        chunk as soon as it is synthesized, then "tts_complete".
+
+        Args:
+            websocket: WebSocket connection
+            request: TTS request
+        """
+        # Containers cannot be chunked; the WAV default streams as raw PCM
+        output_format = AudioFormat.PCM if request.output_format == AudioFormat.WAV else request.output_format
+        sample_rate = output_sample_rate(output_format, request.sample_rate, tts_service.output_sample_rate)
+        stream = tts_service.generate_speech_streaming(
+            request.text,
+            request.language,
+            request.voice_config,
+            output_format=output_format,
+            sample_rate=request.sample_rate
+        )
+
+        await self.send_message(websocket, {
+            "type": "tts_start",
+            "data": {"sample_rate": sample_rate, "format": output_format.value, "channels": 1}
+        })
+
+        start_time = time.time()
+        first_audio_ms = None
+        total_samples = 0
+        chunks = 0
+
+        async for chunk in stream:
+            if first_audio_ms is None:
+                first_audio_ms = (time.time() - start_time) * 1000
+            await websocket.send_bytes(chunk)
+            total_samples += len(chunk) // (1 if output_format == AudioFormat.MULAW else 2)
+            chunks += 1
+
+        await self.send_message(websocket, {
+            "type": "tts_complete",
+            "data": {
+                "duration": total_samples / sample_rate,
+                "sample_rate": sample_rate,
+                "format": output_format.value,
+                "chunks": chunks,
+                "time_to_first_audio_ms": first_audio_ms
+            }
+        })
+
     async def send_message(self, websocket: WebSocket, message: Dict[str, Any]):
         """
         Send JSON message to client
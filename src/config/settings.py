@@ -2,7 +2,7 @@
 Configuration settings for AI Drive-Thru application
 """
 import os
-from typing import List
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -55,12 +55,43 @@ class Settings(BaseSettings):
     tts_use_gpu: bool = Field(default=False, env="TTS_USE_GPU")
     llm_n_ctx: int = Field(default=4096, env="LLM_N_CTX")
     llm_n_threads: int = Field(default=8, env="LLM_N_THREADS")
+    llm_prompt_cache_max_entries: int = Field(default=8, env="LLM_PROMPT_CACHE_MAX_ENTRIES")
+
+    # Inference Admission Control
+    stt_num_workers: int = Field(default=4, env="STT_NUM_WORKERS")
+    stt_max_concurrency: int = Field(default=8, env="STT_MAX_CONCURRENCY")
+    stt_max_queue: int = Field(default=32, env="STT_MAX_QUEUE")
+    tts_max_concurrency: int = Field(default=2, env="TTS_MAX_CONCURRENCY")
+    tts_max_queue: int = Field(default=16, env="TTS_MAX_QUEUE")
+    llm_max_queue: int = Field(default=8, env="LLM_MAX_QUEUE")
+    llm_timeout_ms: int = Field(default=1500, env="LLM_TIMEOUT_MS")
 
     # Voice Settings
     stt_latency_target: int = Field(default=500, env="STT_LATENCY_TARGET")
     tts_latency_target: int = Field(default=1000, env="TTS_LATENCY_TARGET")
     interruption_detection_ms: int = Field(default=200, env="INTERRUPTION_DETECTION_MS")
 
+    # Streaming STT Settings
+    stt_streaming_enabled: bool = Field(default=False, env="STT_STREAMING_ENABLED")
+    stt_streaming_min_chunk_ms: int = Field(default=200, env="STT_STREAMING_MIN_CHUNK_MS")
+    stt_streaming_max_window_s: float = Field(default=15.0, env="STT_STREAMING_MAX_WINDOW_S")
+    stt_streaming_beam_size: int = Field(default=1, env="STT_STREAMING_BEAM_SIZE")
+
+    # Utterance Endpointing Settings
+    stt_endpointing_enabled: bool = Field(default=True, env="STT_ENDPOINTING_ENABLED")
+    stt_vad_frame_ms: int = Field(default=30, env="STT_VAD_FRAME_MS")
+    stt_vad_aggressiveness: int = Field(default=2, env="STT_VAD_AGGRESSIVENESS")
+    stt_vad_energy_threshold: float = Field(default=0.01, env="STT_VAD_ENERGY_THRESHOLD")
+    stt_speech_start_ms: int = Field(default=90, env="STT_SPEECH_START_MS")
+    stt_speech_hangover_ms: int = Field(default=600, env="STT_SPEECH_HANGOVER_MS")
+    stt_max_utterance_ms: int = Field(default=15000, env="STT_MAX_UTTERANCE_MS")
+    stt_pre_roll_ms: int = Field(default=300, env="STT_PRE_ROLL_MS")
+
+    # STT Micro-batching Settings
+    stt_batching_enabled: bool = Field(default=True, env="STT_BATCHING_ENABLED")
+    stt_batch_max_size: int = Field(default=4, env="STT_BATCH_MAX_SIZE")
+    stt_batch_max_wait_ms: float = Field(default=15.0, env="STT_BATCH_MAX_WAIT_MS")
+
     # Language Settings
     default_language: str = Field(default="ar", env="DEFAULT_LANGUAGE")
     supported_languages: str = Field(default="ar,en", env="SUPPORTED_LANGUAGES")
@@ -103,7 +134,21 @@ class Settings(BaseSettings):
     # Feature Flags
     enable_voice_interruption: bool = Field(default=True, env="ENABLE_VOICE_INTERRUPTION")
     enable_keyword_matching: bool = Field(default=True, env="ENABLE_KEYWORD_MATCHING")
+    keyword_index_check_interval: float = Field(default=5.0, env="KEYWORD_INDEX_CHECK_INTERVAL")
     enable_tts_caching: bool = Field(default=True, env="ENABLE_TTS_CACHING")
+    tts_cache_max_bytes: int = Field(default=256 * 1024 * 1024, env="TTS_CACHE_MAX_BYTES")
+    tts_disk_cache_enabled: bool = Field(default=True, env="TTS_DISK_CACHE_ENABLED")
+    tts_disk_cache_max_bytes: int = Field(default=2 * 1024 * 1024 * 1024, env="TTS_DISK_CACHE_MAX_BYTES")
+    tts_prerender_enabled: bool = Field(default=True, env="TTS_PRERENDER_ENABLED")
+    tts_voice_presets: Dict[str, str] = Field(default={}, env="TTS_VOICE_PRESETS")
+    tts_default_voice: Optional[str] = Field(default=None, env="TTS_DEFAULT_VOICE")
+    enable_nlu_caching: bool = Field(default=True, env="ENABLE_NLU_CACHING")
+    nlu_cache_max_entries: int = Field(default=10000, env="NLU_CACHE_MAX_ENTRIES")
+    nlu_cache_ttl: int = Field(default=600, env="NLU_CACHE_TTL")
+    nlu_deadline_ms: int = Field(default=300, env="NLU_DEADLINE_MS")
+    nlu_default_threshold: float = Field(default=0.9, env="NLU_DEFAULT_THRESHOLD")
+    nlu_intent_thresholds: Dict[str, float] = Field(default={}, env="NLU_INTENT_THRESHOLDS")
+    nlu_batch_max_size: int = Field(default=1000, env="NLU_BATCH_MAX_SIZE")
     enable_hot_reload: bool = Field(default=True, env="ENABLE_HOT_RELOAD")
 
     @property
@@ -77,7 +77,10 @@ class Menu(Base):
 
     # Relationships
     branch = relationship("Branch", back_populates="menus")
-    categories = relationship("Category", back_populates="menu", cascade="all, delete-orphan")
+    categories = relationship(
+        "Category", back_populates="menu", cascade="all, delete-orphan",
+        order_by="(Category.display_order, Category.id)"
+    )
 
     # Unique constraint: one published menu per branch
     __table_args__ = (
@@ -121,7 +124,10 @@ class Category(Base):
 
     # Relationships
     menu = relationship("Menu", back_populates="categories")
-    items = relationship("Item", back_populates="category", cascade="all, delete-orphan")
+    items = relationship(
+        "Item", back_populates="category", cascade="all, delete-orphan",
+        order_by="(Item.display_order, Item.id)"
+    )
 
     def __repr__(self):
         return f"<Category(id={self.id}, name_en='{self.name_en}', name_ar='{self.name_ar}')>"
@@ -168,8 +174,8 @@ class Item(Base):
 
     # Relationships
     category = relationship("Category", back_populates="items")
-    variants = relationship("Variant", back_populates="item", cascade="all, delete-orphan")
-    addons = relationship("AddOn", back_populates="item", cascade="all, delete-orphan")
+    variants = relationship("Variant", back_populates="item", cascade="all, delete-orphan", order_by="Variant.id")
+    addons = relationship("AddOn", back_populates="item", cascade="all, delete-orphan", order_by="AddOn.id")
     keywords = relationship("Keyword", back_populates="item", cascade="all, delete-orphan")
 
     def __repr__(self):
@@ -1,6 +1,7 @@
 """Data models module"""
 from .base import (
     LanguageCode,
+    AudioFormat,
     TranscriptionResponse,
     TTSRequest,
     TTSResponse,
@@ -55,6 +56,7 @@ from .nlu import (
 __all__ = [
     # Base models
     "LanguageCode",
+    "AudioFormat",
     "TranscriptionResponse",
     "TTSRequest",
     "TTSResponse",
@@ -13,6 +13,14 @@ class LanguageCode(str, Enum):
     ENGLISH = "en"
 
 
+class AudioFormat(str, Enum):
+    """TTS output audio formats"""
+    WAV = "wav"
+    PCM = "pcm_s16le"  # Raw mono 16-bit little-endian samples
+    MULAW = "mulaw"  # G.711 μ-law, 8 kHz
+    OGG = "ogg"  # Compressed (Opus, or Vorbis where Opus is unavailable)
+
+
 class TranscriptionResponse(BaseModel):
     """STT transcription response model"""
     text: str = Field(..., description="Transcribed text")
@@ -30,6 +38,13 @@ class TTSRequest(BaseModel):
         default=None,
         description="Voice configuration (speed, tone, etc.)"
     )
+    output_format: AudioFormat = Field(default=AudioFormat.WAV, description="Output audio format")
+    sample_rate: Optional[int] = Field(
+        default=None,
+        ge=8000,
+        le=48000,
+        description="Output sample rate (resampled); defaults to the model rate"
+    )
 
 
 class TTSResponse(BaseModel):
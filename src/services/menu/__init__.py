@@ -2,6 +2,7 @@
 from .menu_service import MenuService, menu_service
 from .cache_service import MenuCacheService, menu_cache
 from .validation_service import MenuValidationService, menu_validator
+from .snapshot import MenuSnapshot, MenuSnapshotStore, menu_snapshots
 
 __all__ = [
     "MenuService",
@@ -10,4 +11,7 @@ __all__ = [
     "menu_cache",
     "MenuValidationService",
     "menu_validator",
+    "MenuSnapshot",
+    "MenuSnapshotStore",
+    "menu_snapshots",
 ]
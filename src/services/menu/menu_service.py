@@ -2,15 +2,18 @@
 Menu Service - CRUD operations for menu system
 Implements Phase 2 deliverables
 """
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from typing import Iterable, List, Optional, Union
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, func
 
 from src.database import models as db_models
 from src.models import menu as menu_models
 from src.utils import logger, log_service_event
+from src.services.nlu.result_cache import nlu_result_cache
+from src.services.nlu.keyword_service import keyword_service
 from .cache_service import menu_cache
 from .validation_service import menu_validator
+from .snapshot import AddOnNode, CategoryNode, ItemNode, VariantNode, menu_snapshots
 
 
 class MenuService:
@@ -50,17 +53,38 @@ class MenuService:
         return db_menu
 
     def get_menu(self, db: Session, menu_id: int) -> Optional[db_models.Menu]:
-        """Get menu by ID with caching"""
-        # Check cache
-        cached = menu_cache.get("full", menu_id)
-        if cached:
-            return cached
-
-        menu = db.query(db_models.Menu).filter(db_models.Menu.id == menu_id).first()
-        if menu:
-            # Cache result
-            menu_cache.set("full", menu_id, menu.__dict__)
-        return menu
+        """Get menu by ID"""
+        return db.query(db_models.Menu).filter(db_models.Menu.id == menu_id).first()
+
+    def get_full_menu_json(self, db: Session, menu_id: int) -> Optional[bytes]:
+        """
+        Get the whole menu tree serialized as FullMenuResponse
+
+        Published menus are served from the menu snapshot, which is
+        serialized once per version (every publish and edit bumps the
+        version). Drafts are loaded and serialized per request.
+
+        Args:
+            db: Database session
+            menu_id: Menu ID
+
+        Returns:
+            JSON body, or None if the menu does not exist
+        """
+        snapshot = menu_snapshots.get(db, menu_id, published_only=True)
+        if snapshot is not None:
+            return snapshot.payload
+
+        items = selectinload(db_models.Menu.categories).selectinload(db_models.Category.items)
+        menu = db.query(db_models.Menu).options(
+            items.selectinload(db_models.Item.variants),
+            items.selectinload(db_models.Item.addons)
+        ).filter(db_models.Menu.id == menu_id).first()
+        if menu is None:
+            return None
+        return menu_models.FullMenuResponse.model_validate(
+            menu, from_attributes=True
+        ).model_dump_json().encode("utf-8")
 
     def publish_menu(self, db: Session, menu_id: int) -> db_models.Menu:
         """Publish menu (unpublishes other menus for branch)"""
@@ -81,13 +105,17 @@ class MenuService:
             )
         ).update({"published": False})
 
-        # Publish this menu
+        # Publish this menu under a new version so readers get a new snapshot
         menu.published = True
+        menu.version = (menu.version or 0) + 1
         db.commit()
         db.refresh(menu)
 
-        # Clear cache
+        # Clear cache and build the new snapshot before traffic needs it
         menu_cache.clear_pattern(f"branch_{menu.branch_id}")
+        menu_snapshots.get(db, menu_id)
+        keyword_service.invalidate_index(menu.branch_id)
+        nlu_result_cache.invalidate_branch(menu.branch_id)
 
         log_service_event("menu", "menu_published", f"Menu {menu_id} published")
         return menu
@@ -98,16 +126,19 @@ class MenuService:
         """Create category"""
         db_category = db_models.Category(**category.dict())
         db.add(db_category)
+        self._bump_versions(db, [category.menu_id])
         db.commit()
         db.refresh(db_category)
-        menu_cache.delete("full", category.menu_id)
         return db_category
 
-    def get_categories(self, db: Session, menu_id: int) -> List[db_models.Category]:
-        """Get categories for menu"""
+    def get_categories(self, db: Session, menu_id: int) -> List[Union[CategoryNode, db_models.Category]]:
+        """Get categories for menu (from the menu snapshot once published)"""
+        snapshot = menu_snapshots.get(db, menu_id, published_only=True)
+        if snapshot is not None:
+            return list(snapshot.categories)
         return db.query(db_models.Category).filter(
             db_models.Category.menu_id == menu_id
-        ).order_by(db_models.Category.display_order).all()
+        ).order_by(db_models.Category.display_order, db_models.Category.id).all()
 
     # ============== ITEM OPERATIONS ==============
 
@@ -115,19 +146,31 @@ class MenuService:
         """Create item"""
         db_item = db_models.Item(**item.dict())
         db.add(db_item)
+        self._bump_versions(db, self._menu_ids(db, category_ids=[item.category_id]))
         db.commit()
         db.refresh(db_item)
         return db_item
 
     def get_item(self, db: Session, item_id: int) -> Optional[db_models.Item]:
-        """Get item by ID"""
+        """Get item by ID (ORM object, for updates)"""
         return db.query(db_models.Item).filter(db_models.Item.id == item_id).first()
 
-    def get_items(self, db: Session, category_id: int) -> List[db_models.Item]:
-        """Get items for category"""
+    def get_item_node(self, db: Session, item_id: int) -> Optional[Union[ItemNode, db_models.Item]]:
+        """Get item by ID with its variants and add-ons (from the menu snapshot once published)"""
+        snapshot = menu_snapshots.get_owning(db, item_id=item_id, published_only=True)
+        if snapshot is not None:
+            return snapshot.items.get(item_id)
+        return self.get_item(db, item_id)
+
+    def get_items(self, db: Session, category_id: int) -> List[Union[ItemNode, db_models.Item]]:
+        """Get items for category (from the menu snapshot once published)"""
+        snapshot = menu_snapshots.get_owning(db, category_id=category_id, published_only=True)
+        if snapshot is not None:
+            category = snapshot.categories_by_id.get(category_id)
+            return list(category.items) if category is not None else []
         return db.query(db_models.Item).filter(
             db_models.Item.category_id == category_id
-        ).order_by(db_models.Item.display_order).all()
+        ).order_by(db_models.Item.display_order, db_models.Item.id).all()
 
     def update_item(self, db: Session, item_id: int, item_update: menu_models.ItemUpdate) -> db_models.Item:
         """Update item"""
@@ -135,12 +178,21 @@ class MenuService:
         if not db_item:
             raise ValueError(f"Item {item_id} not found")
 
+        # Moving an item changes both the old and the new category's menu
+        category_ids = {db_item.category_id}
         update_data = item_update.dict(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_item, field, value)
+        category_ids.add(db_item.category_id)
 
+        self._bump_versions(db, self._menu_ids(db, category_ids=category_ids))
         db.commit()
         db.refresh(db_item)
+
+        # Keyword indexes carry denormalized item names
+        for branch_id in keyword_service.update_item_names(db_item.id, db_item.name_ar, db_item.name_en):
+            nlu_result_cache.invalidate_branch(branch_id)
+
         return db_item
 
     # ============== VARIANT OPERATIONS ==============
@@ -149,13 +201,15 @@ class MenuService:
         """Create variant"""
         db_variant = db_models.Variant(**variant.dict())
         db.add(db_variant)
+        self._bump_versions(db, self._menu_ids(db, item_ids=[variant.item_id]))
         db.commit()
         db.refresh(db_variant)
         return db_variant
 
-    def get_variants(self, db: Session, item_id: int) -> List[db_models.Variant]:
-        """Get variants for item"""
-        return db.query(db_models.Variant).filter(db_models.Variant.item_id == item_id).all()
+    def get_variants(self, db: Session, item_id: int) -> List[Union[VariantNode, db_models.Variant]]:
+        """Get variants for item (from the menu snapshot once published)"""
+        item = self.get_item_node(db, item_id)
+        return list(item.variants) if item is not None else []
 
     # ============== ADDON OPERATIONS ==============
 
@@ -163,13 +217,57 @@ class MenuService:
         """Create add-on"""
         db_addon = db_models.AddOn(**addon.dict())
         db.add(db_addon)
+        if db_addon.item_id is None:
+            self._bump_versions(db, None)  # Global add-ons appear in every menu
+        else:
+            self._bump_versions(db, self._menu_ids(db, item_ids=[db_addon.item_id]))
         db.commit()
         db.refresh(db_addon)
         return db_addon
 
-    def get_addons(self, db: Session, item_id: int) -> List[db_models.AddOn]:
-        """Get add-ons for item"""
-        return db.query(db_models.AddOn).filter(db_models.AddOn.item_id == item_id).all()
+    def get_addons(self, db: Session, item_id: int) -> List[Union[AddOnNode, db_models.AddOn]]:
+        """Get the item's own add-ons (from the menu snapshot once published)"""
+        item = self.get_item_node(db, item_id)
+        return list(item.addons) if item is not None else []
+
+    # ============== VERSIONING ==============
+
+    def _menu_ids(
+        self,
+        db: Session,
+        category_ids: Iterable[int] = (),
+        item_ids: Iterable[int] = ()
+    ) -> List[int]:
+        """IDs of the menus owning some categories or items"""
+        query = db.query(db_models.Category.menu_id).distinct()
+        if item_ids:
+            query = query.join(db_models.Item).filter(db_models.Item.id.in_(list(item_ids)))
+        else:
+            query = query.filter(db_models.Category.id.in_(list(category_ids)))
+        return [menu_id for menu_id, in query.all()]
+
+    def _bump_versions(self, db: Session, menu_ids: Optional[Iterable[int]]) -> None:
+        """
+        Bump menu versions as part of the caller's uncommitted edit
+
+        Snapshots and cached responses are keyed by (menu_id, version) and
+        every worker checks the version in the database, so committing the
+        edit and the new version together invalidates them everywhere.
+
+        Args:
+            db: Database session
+            menu_ids: Menus to bump, or None for every menu
+        """
+        query = db.query(db_models.Menu)
+        if menu_ids is not None:
+            menu_ids = list(menu_ids)
+            if not menu_ids:
+                return
+            query = query.filter(db_models.Menu.id.in_(menu_ids))
+        query.update(
+            {db_models.Menu.version: func.coalesce(db_models.Menu.version, 0) + 1},
+            synchronize_session=False
+        )
 
 
 # Global service instance
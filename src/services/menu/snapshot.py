@@ -0,0 +1,335 @@
+"""
+Menu Snapshot
+Immutable in-process copy of a whole menu tree, built once per
+(menu_id, version) so published menu reads never touch the ORM
+"""
+import time
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from src.database import models as db_models
+from src.models import menu as menu_models
+from src.utils import logger, log_performance_metric
+
+SnapshotKey = Tuple[int, int]  # (menu_id, version)
+
+
+def _table_columns(model: Any) -> Tuple[str, ...]:
+    """Column attribute names of a model, in table order"""
+    return tuple(column.key for column in model.__table__.columns)
+
+
+class _Node:
+    """
+    Frozen record with __slots__; nested nodes are held in tuples
+
+    Slots mirror the model's columns and relationship names, so API
+    response models validate from nodes exactly as from ORM objects.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **values: Any):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}(id={getattr(self, 'id', None)})>"
+
+
+class VariantNode(_Node):
+    """Item variant (e.g. size)"""
+
+    __slots__ = _table_columns(db_models.Variant)
+
+
+class AddOnNode(_Node):
+    """Item add-on; item_id is None for global add-ons"""
+
+    __slots__ = _table_columns(db_models.AddOn)
+
+
+class ItemNode(_Node):
+    """Menu item with its variants and add-ons"""
+
+    __slots__ = _table_columns(db_models.Item) + ("variants", "addons")
+
+
+class CategoryNode(_Node):
+    """Menu category with its items"""
+
+    __slots__ = _table_columns(db_models.Category) + ("items",)
+
+
+class MenuSnapshot(_Node):
+    """
+    Whole menu tree at one version
+
+    Nodes are immutable and shared between readers. `items`, `variants`,
+    `addons` and `categories_by_id` are read-only id lookup tables over the
+    same nodes; `payload` is the tree serialized as FullMenuResponse.
+    """
+
+    __slots__ = _table_columns(db_models.Menu) + (
+        "branch_code", "categories", "global_addons",
+        "categories_by_id", "items", "variants", "addons", "payload",
+    )
+
+    @property
+    def menu_id(self) -> int:
+        return self.id
+
+    @property
+    def key(self) -> SnapshotKey:
+        """Cache key"""
+        return (self.id, self.version)
+
+
+def _columns(model: Any, node_class: type, children: Tuple[str, ...] = ()) -> list:
+    """Columns backing a node's slots (rows are loaded as tuples, not ORM objects)"""
+    return [getattr(model, name) for name in node_class.__slots__ if name not in children]
+
+
+def build_menu_snapshot(db: Session, menu_id: int) -> Optional[MenuSnapshot]:
+    """
+    Load a menu tree in a fixed number of queries and freeze it
+
+    Args:
+        db: Database session
+        menu_id: Menu ID
+
+    Returns:
+        Snapshot at the menu's current version, or None if the menu does not exist
+    """
+    menu = db.query(
+        *[getattr(db_models.Menu, name) for name in _table_columns(db_models.Menu)],
+        db_models.Branch.code.label("branch_code")
+    ).join(
+        db_models.Branch, db_models.Branch.id == db_models.Menu.branch_id
+    ).filter(db_models.Menu.id == menu_id).first()
+    if menu is None:
+        return None
+
+    categories = db.query(*_columns(db_models.Category, CategoryNode, ("items",))).filter(
+        db_models.Category.menu_id == menu_id
+    ).order_by(db_models.Category.display_order, db_models.Category.id).all()
+
+    items = db.query(*_columns(db_models.Item, ItemNode, ("variants", "addons"))).join(
+        db_models.Category
+    ).filter(
+        db_models.Category.menu_id == menu_id
+    ).order_by(db_models.Item.display_order, db_models.Item.id).all()
+
+    variants = db.query(*_columns(db_models.Variant, VariantNode)).join(
+        db_models.Item
+    ).join(db_models.Category).filter(
+        db_models.Category.menu_id == menu_id
+    ).order_by(db_models.Variant.id).all()
+
+    # Add-ons without an item are global and apply to every menu
+    addons = db.query(*_columns(db_models.AddOn, AddOnNode)).outerjoin(
+        db_models.Item
+    ).outerjoin(db_models.Category).filter(
+        or_(db_models.Category.menu_id == menu_id, db_models.AddOn.item_id.is_(None))
+    ).order_by(db_models.AddOn.id).all()
+
+    variant_nodes = [VariantNode(**row._asdict()) for row in variants]
+    addon_nodes = [AddOnNode(**row._asdict()) for row in addons]
+
+    variants_by_item: Dict[int, list] = {}
+    for node in variant_nodes:
+        variants_by_item.setdefault(node.item_id, []).append(node)
+    addons_by_item: Dict[Optional[int], list] = {}
+    for node in addon_nodes:
+        addons_by_item.setdefault(node.item_id, []).append(node)
+
+    item_nodes = []
+    for row in items:
+        values = row._asdict()
+        values["tags"] = tuple(values["tags"] or ())
+        item_nodes.append(ItemNode(
+            variants=tuple(variants_by_item.get(row.id, ())),
+            addons=tuple(addons_by_item.get(row.id, ())),
+            **values
+        ))
+    items_by_category: Dict[int, list] = {}
+    for node in item_nodes:
+        items_by_category.setdefault(node.category_id, []).append(node)
+
+    category_nodes = tuple(
+        CategoryNode(items=tuple(items_by_category.get(row.id, ())), **row._asdict())
+        for row in categories
+    )
+
+    snapshot = MenuSnapshot(
+        categories=category_nodes,
+        global_addons=tuple(addons_by_item.get(None, ())),
+        categories_by_id=MappingProxyType({node.id: node for node in category_nodes}),
+        items=MappingProxyType({node.id: node for node in item_nodes}),
+        variants=MappingProxyType({node.id: node for node in variant_nodes}),
+        addons=MappingProxyType({node.id: node for node in addon_nodes}),
+        payload=None,
+        **menu._asdict()
+    )
+    # Serialized once, while the snapshot is still private to this function
+    object.__setattr__(snapshot, "payload", menu_models.FullMenuResponse.model_validate(
+        snapshot, from_attributes=True
+    ).model_dump_json().encode("utf-8"))
+    return snapshot
+
+
+class MenuSnapshotStore:
+    """
+    Menu snapshots keyed by (menu_id, version)
+
+    - Publishing and every edit through MenuService bump the version in
+      the same transaction, so the version check on each read sees changes
+      made by any worker and readers holding the old snapshot keep a
+      consistent tree
+    - Only the latest version of each menu is kept
+    - Builds are serialized per menu, so one large build never blocks
+      readers of other menus
+    - Readers pass `published_only`: drafts change on every edit, and
+      rebuilding the whole tree after each one would make building a draft
+      quadratic, so draft reads go to the database instead
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[SnapshotKey, MenuSnapshot] = {}
+        self._build_locks: Dict[int, threading.Lock] = {}
+        self._lock = threading.Lock()  # Guards the two dicts above
+
+        self.hits = 0
+        self.builds = 0
+
+    def get(self, db: Session, menu_id: int, published_only: bool = False) -> Optional[MenuSnapshot]:
+        """
+        Get the snapshot of a menu at its current version, building it if needed
+
+        Args:
+            db: Database session
+            menu_id: Menu ID
+            published_only: Return None instead of snapshotting a draft menu
+
+        Returns:
+            Menu snapshot, or None if the menu does not exist (or is a draft
+            and `published_only` is set)
+        """
+        row = db.query(db_models.Menu.version, db_models.Menu.published).filter(
+            db_models.Menu.id == menu_id
+        ).first()
+        if row is None or (published_only and not row[1]):
+            return None
+        return self._get_or_build(db, menu_id, row[0])
+
+    def get_owning(
+        self,
+        db: Session,
+        category_id: Optional[int] = None,
+        item_id: Optional[int] = None,
+        published_only: bool = False
+    ) -> Optional[MenuSnapshot]:
+        """
+        Get the snapshot of the menu owning a category or an item
+
+        The owning menu and its version are read in one query.
+
+        Args:
+            db: Database session
+            category_id: Category ID
+            item_id: Item ID (takes precedence)
+            published_only: Return None instead of snapshotting a draft menu
+
+        Returns:
+            Menu snapshot, or None if the category or item does not exist (or
+            belongs to a draft and `published_only` is set)
+        """
+        query = db.query(
+            db_models.Menu.id, db_models.Menu.version, db_models.Menu.published
+        ).join(db_models.Category)
+        if item_id is not None:
+            query = query.join(db_models.Item).filter(db_models.Item.id == item_id)
+        else:
+            query = query.filter(db_models.Category.id == category_id)
+        row = query.first()
+        if row is None or (published_only and not row[2]):
+            return None
+        return self._get_or_build(db, row[0], row[1])
+
+    def invalidate(self, menu_id: Optional[int] = None) -> None:
+        """
+        Drop cached snapshots (versions already make them unreachable after
+        an edit; this only frees memory)
+
+        Args:
+            menu_id: Menu to drop, or None for all menus
+        """
+        with self._lock:
+            for key in list(self._snapshots):
+                if menu_id is None or key[0] == menu_id:
+                    del self._snapshots[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get snapshot statistics
+
+        Returns:
+            Cached snapshots and hit/build counters
+        """
+        return {
+            "snapshots": [
+                {"menu_id": menu_id, "version": version, "bytes": len(snapshot.payload)}
+                for (menu_id, version), snapshot in list(self._snapshots.items())
+            ],
+            "hits": self.hits,
+            "builds": self.builds,
+        }
+
+    def _get_or_build(self, db: Session, menu_id: int, version: int) -> Optional[MenuSnapshot]:
+        snapshot = self._snapshots.get((menu_id, version))
+        if snapshot is not None:
+            self.hits += 1
+            return snapshot
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(menu_id, threading.Lock())
+
+        with build_lock:
+            snapshot = self._snapshots.get((menu_id, version))
+            if snapshot is not None:
+                self.hits += 1
+                return snapshot
+
+            start_time = time.time()
+            snapshot = build_menu_snapshot(db, menu_id)
+            if snapshot is None:
+                return None
+            with self._lock:
+                for key in [key for key in self._snapshots if key[0] == menu_id]:
+                    del self._snapshots[key]
+                self._snapshots[snapshot.key] = snapshot
+            self.builds += 1
+
+        log_performance_metric("menu", "snapshot_build", (time.time() - start_time) * 1000, unit="ms")
+        logger.info(
+            "Menu snapshot built",
+            menu_id=menu_id,
+            version=snapshot.version,
+            items=len(snapshot.items),
+            bytes=len(snapshot.payload)
+        )
+        return snapshot
+
+
+# Global snapshot store (shared by the menu read API and TTS pre-render)
+menu_snapshots = MenuSnapshotStore()
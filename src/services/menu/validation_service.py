@@ -2,7 +2,8 @@
 Menu Validation Service
 Implements MENU-005 requirement from Build Phase Plan
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from sqlalchemy import and_, case, func, or_
 from sqlalchemy.orm import Session
 
 from src.database import models as db_models
@@ -25,6 +26,10 @@ class MenuValidationService:
         """
         Validate complete menu structure
 
+        Runs a fixed number of bulk queries (aggregates for variant
+        defaults, filtered rows for add-on problems) and checks the
+        results in memory, so the query count does not grow with the menu.
+
         Args:
             db: Database session
             menu_id: Menu ID to validate
@@ -51,47 +56,52 @@ class MenuValidationService:
             )
 
         # Validate categories
-        categories = db.query(db_models.Category).filter(
+        categories = db.query(
+            db_models.Category.id,
+            db_models.Category.name_ar,
+            db_models.Category.name_en
+        ).filter(
             db_models.Category.menu_id == menu_id
-        ).all()
+        ).order_by(db_models.Category.id).all()
 
         if not categories:
             warnings.append("Menu has no categories")
 
         stats["categories"] = len(categories)
 
-        for category in categories:
+        items_by_category = self._load_items(db, menu_id)
+        variant_groups = self._load_variant_groups(db, menu_id)
+        addon_problems = self._load_addon_problems(db, menu_id)
+
+        for category_id, name_ar, name_en in categories:
             # Validate category names
-            if not category.name_ar or not category.name_en:
+            if not name_ar or not name_en:
                 errors.append(
-                    f"Category {category.id} missing Arabic or English name"
+                    f"Category {category_id} missing Arabic or English name"
                 )
 
-            # Validate items in category
-            items = db.query(db_models.Item).filter(
-                db_models.Item.category_id == category.id
-            ).all()
-
+            items = items_by_category.get(category_id, [])
             if not items:
-                warnings.append(f"Category '{category.name_en}' has no items")
+                warnings.append(f"Category '{name_en}' has no items")
 
             stats["items"] += len(items)
 
             for item in items:
-                # Validate item
-                item_errors = self._validate_item(db, item)
-                errors.extend(item_errors)
-
-                # Count variants and add-ons
-                variants = db.query(db_models.Variant).filter(
-                    db_models.Variant.item_id == item.id
-                ).count()
-                addons = db.query(db_models.AddOn).filter(
-                    db_models.AddOn.item_id == item.id
-                ).count()
-
-                stats["variants"] += variants
-                stats["addons"] += addons
+                errors.extend(self._item_errors(
+                    item,
+                    variant_groups.get(item.id, []),
+                    addon_problems.get(item.id, [])
+                ))
+
+        # Count variants and add-ons
+        stats["variants"] = sum(
+            count for groups in variant_groups.values() for _, count, _ in groups
+        )
+        stats["addons"] = db.query(func.count(db_models.AddOn.id)).join(
+            db_models.Item, db_models.Item.id == db_models.AddOn.item_id
+        ).join(db_models.Category).filter(
+            db_models.Category.menu_id == menu_id
+        ).scalar()
 
         # Check for published menu conflicts
         if menu.published:
@@ -123,17 +133,89 @@ class MenuValidationService:
             stats=stats
         )
 
-    def _validate_item(
+    def _load_items(self, db: Session, menu_id: int) -> Dict[int, List[Any]]:
+        """Items of a menu grouped by category, in ID order"""
+        rows = db.query(
+            db_models.Item.id,
+            db_models.Item.category_id,
+            db_models.Item.name_ar,
+            db_models.Item.name_en,
+            db_models.Item.base_price
+        ).join(db_models.Category).filter(
+            db_models.Category.menu_id == menu_id
+        ).order_by(db_models.Item.id).all()
+
+        items: Dict[int, List[Any]] = {}
+        for row in rows:
+            items.setdefault(row.category_id, []).append(row)
+        return items
+
+    def _load_variant_groups(self, db: Session, menu_id: int) -> Dict[int, List[Tuple[str, int, int]]]:
+        """
+        Variant counts per item and variant type
+
+        Returns:
+            Item ID -> [(variant type, variants, defaults)] ordered by type
+        """
+        defaults = func.sum(case((db_models.Variant.is_default == True, 1), else_=0))
+        rows = db.query(
+            db_models.Variant.item_id,
+            db_models.Variant.variant_type,
+            func.count(db_models.Variant.id),
+            defaults
+        ).join(db_models.Item).join(db_models.Category).filter(
+            db_models.Category.menu_id == menu_id
+        ).group_by(
+            db_models.Variant.item_id, db_models.Variant.variant_type
+        ).order_by(db_models.Variant.item_id, db_models.Variant.variant_type).all()
+
+        groups: Dict[int, List[Tuple[str, int, int]]] = {}
+        for item_id, variant_type, count, default_count in rows:
+            groups.setdefault(item_id, []).append((variant_type, count, default_count or 0))
+        return groups
+
+    def _load_addon_problems(self, db: Session, menu_id: int) -> Dict[int, List[Any]]:
+        """Add-ons of a menu with a negative price or incomplete condition, in ID order"""
+        AddOn = db_models.AddOn
+        incomplete_condition = and_(
+            AddOn.is_conditional == True,
+            or_(
+                AddOn.condition_variant_type.is_(None),
+                AddOn.condition_variant_type == "",
+                AddOn.condition_variant_value.is_(None),
+                AddOn.condition_variant_value == ""
+            )
+        )
+        rows = db.query(
+            AddOn.item_id,
+            AddOn.name_en,
+            AddOn.price,
+            AddOn.is_conditional,
+            AddOn.condition_variant_type,
+            AddOn.condition_variant_value
+        ).join(db_models.Item, db_models.Item.id == AddOn.item_id).join(db_models.Category).filter(
+            db_models.Category.menu_id == menu_id,
+            or_(AddOn.price < 0, incomplete_condition)
+        ).order_by(AddOn.id).all()
+
+        problems: Dict[int, List[Any]] = {}
+        for row in rows:
+            problems.setdefault(row.item_id, []).append(row)
+        return problems
+
+    def _item_errors(
         self,
-        db: Session,
-        item: db_models.Item
+        item: Any,
+        variant_groups: List[Tuple[str, int, int]],
+        addon_problems: List[Any]
     ) -> List[str]:
         """
         Validate individual item
 
         Args:
-            db: Database session
-            item: Item to validate
+            item: Item row
+            variant_groups: (variant type, variants, defaults) for the item
+            addon_problems: Item add-ons with a negative price or incomplete condition
 
         Returns:
             List of error messages
@@ -151,20 +233,8 @@ class MenuValidationService:
         if item.base_price == 0:
             errors.append(f"Item '{item.name_en}' has zero price (may be intentional)")
 
-        # Validate variants
-        variants = db.query(db_models.Variant).filter(
-            db_models.Variant.item_id == item.id
-        ).all()
-
         # Check for default variant per type
-        variant_types = {}
-        for variant in variants:
-            if variant.variant_type not in variant_types:
-                variant_types[variant.variant_type] = []
-            variant_types[variant.variant_type].append(variant)
-
-        for v_type, v_list in variant_types.items():
-            default_count = sum(1 for v in v_list if v.is_default)
+        for v_type, _, default_count in variant_groups:
             if default_count == 0:
                 errors.append(
                     f"Item '{item.name_en}' has no default {v_type} variant"
@@ -175,11 +245,7 @@ class MenuValidationService:
                 )
 
         # Validate add-ons
-        addons = db.query(db_models.AddOn).filter(
-            db_models.AddOn.item_id == item.id
-        ).all()
-
-        for addon in addons:
+        for addon in addon_problems:
             if addon.price < 0:
                 errors.append(
                     f"Add-on '{addon.name_en}' for item '{item.name_en}' has negative price"
@@ -1,10 +1,24 @@
 """NLU service module"""
 from .nlu_service import NLUService, nlu_service
 from .keyword_service import KeywordMatchingService, keyword_service
+from .phrase_matcher import PhraseMatcher, PhraseMatch
+from .result_cache import NLUResultCache, nlu_result_cache
+from .cascade import NLUTrace, TierResult
+from .keyword_index import BranchKeyword, BranchKeywordIndex
+from .fuzzy_index import TrigramIndex
 
 __all__ = [
     "NLUService",
     "nlu_service",
     "KeywordMatchingService",
     "keyword_service",
+    "PhraseMatcher",
+    "PhraseMatch",
+    "NLUResultCache",
+    "nlu_result_cache",
+    "NLUTrace",
+    "TierResult",
+    "BranchKeyword",
+    "BranchKeywordIndex",
+    "TrigramIndex",
 ]
@@ -0,0 +1,113 @@
+"""
+Tiered NLU cascade bookkeeping
+Records which tiers (cache, rules, keywords, LLM) handled a request and
+how long each took
+"""
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from src.models.nlu import Intent
+
+TIER_CACHE = "cache"
+TIER_RULES = "rules"
+TIER_KEYWORDS = "keywords"
+TIER_LLM = "llm"
+
+
+@dataclass
+class TierResult:
+    """Outcome of one cascade tier"""
+    tier: str
+    intent: Intent
+    latency_ms: float
+    accepted: bool
+
+
+@dataclass
+class NLUTrace:
+    """Tiers consulted for one request, in order"""
+    tiers: List[TierResult] = field(default_factory=list)
+    degraded: bool = False  # A lower-tier answer was used because the LLM was late or unavailable
+    deadline_ms: Optional[int] = None
+    deadline_missed: bool = False
+    resolved_by: Optional[str] = None  # Set when the answer is not from the last tier consulted
+
+    def add(self, tier: str, intent: Intent, latency_ms: float, accepted: bool) -> None:
+        """Record a tier outcome"""
+        self.tiers.append(TierResult(tier, intent, latency_ms, accepted))
+
+    @property
+    def final_tier(self) -> Optional[str]:
+        """Tier whose answer was used (by default the last one consulted)"""
+        if self.resolved_by:
+            return self.resolved_by
+        return self.tiers[-1].tier if self.tiers else None
+
+    def server_timing(self) -> str:
+        """Per-tier latency as a Server-Timing header value"""
+        return ", ".join(f"{result.tier};dur={result.latency_ms:.2f}" for result in self.tiers)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable summary"""
+        return {
+            "final_tier": self.final_tier,
+            "degraded": self.degraded,
+            "deadline_ms": self.deadline_ms,
+            "deadline_missed": self.deadline_missed,
+            "tiers": [
+                {
+                    "tier": result.tier,
+                    "intent": result.intent.intent_type.value,
+                    "confidence": result.intent.confidence,
+                    "latency_ms": result.latency_ms,
+                    "accepted": result.accepted,
+                }
+                for result in self.tiers
+            ],
+        }
+
+
+class TierStats:
+    """Aggregate routing counters across requests"""
+
+    def __init__(self):
+        self.resolved: Counter = Counter()  # Requests answered by each tier
+        self.consulted: Counter = Counter()  # Requests that reached each tier
+        self.latency_ms: Counter = Counter()
+        self.degraded = 0
+        self.deadline_missed = 0
+
+    def record(self, trace: NLUTrace) -> None:
+        """Add one request's trace"""
+        for result in trace.tiers:
+            self.consulted[result.tier] += 1
+            self.latency_ms[result.tier] += result.latency_ms
+        if trace.final_tier:
+            self.resolved[trace.final_tier] += 1
+        if trace.degraded:
+            self.degraded += 1
+        if trace.deadline_missed:
+            self.deadline_missed += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get routing statistics
+
+        Returns:
+            Per-tier resolution share and average latency
+        """
+        total = sum(self.resolved.values())
+        return {
+            "requests": total,
+            "resolved": dict(self.resolved),
+            "resolved_share": {
+                tier: count / total for tier, count in self.resolved.items()
+            } if total else {},
+            "avg_latency_ms": {
+                tier: self.latency_ms[tier] / count
+                for tier, count in self.consulted.items() if count
+            },
+            "degraded": self.degraded,
+            "deadline_missed": self.deadline_missed,
+        }
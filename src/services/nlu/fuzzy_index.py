@@ -0,0 +1,163 @@
+"""
+Fuzzy String Index
+Character-trigram candidate generation with a bounded edit-distance check,
+for matching mispronounced or misrecognized keywords
+"""
+from collections import Counter
+from itertools import chain
+from typing import Dict, FrozenSet, List, Tuple
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """
+    Distinct character trigrams of a padded string
+
+    Args:
+        text: Normalized string
+
+    Returns:
+        Set of trigrams
+    """
+    padded = f" {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def char_masks(text: str) -> Dict[str, int]:
+    """
+    Bit mask of the positions of each character, for lcs_length()
+
+    Args:
+        text: String
+
+    Returns:
+        Character -> bit mask
+    """
+    masks: Dict[str, int] = {}
+    for position, char in enumerate(text):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def lcs_length(masks: Dict[str, int], length: int, other: str) -> int:
+    """
+    Longest common subsequence length, bit-parallel
+
+    Processes one character of `other` per step using integer operations
+    over all positions of the first string at once (Allison-Dix), so the
+    cost is O(len(other)) big-int operations instead of a full DP table.
+
+    Args:
+        masks: char_masks() of the first string
+        length: Length of the first string
+        other: Second string
+
+    Returns:
+        LCS length
+    """
+    full = (1 << length) - 1
+    row = full
+    for char in other:
+        matches = row & masks.get(char, 0)
+        row = ((row + matches) | (row - matches)) & full
+    return length - bin(row).count("1")
+
+
+def similarity(a: str, b: str) -> float:
+    """
+    Similarity in [0, 1] as 1 - indel distance / total length
+
+    Equal to 2 * LCS / (len(a) + len(b)), the ratio difflib.SequenceMatcher
+    approximates.
+    """
+    total = len(a) + len(b)
+    if not total:
+        return 1.0
+    return 2.0 * lcs_length(char_masks(a), len(a), b) / total
+
+
+class TrigramIndex:
+    """
+    Strings indexed by character trigram for thresholded fuzzy search
+
+    A string within indel distance k of the query keeps all but at most
+    3k of its distinct trigrams, and their lengths differ by at most k.
+    Postings are split by string length so only lengths that can reach
+    the threshold are counted, and candidates sharing too few trigrams are
+    rejected before any distance is computed. When the bound requires no
+    shared trigram at all (short strings or low thresholds), every string
+    of that length is checked instead, so search() is always exact.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._strings: List[str] = []
+        self._postings: Dict[str, Dict[int, List[int]]] = {}
+        self._by_length: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._ids
+
+    def add(self, text: str) -> None:
+        """
+        Index a string (no-op if already indexed)
+
+        Args:
+            text: Normalized string
+        """
+        if text in self._ids:
+            return
+        string_id = len(self._strings)
+        self._ids[text] = string_id
+        self._strings.append(text)
+        self._by_length.setdefault(len(text), []).append(string_id)
+        for gram in trigrams(text):
+            self._postings.setdefault(gram, {}).setdefault(len(text), []).append(string_id)
+
+    def search(self, query: str, threshold: float) -> List[Tuple[str, float]]:
+        """
+        Find indexed strings similar to a query
+
+        Args:
+            query: Normalized query string
+            threshold: Minimum similarity in (0, 1] (see similarity())
+
+        Returns:
+            (string, similarity) pairs at or above the threshold
+        """
+        slack = 1.0 - threshold
+        query_len = len(query)
+        grams = trigrams(query)
+        masks = char_masks(query)
+        query_postings = [self._postings[gram] for gram in grams if gram in self._postings]
+
+        results = []
+        # Candidate lengths L satisfy |L - query_len| <= slack * (query_len + L)
+        min_len = int(query_len * threshold / (1.0 + slack))
+        max_len = int(query_len * (1.0 + slack) / threshold + 1e-9)
+        for length in range(min_len, max_len + 1):
+            total = query_len + length
+            max_distance = int(slack * total + 1e-9)
+            if abs(length - query_len) > max_distance:
+                continue
+            needed = len(grams) - 3 * max_distance
+            if needed > 0:
+                shared = Counter(chain.from_iterable(
+                    postings[length] for postings in query_postings if length in postings
+                ))
+                candidates = []
+                for string_id, count in shared.most_common():
+                    if count < needed:
+                        break
+                    candidates.append(string_id)
+            else:
+                # A match may share no trigram with the query
+                candidates = self._by_length.get(length, [])
+            for string_id in candidates:
+                candidate = self._strings[string_id]
+                distance = total - 2 * lcs_length(masks, query_len, candidate)
+                if distance <= max_distance:
+                    results.append((candidate, 1.0 - distance / total))
+        return results
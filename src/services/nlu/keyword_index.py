@@ -0,0 +1,230 @@
+"""
+Per-branch keyword index
+Branch keywords with denormalized item names, held in memory so keyword
+matching needs no database access
+"""
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.services.nlu.fuzzy_index import TrigramIndex, similarity
+from src.services.nlu.result_cache import normalize_utterance
+
+# Definite article and attached prepositions; stripped on both sides so
+# "البرجر" matches the keyword "برجر"
+_ARABIC_ARTICLES = ("وال", "بال", "فال", "كال", "لل", "ال")
+
+LANGUAGES = ("ar", "en")
+
+
+@dataclass(frozen=True)
+class BranchKeyword:
+    """A branch keyword joined with the item it points to"""
+    keyword_ar: Optional[str]
+    keyword_en: Optional[str]
+    weight: float
+    item_id: int
+    item_name_ar: str
+    item_name_en: str
+
+    def keyword(self, language: str) -> Optional[str]:
+        """Keyword text for a language"""
+        return self.keyword_ar if language == "ar" else self.keyword_en
+
+
+def keyword_tokens(text: str, language: str) -> Tuple[str, ...]:
+    """
+    Tokenize text the way keywords are indexed
+
+    Args:
+        text: Keyword or utterance
+        language: Language code
+
+    Returns:
+        Normalized tokens (Arabic articles stripped)
+    """
+    tokens = normalize_utterance(text).split()
+    if language == "ar":
+        tokens = [_strip_article(token) for token in tokens]
+    return tuple(tokens)
+
+
+def _strip_article(token: str) -> str:
+    for article in _ARABIC_ARTICLES:
+        if token.startswith(article) and len(token) - len(article) >= 2:
+            return token[len(article):]
+    return token
+
+
+class BranchKeywordIndex:
+    """
+    Keywords of one branch, keyed per language by normalized token sequence
+
+    Exact matches are found by looking up every n-gram of the utterance
+    (up to the longest keyword), so lookup cost depends on the utterance
+    length, not the number of keywords.
+
+    Fuzzy matching works per word: each utterance token (and each pair of
+    adjacent tokens, for "cheese burger" vs "cheeseburger") is looked up in
+    a trigram index of the distinct keyword words, and the candidate words
+    are assembled into keyword phrases. Menus reuse a small vocabulary
+    across many keywords, so the search space is the vocabulary rather
+    than the keyword list.
+    """
+
+    def __init__(self, branch_id: int, keywords: Iterable[BranchKeyword] = ()):
+        self.branch_id = branch_id
+        self._phrases: Dict[str, Dict[Tuple[str, ...], List[BranchKeyword]]] = {
+            language: {} for language in LANGUAGES
+        }
+        # Distinct keyword words, and multi-word keywords written as one word
+        self._vocabulary: Dict[str, TrigramIndex] = {language: TrigramIndex() for language in LANGUAGES}
+        self._compound_index: Dict[str, TrigramIndex] = {language: TrigramIndex() for language in LANGUAGES}
+        self._compounds: Dict[str, Dict[str, Set[Tuple[str, ...]]]] = {language: {} for language in LANGUAGES}
+        self._prefixes: Dict[str, Set[Tuple[str, ...]]] = {language: set() for language in LANGUAGES}
+        self._max_tokens: Dict[str, int] = {language: 0 for language in LANGUAGES}
+        self._size = 0
+        for keyword in keywords:
+            self.add(keyword)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, keyword: BranchKeyword) -> None:
+        """
+        Index a keyword
+
+        Args:
+            keyword: Keyword with item names
+        """
+        self._size += 1
+        for language in LANGUAGES:
+            text = keyword.keyword(language)
+            tokens = keyword_tokens(text, language) if text else ()
+            if not tokens:
+                continue
+            self._phrases[language].setdefault(tokens, []).append(keyword)
+            self._index_words(tokens, language)
+            self._max_tokens[language] = max(self._max_tokens[language], len(tokens))
+
+    def update_item(self, item_id: int, name_ar: str, name_en: str) -> bool:
+        """
+        Refresh the denormalized names of an item
+
+        Args:
+            item_id: Item ID
+            name_ar: New Arabic name
+            name_en: New English name
+
+        Returns:
+            Whether any keyword of this branch points to the item
+        """
+        found = False
+        for phrases in self._phrases.values():
+            for tokens, entries in phrases.items():
+                if any(entry.item_id == item_id for entry in entries):
+                    found = True
+                    phrases[tokens] = [
+                        replace(entry, item_name_ar=name_ar, item_name_en=name_en)
+                        if entry.item_id == item_id else entry
+                        for entry in entries
+                    ]
+        return found
+
+    def phrases(self, language: str) -> Dict[Tuple[str, ...], List[BranchKeyword]]:
+        """All indexed token sequences for a language"""
+        return self._phrases.get(language, {})
+
+    def lookup(self, tokens: Tuple[str, ...], language: str) -> Dict[Tuple[str, ...], List[BranchKeyword]]:
+        """
+        Find keywords appearing as whole-token spans of an utterance
+
+        Args:
+            tokens: Utterance tokens from keyword_tokens()
+            language: Language code
+
+        Returns:
+            Matched token sequence -> keywords
+        """
+        phrases = self._phrases.get(language, {})
+        max_tokens = self._max_tokens.get(language, 0)
+        found: Dict[Tuple[str, ...], List[BranchKeyword]] = {}
+        for start in range(len(tokens)):
+            for end in range(start + 1, min(start + max_tokens, len(tokens)) + 1):
+                span = tokens[start:end]
+                if span in phrases:
+                    found[span] = phrases[span]
+        return found
+
+    def fuzzy_lookup(
+        self,
+        tokens: Tuple[str, ...],
+        language: str,
+        threshold: float
+    ) -> List[Tuple[Tuple[str, ...], Tuple[str, ...], float]]:
+        """
+        Find keywords similar to whole-token spans of an utterance
+
+        Every keyword word must be matched by an utterance token (or two
+        adjacent tokens) at or above the threshold; the reported score is
+        the similarity of the whole span to the whole keyword.
+
+        Args:
+            tokens: Utterance tokens from keyword_tokens()
+            language: Language code
+            threshold: Minimum similarity
+
+        Returns:
+            (utterance span, keyword tokens, similarity) triples
+        """
+        vocabulary = self._vocabulary.get(language)
+        if vocabulary is None or not len(vocabulary):
+            return []
+        phrases = self._phrases[language]
+        compound_index = self._compound_index[language]
+        compounds = self._compounds[language]
+        prefixes = self._prefixes[language]
+        found: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], float] = {}
+
+        # edges[i]: (end, keyword word) for words matching tokens[i:end]
+        edges: List[List[Tuple[int, str]]] = [[] for _ in tokens]
+        for start, token in enumerate(tokens):
+            for word, _ in vocabulary.search(token, threshold):
+                edges[start].append((start + 1, word))
+            if start + 1 < len(tokens):
+                for word, _ in vocabulary.search(token + tokens[start + 1], threshold):
+                    edges[start].append((start + 2, word))
+            if len(compound_index):
+                for compound, _ in compound_index.search(token, threshold):
+                    for phrase in compounds[compound]:
+                        found.setdefault((tokens[start:start + 1], phrase), 0.0)
+
+        for start in range(len(tokens)):
+            pending = [(start, ())]
+            while pending:
+                position, prefix = pending.pop()
+                if position >= len(tokens):
+                    continue
+                for end, word in edges[position]:
+                    candidate = prefix + (word,)
+                    if candidate in phrases:
+                        found.setdefault((tokens[start:end], candidate), 0.0)
+                    if candidate in prefixes:
+                        pending.append((end, candidate))
+
+        results = []
+        for span, phrase in found:
+            score = similarity(" ".join(span), " ".join(phrase))
+            if score >= threshold:
+                results.append((span, phrase, score))
+        return results
+
+    def _index_words(self, tokens: Tuple[str, ...], language: str) -> None:
+        """Add a keyword's words, compound form and prefixes to the fuzzy index"""
+        vocabulary = self._vocabulary[language]
+        for token in tokens:
+            vocabulary.add(token)
+        if len(tokens) > 1:
+            compound = "".join(tokens)
+            self._compound_index[language].add(compound)
+            self._compounds[language].setdefault(compound, set()).add(tokens)
+            self._prefixes[language].update(tokens[:end] for end in range(1, len(tokens)))
@@ -2,13 +2,17 @@
 Keyword Matching Service
 Implements keyword-based menu item matching with fuzzy matching
 """
-from typing import List, Optional
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from difflib import SequenceMatcher
 
+from src.config import settings
 from src.database import models as db_models
 from src.models.nlu import KeywordMatch
 from src.utils import logger
+from .result_cache import nlu_result_cache
+from .keyword_index import BranchKeyword, BranchKeywordIndex, keyword_tokens
 
 
 class KeywordMatchingService:
@@ -25,6 +29,18 @@ class KeywordMatchingService:
     def __init__(self):
         self.fuzzy_threshold = 0.85  # 85% similarity threshold
 
+        # Per-branch in-memory keyword indexes, loaded on first use and kept
+        # current by add_keyword / update_item_names. Other workers edit the
+        # same tables, so each index remembers the database stamp it was
+        # built from and is reloaded when the stamp moves (checked at most
+        # once per check_interval seconds per branch)
+        self.indexes: Dict[int, BranchKeywordIndex] = {}
+        self.stamps: Dict[int, Tuple[Any, ...]] = {}
+        self.checked_at: Dict[int, float] = {}
+        self.check_interval = settings.keyword_index_check_interval
+        self.index_loads = 0
+        self.stale_reloads = 0
+
     def match_keywords(
         self,
         text: str,
@@ -46,61 +62,216 @@ class KeywordMatchingService:
         Returns:
             List of keyword matches sorted by confidence
         """
-        matches = []
-        text_lower = text.lower()
-        words = text_lower.split()
+        return self.match_index(text, language, self.get_index(db, branch_id), limit)
 
-        # Get all keywords for branch
-        keywords = db.query(db_models.Keyword).filter(
-            db_models.Keyword.branch_id == branch_id
-        ).all()
+    def get_index(self, db: Session, branch_id: int) -> BranchKeywordIndex:
+        """
+        Get the keyword index for a branch, loading it on first use
 
-        for keyword_obj in keywords:
-            # Get keyword based on language
-            keyword = keyword_obj.keyword_ar if language == "ar" else keyword_obj.keyword_en
+        Args:
+            db: Database session
+            branch_id: Branch ID
 
-            if not keyword:
-                continue
+        Returns:
+            Branch keyword index
+        """
+        return self.get_indexes(db, [branch_id])[branch_id]
+
+    def get_indexes(self, db: Session, branch_ids: Iterable[int]) -> Dict[int, BranchKeywordIndex]:
+        """
+        Get keyword indexes for several branches
+
+        Missing branches are loaded, and loaded ones whose stamp check is due
+        are compared against the database; the stamps and any (re)loads each
+        take a single query.
+
+        Args:
+            db: Database session
+            branch_ids: Branch IDs
+
+        Returns:
+            Branch ID -> keyword index
+        """
+        branch_ids = set(branch_ids)
+        now = time.time()
+        due = [
+            branch_id for branch_id in branch_ids
+            if branch_id not in self.indexes
+            or now - self.checked_at.get(branch_id, 0.0) >= self.check_interval
+        ]
+        if due:
+            stamps = self.load_branch_stamps(db, due)
+            stale = [
+                branch_id for branch_id in due
+                if branch_id in self.indexes and stamps[branch_id] != self.stamps.get(branch_id)
+            ]
+            missing = [branch_id for branch_id in due if branch_id not in self.indexes]
+
+            if stale or missing:
+                for branch_id, keywords in self.load_branch_keywords(db, stale + missing).items():
+                    self.indexes[branch_id] = BranchKeywordIndex(branch_id, keywords)
+                    self.index_loads += 1
+                logger.info("Keyword indexes loaded", branches=missing, stale=stale)
+
+            for branch_id in stale:
+                # Cached results were matched against the old keywords
+                nlu_result_cache.invalidate_branch(branch_id)
+            self.stale_reloads += len(stale)
+
+            for branch_id in due:
+                self.stamps[branch_id] = stamps[branch_id]
+                self.checked_at[branch_id] = now
+        return {branch_id: self.indexes[branch_id] for branch_id in branch_ids}
+
+    def invalidate_index(self, branch_id: int) -> None:
+        """
+        Drop a branch index so the next match reloads it from the database
+
+        Args:
+            branch_id: Branch ID
+        """
+        self.indexes.pop(branch_id, None)
+        self.stamps.pop(branch_id, None)
+        self.checked_at.pop(branch_id, None)
+
+    def update_item_names(self, item_id: int, name_ar: str, name_en: str) -> List[int]:
+        """
+        Refresh an item's names in every loaded index
+
+        Args:
+            item_id: Item ID
+            name_ar: New Arabic name
+            name_en: New English name
+
+        Returns:
+            IDs of branches with keywords for the item
+        """
+        return [
+            branch_id for branch_id, index in self.indexes.items()
+            if index.update_item(item_id, name_ar, name_en)
+        ]
+
+    def load_branch_stamps(
+        self,
+        db: Session,
+        branch_ids: Iterable[int]
+    ) -> Dict[int, Tuple[Any, ...]]:
+        """
+        Load a cheap version stamp of each branch's keywords in a single query
+
+        The stamp is (keyword count, highest keyword id, latest item update),
+        over the same join load_branch_keywords() reads, so added or deleted
+        keywords, deleted items and renamed items all change it.
 
-            keyword_lower = keyword.lower()
-
-            # Exact match
-            if keyword_lower in text_lower:
-                # Get item details
-                item = db.query(db_models.Item).filter(
-                    db_models.Item.id == keyword_obj.item_id
-                ).first()
-
-                if item:
-                    matches.append(KeywordMatch(
-                        keyword=keyword,
-                        matched_text=keyword,
-                        item_id=item.id,
-                        item_name_ar=item.name_ar,
-                        item_name_en=item.name_en,
-                        confidence=1.0 * keyword_obj.weight,
-                        match_type="exact"
-                    ))
-                    continue
-
-            # Fuzzy match check
-            for word in words:
-                similarity = self._calculate_similarity(keyword_lower, word)
-                if similarity >= self.fuzzy_threshold:
-                    item = db.query(db_models.Item).filter(
-                        db_models.Item.id == keyword_obj.item_id
-                    ).first()
-
-                    if item:
-                        matches.append(KeywordMatch(
-                            keyword=keyword,
-                            matched_text=word,
-                            item_id=item.id,
-                            item_name_ar=item.name_ar,
-                            item_name_en=item.name_en,
-                            confidence=similarity * keyword_obj.weight,
-                            match_type="fuzzy"
-                        ))
+        Args:
+            db: Database session
+            branch_ids: Branch IDs
+
+        Returns:
+            Branch ID -> stamp
+        """
+        branch_ids = list(set(branch_ids))
+        stamps: Dict[int, Tuple[Any, ...]] = {branch_id: (0, None, None) for branch_id in branch_ids}
+        if not branch_ids:
+            return stamps
+
+        rows = db.query(
+            db_models.Keyword.branch_id,
+            func.count(db_models.Keyword.id),
+            func.max(db_models.Keyword.id),
+            func.max(db_models.Item.updated_at)
+        ).join(
+            db_models.Item, db_models.Item.id == db_models.Keyword.item_id
+        ).filter(
+            db_models.Keyword.branch_id.in_(branch_ids)
+        ).group_by(db_models.Keyword.branch_id).all()
+
+        for branch_id, count, max_id, updated_at in rows:
+            stamps[branch_id] = (count, max_id, updated_at)
+        return stamps
+
+    def load_branch_keywords(
+        self,
+        db: Session,
+        branch_ids: Iterable[int]
+    ) -> Dict[int, List[BranchKeyword]]:
+        """
+        Load keywords with their items for one or more branches in a single query
+
+        Args:
+            db: Database session
+            branch_ids: Branch IDs
+
+        Returns:
+            Branch ID -> keywords (keywords whose item no longer exists are skipped)
+        """
+        branch_ids = list(set(branch_ids))
+        loaded: Dict[int, List[BranchKeyword]] = {branch_id: [] for branch_id in branch_ids}
+        if not branch_ids:
+            return loaded
+
+        rows = db.query(
+            db_models.Keyword.branch_id,
+            db_models.Keyword.keyword_ar,
+            db_models.Keyword.keyword_en,
+            db_models.Keyword.weight,
+            db_models.Item.id,
+            db_models.Item.name_ar,
+            db_models.Item.name_en
+        ).join(
+            db_models.Item, db_models.Item.id == db_models.Keyword.item_id
+        ).filter(
+            db_models.Keyword.branch_id.in_(branch_ids)
+        ).order_by(db_models.Keyword.id).all()
+
+        for branch_id, keyword_ar, keyword_en, weight, item_id, name_ar, name_en in rows:
+            loaded[branch_id].append(BranchKeyword(
+                keyword_ar=keyword_ar,
+                keyword_en=keyword_en,
+                weight=weight,
+                item_id=item_id,
+                item_name_ar=name_ar,
+                item_name_en=name_en
+            ))
+        return loaded
+
+    def match_index(
+        self,
+        text: str,
+        language: str,
+        index: BranchKeywordIndex,
+        limit: int = 5
+    ) -> List[KeywordMatch]:
+        """
+        Match text against a branch keyword index (no database access)
+
+        Args:
+            text: Text to search for keywords
+            language: Language code (ar/en)
+            index: Branch keyword index
+            limit: Maximum number of matches
+
+        Returns:
+            List of keyword matches sorted by confidence
+        """
+        matches = []
+        tokens = keyword_tokens(text, language)
+
+        # Exact: keywords appearing as whole-token spans of the text
+        exact = index.lookup(tokens, language)
+        for entries in exact.values():
+            for entry in entries:
+                keyword = entry.keyword(language)
+                matches.append(self._make_match(entry, keyword, keyword, 1.0, "exact"))
+
+        # Fuzzy: trigram candidates per word, verified by edit distance
+        for span, phrase, similarity in index.fuzzy_lookup(tokens, language, self.fuzzy_threshold):
+            if phrase in exact:
+                continue
+            for entry in index.phrases(language)[phrase]:
+                matches.append(self._make_match(
+                    entry, entry.keyword(language), " ".join(span), similarity, "fuzzy"
+                ))
 
         # Sort by confidence and limit
         matches.sort(key=lambda x: x.confidence, reverse=True)
@@ -114,18 +285,38 @@ class KeywordMatchingService:
 
         return unique_matches[:limit]
 
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
+    def get_stats(self) -> Dict[str, Any]:
         """
-        Calculate similarity between two strings using SequenceMatcher
-
-        Args:
-            str1: First string
-            str2: Second string
+        Get keyword index statistics
 
         Returns:
-            Similarity score (0.0 to 1.0)
+            Loaded branches and keyword counts
         """
-        return SequenceMatcher(None, str1, str2).ratio()
+        return {
+            "branches_loaded": len(self.indexes),
+            "keywords": {branch_id: len(index) for branch_id, index in self.indexes.items()},
+            "index_loads": self.index_loads,
+            "stale_reloads": self.stale_reloads,
+        }
+
+    def _make_match(
+        self,
+        entry: BranchKeyword,
+        keyword: str,
+        matched_text: str,
+        similarity: float,
+        match_type: str
+    ) -> KeywordMatch:
+        """Build a match weighted by the keyword weight"""
+        return KeywordMatch(
+            keyword=keyword,
+            matched_text=matched_text,
+            item_id=entry.item_id,
+            item_name_ar=entry.item_name_ar,
+            item_name_en=entry.item_name_en,
+            confidence=similarity * entry.weight,
+            match_type=match_type
+        )
 
     def _deduplicate_matches(self, matches: List[KeywordMatch]) -> List[KeywordMatch]:
         """
@@ -182,6 +373,23 @@ class KeywordMatchingService:
         db.commit()
         db.refresh(keyword)
 
+        # Keep a loaded index current without reloading the branch
+        index = self.indexes.get(branch_id)
+        if index is not None:
+            item = db.query(db_models.Item).filter(db_models.Item.id == item_id).first()
+            if item:
+                index.add(BranchKeyword(
+                    keyword_ar=keyword_ar,
+                    keyword_en=keyword_en,
+                    weight=weight,
+                    item_id=item.id,
+                    item_name_ar=item.name_ar,
+                    item_name_en=item.name_en
+                ))
+
+        # Cached NLU results for this branch may now match differently
+        nlu_result_cache.invalidate_branch(branch_id)
+
         logger.info(
             "Keyword added",
             item_id=item_id,
@@ -0,0 +1,140 @@
+"""
+LLM Executor
+Runs blocking llama.cpp calls on a dedicated thread behind a bounded queue
+so the event loop never waits on generation
+"""
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from src.utils import AdmissionController, log_performance_metric
+
+
+class LLMTimeoutError(TimeoutError):
+    """Raised when an LLM call does not finish within its timeout"""
+
+
+@dataclass
+class _Job:
+    fn: Callable[[], Any]
+    stop: Optional[threading.Event] = None
+    abandoned: bool = False
+    started: bool = False
+
+
+class LLMExecutor:
+    """
+    Single-threaded llama.cpp runner
+
+    - One llama.cpp context is not thread-safe, so calls run one at a time
+      on a dedicated thread
+    - At most `max_queue` calls wait; beyond that ServiceSaturatedError
+    - Each call has a timeout covering queue wait and generation. A call
+      that times out or is cancelled before it starts is skipped; one that
+      is already generating has its `stop` event set, which the call
+      checks per token (llama.cpp stopping_criteria) to return early and
+      free the thread
+    """
+
+    def __init__(self, max_queue: int, timeout_ms: int):
+        self.timeout_ms = timeout_ms
+        self.admission = AdmissionController("llm", max_concurrency=1, max_queue=max_queue)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm")
+
+        self.completed = 0
+        self.timeouts = 0
+        self.skipped = 0
+        self.total_wait_ms = 0.0
+        self.total_run_ms = 0.0
+        self.max_run_ms = 0.0
+
+    async def run(
+        self,
+        fn: Callable[[], Any],
+        timeout_ms: Optional[int] = None,
+        stop: Optional[threading.Event] = None
+    ) -> Any:
+        """
+        Run a blocking model call on the LLM thread
+
+        Args:
+            fn: Callable performing the model call
+            timeout_ms: Override of the default timeout
+            stop: Event set when the caller gives up; `fn` should poll it
+                and return early so abandoned work does not hold the thread
+
+        Returns:
+            Result of `fn`
+
+        Raises:
+            ServiceSaturatedError: If the wait queue is full
+            LLMTimeoutError: If the call did not finish in time
+        """
+        timeout_ms = timeout_ms or self.timeout_ms
+        job = _Job(fn, stop)
+        task = asyncio.ensure_future(self._execute(job, time.time()))
+        # The task may outlive its caller; retrieve its exception so it is not reported as unhandled
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout_ms / 1000)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            self._abandon(job, task)
+            raise LLMTimeoutError(f"LLM call exceeded {timeout_ms}ms")
+        except asyncio.CancelledError:
+            self._abandon(job, task)
+            raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get executor statistics
+
+        Returns:
+            Queue depth, timeouts and latency figures
+        """
+        return {
+            **self.admission.get_stats(),
+            "queue_depth": self.admission.waiting,
+            "timeout_ms": self.timeout_ms,
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "skipped": self.skipped,
+            "avg_queue_wait_ms": self.total_wait_ms / self.completed if self.completed else 0.0,
+            "avg_run_ms": self.total_run_ms / self.completed if self.completed else 0.0,
+            "max_run_ms": self.max_run_ms,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the LLM thread once the current call finishes"""
+        self.executor.shutdown(wait=False)
+
+    async def _execute(self, job: _Job, enqueued_at: float) -> Any:
+        async with self.admission.slot():
+            if job.abandoned:
+                return None  # Counted as skipped when abandoned
+
+            job.started = True
+            wait_ms = (time.time() - enqueued_at) * 1000
+            start_time = time.time()
+            result = await asyncio.get_running_loop().run_in_executor(self.executor, job.fn)
+            run_ms = (time.time() - start_time) * 1000
+
+            self.completed += 1
+            self.total_wait_ms += wait_ms
+            self.total_run_ms += run_ms
+            self.max_run_ms = max(self.max_run_ms, run_ms)
+            log_performance_metric("nlu", "llm_queue_wait", wait_ms, unit="ms")
+            return result
+
+    def _abandon(self, job: _Job, task: asyncio.Task) -> None:
+        """Drop a job its caller no longer wants, or ask a running one to stop"""
+        job.abandoned = True
+        if job.stop is not None:
+            job.stop.set()
+        if not job.started and not task.done():
+            self.skipped += 1
+            task.cancel()
@@ -4,21 +4,62 @@ Implements Phase 3 NLU requirements
 """
 import time
 import re
-from typing import Optional, List, Dict, Any, Tuple
+import threading
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 import json
+from collections import OrderedDict
+from sqlalchemy.orm import Session
 
 try:
-    from llama_cpp import Llama
+    from llama_cpp import Llama, LlamaGrammar
 except ImportError:
     Llama = None
+    LlamaGrammar = None
 
 from src.config import settings
-from src.utils import logger, log_service_event, log_performance_metric
+from src.utils import logger, log_service_event, log_performance_metric, ServiceSaturatedError
 from src.models.nlu import (
     IntentType, SlotType, Intent, Slot, NLURequest, NLUResponse,
     KeywordMatch, TriggerWord
 )
 from src.models import ServiceStatus
+from src.services.nlu.phrase_matcher import PhraseMatcher, PhraseMatch, ARABIC_PROCLITICS
+from src.services.nlu.structured_output import build_nlu_grammar, parse_nlu_json
+from src.services.nlu.prompt_cache import PromptPrefixCache
+from src.services.nlu.llm_executor import LLMExecutor, LLMTimeoutError
+from src.services.nlu.result_cache import nlu_result_cache
+from src.services.nlu.keyword_service import keyword_service
+from src.services.nlu.keyword_index import BranchKeywordIndex
+from src.services.nlu.cascade import (
+    NLUTrace, TierStats, TIER_CACHE, TIER_RULES, TIER_KEYWORDS, TIER_LLM
+)
+
+# Fixed phrases spoken to the customer (pre-rendered by TTS at menu publish)
+CANNED_PROMPTS = {
+    "ar": {
+        "greeting": "أهلاً وسهلاً، ماذا تحب أن تطلب؟",
+        "confirmation": "تمام، هل تريد تأكيد الطلب؟",
+        "clarification": "عفواً، لم أفهم طلبك بوضوح. هل يمكنك إعادة الصياغة؟",
+        "not_understood": "عفواً، لم أفهم. هل يمكنك إعادة الطلب؟"
+    },
+    "en": {
+        "greeting": "Welcome! What would you like to order?",
+        "confirmation": "Great, shall I confirm your order?",
+        "clarification": "Sorry, I didn't quite understand. Could you rephrase that?",
+        "not_understood": "Sorry, I didn't understand. Can you repeat?"
+    }
+}
+
+# Distinct utterances remembered for deduplication within one batch
+BATCH_DEDUPE_WINDOW = 10000
+
+# Rule-based intent vocabularies, in priority order
+RULE_INTENTS = {
+    "greeting": (IntentType.GREETING, 0.95),
+    "order": (IntentType.ORDER_ITEM, 0.85),
+    "price": (IntentType.QUERY_PRICE, 0.90),
+    "food": (IntentType.ORDER_ITEM, 0.70),
+}
 
 
 class NLUService:
@@ -35,6 +76,12 @@ class NLUService:
 
     def __init__(self):
         self.model: Optional[Llama] = None
+        self.grammar: Optional[LlamaGrammar] = None
+        self.prompt_cache = PromptPrefixCache(settings.llm_prompt_cache_max_entries)
+        # All llama.cpp calls go through this single thread, never the event loop
+        self.llm = LLMExecutor(settings.llm_max_queue, settings.llm_timeout_ms)
+        self.result_cache = nlu_result_cache
+        self.tier_stats = TierStats()
         self.model_path = settings.llm_model_path
         self.n_ctx = settings.llm_n_ctx
         self.n_threads = settings.llm_n_threads
@@ -52,7 +99,7 @@ class NLUService:
             },
             "en": {
                 "cancel": ["cancel", "stop", "nevermind", "forget it"],
-                "repeat": ["repeat", "again", "what", "pardon"],
+                "repeat": ["repeat", "again", "pardon", "what did you say", "come again"],
                 "modify": ["change", "modify", "edit", "update"],
                 "help": ["help", "assist", "don't understand"],
                 "confirm": ["yes", "yeah", "correct", "right", "okay", "ok"],
@@ -60,6 +107,29 @@ class NLUService:
             }
         }
 
+        # Phrases for rule-based intent classification (keys of RULE_INTENTS).
+        # Price and food words are shared so mixed-language utterances match.
+        price_words = ["كم", "سعر", "price", "cost"]
+        food_words = ["burger", "برجر", "drink", "مشروب", "meal", "وجبة", "combo", "كومبو"]
+        self.intent_phrases = {
+            "ar": {
+                "greeting": ["مرحبا", "السلام عليكم", "أهلا", "صباح الخير", "مساء الخير"],
+                "order": ["أريد", "أطلب", "أحب", "ممكن", "أعطني"],
+                "price": price_words,
+                "food": food_words
+            },
+            "en": {
+                "greeting": ["hello", "hi", "good morning", "good evening"],
+                "order": ["want", "order", "like", "get", "give me", "i'll have"],
+                "price": price_words,
+                "food": food_words
+            }
+        }
+
+        self.matchers: Dict[str, PhraseMatcher] = {}
+        for language in self.trigger_words:
+            self._build_matcher(language)
+
         log_service_event("nlu", "initialization", "Initializing NLU service")
 
     async def initialize(self):
@@ -80,6 +150,8 @@ class NLUService:
                 n_threads=self.n_threads,
                 verbose=False
             )
+            # Compiled once; llama.cpp resets grammar state per completion
+            self.grammar = LlamaGrammar.from_string(build_nlu_grammar(), verbose=False)
 
             load_time_ms = (time.time() - start_time) * 1000
             self.status = ServiceStatus.READY
@@ -92,35 +164,138 @@ class NLUService:
             self.model = None
             self.status = ServiceStatus.READY  # Still ready with fallback
 
-    async def process(self, request: NLURequest) -> NLUResponse:
+    async def process(
+        self,
+        request: NLURequest,
+        db: Optional[Session] = None,
+        keyword_index: Optional[BranchKeywordIndex] = None,
+        deadline_ms: Optional[int] = None
+    ) -> NLUResponse:
         """
         Process text for NLU
 
         Args:
             request: NLU request with text and context
+            db: Database session for branch keyword matching
+            keyword_index: Keyword index of the request's branch, used
+                instead of looking it up through `db`
+            deadline_ms: Latency budget (see process_traced)
 
         Returns:
-            NLU response with intent, slots, entities
+            NLU response with intent, slots, entities and matched keywords
+        """
+        response, _ = await self.process_traced(request, db, keyword_index, deadline_ms)
+        return response
+
+    async def process_traced(
+        self,
+        request: NLURequest,
+        db: Optional[Session] = None,
+        keyword_index: Optional[BranchKeywordIndex] = None,
+        deadline_ms: Optional[int] = None
+    ) -> Tuple[NLUResponse, NLUTrace]:
+        """
+        Process text for NLU through the tier cascade
+
+        Tiers run cheapest first: result cache, compiled rules, branch
+        keyword matching, then the LLM. A tier's intent is accepted when its
+        confidence reaches the threshold for that intent
+        (settings.nlu_intent_thresholds, default settings.nlu_default_threshold);
+        otherwise the request escalates to the next tier.
+
+        The request has a deadline. If the LLM has not answered when it
+        passes, the LLM job is abandoned (skipped if still queued) and the
+        best lower-tier answer is returned, marked degraded.
+
+        Args:
+            request: NLU request with text and context
+            db: Database session for branch keyword matching
+            keyword_index: Keyword index of the request's branch, used
+                instead of looking it up through `db`
+            deadline_ms: Latency budget from now; None uses
+                settings.nlu_deadline_ms, 0 disables the deadline (the LLM
+                timeout still applies)
+
+        Returns:
+            Tuple of (NLU response, trace of the tiers consulted)
         """
         start_time = time.time()
+        if deadline_ms is None:
+            deadline_ms = settings.nlu_deadline_ms
+        trace = NLUTrace(deadline_ms=deadline_ms or None)
+
+        if request.branch_id and keyword_index is None and db is not None and settings.enable_keyword_matching:
+            # Resolved before the cache lookup: the index's stamp check
+            # invalidates this worker's cached results for the branch when
+            # another worker changed its keywords or item names
+            try:
+                keyword_index = keyword_service.get_index(db, request.branch_id)
+            except Exception as e:
+                logger.error("Keyword index lookup failed", branch_id=request.branch_id, error=str(e))
+                db = None
+
+        # Responses without keyword matching must not be served to requests that want it
+        keywords_available = db is not None or keyword_index is not None
+        cache_key = None
+        if settings.enable_nlu_caching and (request.branch_id is None or keywords_available):
+            cache_key = self.result_cache.make_key(
+                request.text, request.language, request.branch_id, request.context
+            )
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                processing_time_ms = (time.time() - start_time) * 1000
+                trace.add(TIER_CACHE, cached.intent, processing_time_ms, accepted=True)
+                self.tier_stats.record(trace)
+                log_performance_metric("nlu", "processing_latency", processing_time_ms, unit="ms", tier=TIER_CACHE)
+                return cached.model_copy(update={
+                    "text": request.text,
+                    "processing_time_ms": processing_time_ms
+                }), trace
 
         try:
-            # Detect trigger words first
-            trigger = self._detect_trigger_words(request.text, request.language)
+            # Tier 1: trigger words and rule vocabularies, one pass over the text
+            tier_start = time.time()
+            matches = self._match_phrases(request.text, request.language)
+            trigger = self._detect_trigger_words(request.text, request.language, matches)
             if trigger:
                 intent = self._trigger_to_intent(trigger)
-            elif self.model:
-                # Use LLM for intent classification
-                intent = await self._classify_intent_llm(request.text, request.language, request.context)
-            else:
-                # Fallback to rule-based
-                intent = self._classify_intent_rules(request.text, request.language)
-
-            # Extract slots
-            if self.model and intent.intent_type in [IntentType.ORDER_ITEM, IntentType.MODIFY_ORDER]:
-                slots = await self._extract_slots_llm(request.text, request.language, intent.intent_type)
             else:
-                slots = self._extract_slots_rules(request.text, request.language)
+                intent = self._classify_intent_rules(request.text, request.language, matches)
+            accepted = self._accept(intent)
+            trace.add(TIER_RULES, intent, (time.time() - tier_start) * 1000, accepted)
+
+            slots = self._extract_slots_rules(request.text, request.language)
+
+            # Tier 2: branch menu keywords (also reported in the response)
+            tier_start = time.time()
+            keyword_matches = self._match_keywords(request, db, keyword_index)
+            if not accepted and keyword_matches:
+                intent, item_slot = self._classify_intent_keywords(intent, keyword_matches, request.language)
+                accepted = self._accept(intent)
+                trace.add(TIER_KEYWORDS, intent, (time.time() - tier_start) * 1000, accepted)
+                if item_slot and not any(slot.slot_type == SlotType.ITEM_NAME for slot in slots):
+                    slots.append(item_slot)
+
+            # Tier 3: LLM classifies the intent and extracts slots in one call
+            if not accepted and self.model:
+                tier_start = time.time()
+                remaining_ms = deadline_ms - (tier_start - start_time) * 1000 if deadline_ms else None
+                llm_slots = None
+                if remaining_ms is None or remaining_ms > 0:
+                    llm_intent, llm_slots = await self._analyze_llm(
+                        request.text, request.language, request.context,
+                        timeout_ms=int(max(remaining_ms, 1)) if remaining_ms is not None else None
+                    )
+                if llm_slots is not None:
+                    intent = llm_intent
+                    if intent.intent_type in [IntentType.ORDER_ITEM, IntentType.MODIFY_ORDER]:
+                        slots = llm_slots
+                else:
+                    # LLM late or unavailable; keep the best lower-tier answer
+                    trace.degraded = True
+                    trace.deadline_missed = bool(deadline_ms) and (time.time() - start_time) * 1000 >= deadline_ms
+                    trace.resolved_by = trace.final_tier
+                trace.add(TIER_LLM, intent, (time.time() - tier_start) * 1000, llm_slots is not None)
 
             # Extract entities
             entities = self._extract_entities(request.text, request.language, slots)
@@ -131,26 +306,44 @@ class NLUService:
             # Check for clarification need
             needs_clarification = intent.confidence < 0.7 or intent.intent_type == IntentType.UNKNOWN
 
-            log_performance_metric("nlu", "processing_latency", processing_time_ms, unit="ms", intent=intent.intent_type.value)
+            self.tier_stats.record(trace)
+            log_performance_metric(
+                "nlu",
+                "processing_latency",
+                processing_time_ms,
+                unit="ms",
+                intent=intent.intent_type.value,
+                tier=trace.final_tier
+            )
 
             # Check latency target
             if processing_time_ms > 200:
                 logger.warning(f"NLU latency {processing_time_ms}ms exceeds target 200ms")
 
-            return NLUResponse(
+            response = NLUResponse(
                 text=request.text,
                 language=request.language,
                 intent=intent,
                 slots=slots,
                 entities=entities,
-                matched_keywords=[],  # Populated by keyword service
+                matched_keywords=[
+                    f"{match.item_name_en} ({match.confidence:.2f})"
+                    for match in keyword_matches
+                ],
                 processing_time_ms=processing_time_ms,
                 needs_clarification=needs_clarification,
                 clarification_question=self._generate_clarification(intent, request.language) if needs_clarification else None
             )
 
+            # Degraded answers are not cached so the next repeat retries the LLM
+            if cache_key is not None and not trace.degraded:
+                self.result_cache.put(cache_key, response)
+
+            return response, trace
+
         except Exception as e:
             logger.error("NLU processing failed", error=str(e), text=request.text[:100])
+            trace.degraded = True
             # Return fallback response
             return NLUResponse(
                 text=request.text,
@@ -161,18 +354,191 @@ class NLUService:
                 matched_keywords=[],
                 processing_time_ms=(time.time() - start_time) * 1000,
                 needs_clarification=True,
-                clarification_question="عفواً، لم أفهم. هل يمكنك إعادة الطلب؟" if request.language == "ar" else "Sorry, I didn't understand. Can you repeat?"
+                clarification_question=CANNED_PROMPTS["ar" if request.language == "ar" else "en"]["not_understood"]
+            ), trace
+
+    async def process_batch(
+        self,
+        requests: List[NLURequest],
+        keyword_indexes: Optional[Dict[int, BranchKeywordIndex]] = None
+    ) -> AsyncIterator[Tuple[int, NLUResponse]]:
+        """
+        Process many requests, running each distinct utterance once
+
+        Requests are processed one at a time so a large batch never holds
+        more than one slot in the LLM queue ahead of live traffic. Results
+        are yielded as they complete, in input order. Identical requests
+        (same cache key) within the last BATCH_DEDUPE_WINDOW distinct ones
+        reuse the earlier response.
+
+        Args:
+            requests: NLU requests
+            keyword_indexes: Keyword index per branch from
+                keyword_service.get_indexes(), resolved once for the batch
+
+        Yields:
+            Tuples of (request index, response)
+
+        Raises:
+            ValueError: If there are more than NLU_BATCH_MAX_SIZE requests
+        """
+        if len(requests) > settings.nlu_batch_max_size:
+            raise ValueError(
+                f"Batch of {len(requests)} requests exceeds the limit of {settings.nlu_batch_max_size}"
             )
 
-    def _detect_trigger_words(self, text: str, language: str) -> Optional[TriggerWord]:
-        """Detect trigger words for special actions"""
-        text_lower = text.lower().strip()
-        triggers = self.trigger_words.get(language, {})
+        start_time = time.time()
+        keyword_indexes = keyword_indexes or {}
+        # Bounded so memory stays flat however large the batch is
+        results: "OrderedDict[Any, NLUResponse]" = OrderedDict()
+        unique = 0
+
+        for index, request in enumerate(requests):
+            key = self.result_cache.make_key(
+                request.text, request.language, request.branch_id, request.context
+            )
+            response = results.get(key)
+            if response is None:
+                # Offline work: no deadline, only the LLM timeout applies
+                response = await self.process(
+                    request,
+                    keyword_index=keyword_indexes.get(request.branch_id) if request.branch_id else None,
+                    deadline_ms=0
+                )
+                unique += 1
+                results[key] = response
+                if len(results) > BATCH_DEDUPE_WINDOW:
+                    results.popitem(last=False)
+            else:
+                results.move_to_end(key)
+                if response.text != request.text:
+                    response = response.model_copy(update={"text": request.text})
+            yield index, response
+
+        log_performance_metric(
+            "nlu",
+            "batch_latency",
+            (time.time() - start_time) * 1000,
+            unit="ms",
+            requests=len(requests),
+            unique=unique
+        )
+
+    def _match_keywords(
+        self,
+        request: NLURequest,
+        db: Optional[Session],
+        keyword_index: Optional[BranchKeywordIndex] = None
+    ) -> List[KeywordMatch]:
+        """Match branch menu keywords in the utterance"""
+        if not request.branch_id or not settings.enable_keyword_matching:
+            return []
+
+        if keyword_index is not None:
+            keyword_matches = keyword_service.match_index(
+                request.text, request.language, keyword_index, limit=5
+            )
+        elif db is not None:
+            keyword_matches = keyword_service.match_keywords(
+                text=request.text,
+                language=request.language,
+                branch_id=request.branch_id,
+                db=db,
+                limit=5
+            )
+        else:
+            return []
+
+        return keyword_matches
+
+    def _accept(self, intent: Intent) -> bool:
+        """Whether a tier's intent is confident enough to stop the cascade"""
+        threshold = settings.nlu_intent_thresholds.get(
+            intent.intent_type.value, settings.nlu_default_threshold
+        )
+        return intent.intent_type != IntentType.UNKNOWN and intent.confidence >= threshold
+
+    def _classify_intent_keywords(
+        self,
+        rules_intent: Intent,
+        keyword_matches: List[KeywordMatch],
+        language: str
+    ) -> Tuple[Intent, Optional[Slot]]:
+        """
+        Refine the rules-tier intent with menu keyword matches
+
+        A menu item mention makes an unknown or weak order utterance an
+        order, with the match confidence. Other intents (e.g. a price query
+        naming an item) are kept; the match only contributes the item slot.
+        """
+        best = keyword_matches[0]
+        confidence = min(best.confidence, 1.0)
+        item_slot = Slot(
+            slot_type=SlotType.ITEM_NAME,
+            value=best.item_name_ar if language == "ar" else best.item_name_en,
+            confidence=confidence
+        )
+
+        if rules_intent.intent_type in (IntentType.UNKNOWN, IntentType.ORDER_ITEM):
+            return Intent(
+                intent_type=IntentType.ORDER_ITEM,
+                confidence=max(confidence, rules_intent.confidence)
+            ), item_slot
+        return rules_intent, item_slot
+
+    async def shutdown(self):
+        """Shutdown the NLU service"""
+        log_service_event("nlu", "shutdown", "Shutting down NLU service")
+        self.llm.shutdown()
+        self.prompt_cache.clear()
+        self.result_cache.clear()
+        self.model = None
+        self.status = ServiceStatus.STOPPED
+
+    def update_vocabulary(self, language: str, action: str, phrases: List[str]):
+        """
+        Replace the phrases for a trigger action or rule intent
 
-        for action, words in triggers.items():
-            for word in words:
-                if word in text_lower:
-                    return TriggerWord(trigger=word, action=action, confidence=1.0)
+        Args:
+            language: Language code (ar/en)
+            action: Trigger action (e.g. "cancel") or rule intent (e.g. "greeting")
+            phrases: Phrases that signal the action
+        """
+        vocabulary = self.intent_phrases if action in RULE_INTENTS else self.trigger_words
+        vocabulary.setdefault(language, {})[action] = list(phrases)
+        self._build_matcher(language)
+
+    def _build_matcher(self, language: str):
+        """Compile trigger and intent phrases for one language into a single matcher"""
+        vocabulary = {
+            **self.trigger_words.get(language, {}),
+            **self.intent_phrases.get(language, {})
+        }
+        self.matchers[language] = PhraseMatcher(
+            vocabulary,
+            prefix=ARABIC_PROCLITICS if language == "ar" else None
+        )
+
+    def _match_phrases(self, text: str, language: str) -> List[PhraseMatch]:
+        """Find all vocabulary phrases in the text"""
+        matcher = self.matchers.get(language)
+        return matcher.match(text) if matcher else []
+
+    def _detect_trigger_words(
+        self,
+        text: str,
+        language: str,
+        matches: Optional[List[PhraseMatch]] = None
+    ) -> Optional[TriggerWord]:
+        """Detect trigger words for special actions"""
+        if matches is None:
+            matches = self._match_phrases(text, language)
+
+        # Earlier actions in the trigger table take precedence
+        for action in self.trigger_words.get(language, {}):
+            for match in matches:
+                if match.action == action:
+                    return TriggerWord(trigger=match.phrase, action=action, confidence=1.0)
         return None
 
     def _trigger_to_intent(self, trigger: TriggerWord) -> Intent:
@@ -188,85 +554,91 @@ class NLUService:
         intent_type = intent_map.get(trigger.action, IntentType.UNKNOWN)
         return Intent(intent_type=intent_type, confidence=trigger.confidence)
 
-    async def _classify_intent_llm(self, text: str, language: str, context: Optional[Dict] = None) -> Intent:
-        """Classify intent using LLM"""
+    async def _analyze_llm(
+        self,
+        text: str,
+        language: str,
+        context: Optional[Dict] = None,
+        timeout_ms: Optional[int] = None
+    ) -> Tuple[Intent, Optional[List[Slot]]]:
+        """
+        Classify intent and extract slots with a single grammar-constrained LLM call
+
+        Args:
+            text: Utterance
+            language: Language code (ar/en)
+            context: Conversation context
+            timeout_ms: Budget for queueing and generation, capped at the
+                executor's timeout
+
+        Returns:
+            Tuple of (intent, slots). Slots are None when the LLM call failed
+            and the rule-based intent was used instead.
+        """
         if not self.model:
-            return self._classify_intent_rules(text, language)
+            return self._classify_intent_rules(text, language), None
 
         try:
-            prompt = self._build_intent_prompt(text, language, context)
-
-            response = self.model(
-                prompt,
-                max_tokens=50,
-                temperature=0.1,
-                stop=["</intent>"]
-            )
+            start_time = time.time()
+            prefix = self._build_nlu_prompt_prefix(language)
+            prompt = prefix + self._build_nlu_prompt_suffix(text, context)
+
+            # Set by the executor when the caller times out; llama.cpp checks
+            # the stopping criteria after every token, so generation ends early
+            stop = threading.Event()
+
+            def _complete():
+                # Restore the evaluated instruction prefix so only the utterance is evaluated
+                reused = self.prompt_cache.prepare(self.model, language, prefix)
+                return self.model(
+                    prompt,
+                    max_tokens=128,
+                    temperature=0.1,
+                    grammar=self.grammar,
+                    stopping_criteria=lambda input_ids, logits: stop.is_set()
+                ), reused
+
+            if timeout_ms is not None:
+                timeout_ms = min(timeout_ms, self.llm.timeout_ms)
+            response, reused_tokens = await self.llm.run(_complete, timeout_ms, stop=stop)
 
             result = response['choices'][0]['text'].strip()
-            intent_type, confidence = self._parse_intent_response(result)
-
-            return Intent(intent_type=intent_type, confidence=confidence)
+            usage = response.get('usage', {})
+            log_performance_metric(
+                "nlu",
+                "llm_inference_latency",
+                (time.time() - start_time) * 1000,
+                unit="ms",
+                prompt_tokens=usage.get('prompt_tokens'),
+                prefix_tokens_reused=reused_tokens,
+                completion_tokens=usage.get('completion_tokens')
+            )
+            return parse_nlu_json(result)
 
+        except (ServiceSaturatedError, LLMTimeoutError) as e:
+            logger.warning("LLM unavailable, using rule-based NLU", reason=str(e))
+            return self._classify_intent_rules(text, language), None
         except Exception as e:
-            logger.error("LLM intent classification failed", error=str(e))
-            return self._classify_intent_rules(text, language)
-
-    def _classify_intent_rules(self, text: str, language: str) -> Intent:
+            logger.error("LLM intent and slot analysis failed", error=str(e))
+            return self._classify_intent_rules(text, language), None
+
+    def _classify_intent_rules(
+        self,
+        text: str,
+        language: str,
+        matches: Optional[List[PhraseMatch]] = None
+    ) -> Intent:
         """Rule-based intent classification (fallback)"""
-        text_lower = text.lower()
-
-        # Greetings
-        greeting_words_ar = ["مرحبا", "السلام عليكم", "أهلا", "صباح الخير", "مساء الخير"]
-        greeting_words_en = ["hello", "hi", "good morning", "good evening"]
-
-        if language == "ar" and any(word in text_lower for word in greeting_words_ar):
-            return Intent(intent_type=IntentType.GREETING, confidence=0.95)
-        elif language == "en" and any(word in text_lower for word in greeting_words_en):
-            return Intent(intent_type=IntentType.GREETING, confidence=0.95)
-
-        # Order words
-        order_words_ar = ["أريد", "أطلب", "أحب", "ممكن", "أعطني"]
-        order_words_en = ["want", "order", "like", "get", "give me", "i'll have"]
-
-        if language == "ar" and any(word in text_lower for word in order_words_ar):
-            return Intent(intent_type=IntentType.ORDER_ITEM, confidence=0.85)
-        elif language == "en" and any(word in text_lower for word in order_words_en):
-            return Intent(intent_type=IntentType.ORDER_ITEM, confidence=0.85)
+        if matches is None:
+            matches = self._match_phrases(text, language)
 
-        # Price query
-        if ("كم" in text_lower or "سعر" in text_lower or "price" in text_lower or "cost" in text_lower):
-            return Intent(intent_type=IntentType.QUERY_PRICE, confidence=0.90)
-
-        # Default to order if contains food-related words
-        food_words = ["burger", "برجر", "drink", "مشروب", "meal", "وجبة", "combo", "كومبو"]
-        if any(word in text_lower for word in food_words):
-            return Intent(intent_type=IntentType.ORDER_ITEM, confidence=0.70)
+        found = {match.action for match in matches}
+        for action, (intent_type, confidence) in RULE_INTENTS.items():
+            if action in found:
+                return Intent(intent_type=intent_type, confidence=confidence)
 
         return Intent(intent_type=IntentType.UNKNOWN, confidence=0.5)
 
-    async def _extract_slots_llm(self, text: str, language: str, intent_type: IntentType) -> List[Slot]:
-        """Extract slots using LLM"""
-        if not self.model:
-            return self._extract_slots_rules(text, language)
-
-        try:
-            prompt = self._build_slot_prompt(text, language, intent_type)
-
-            response = self.model(
-                prompt,
-                max_tokens=100,
-                temperature=0.1,
-                stop=["</slots>"]
-            )
-
-            result = response['choices'][0]['text'].strip()
-            return self._parse_slot_response(result)
-
-        except Exception as e:
-            logger.error("LLM slot extraction failed", error=str(e))
-            return self._extract_slots_rules(text, language)
-
     def _extract_slots_rules(self, text: str, language: str) -> List[Slot]:
         """Rule-based slot extraction (fallback)"""
         slots = []
@@ -312,84 +684,35 @@ class NLUService:
 
         return entities
 
-    def _build_intent_prompt(self, text: str, language: str, context: Optional[Dict]) -> str:
-        """Build prompt for intent classification"""
-        lang_name = "Arabic" if language == "ar" else "English"
-        return f"""Classify the intent of this {lang_name} text for a drive-thru restaurant.
-
-Text: "{text}"
-
-Available intents: order_item, modify_order, cancel_order, confirm_order, repeat, help, greeting, farewell, yes, no, query_price, query_availability, unknown
-
-Response format: <intent>intent_type confidence</intent>
-
-<intent>"""
+    def _build_nlu_prompt_prefix(self, language: str) -> str:
+        """
+        Build the static instruction part of the NLU prompt
 
-    def _build_slot_prompt(self, text: str, language: str, intent_type: IntentType) -> str:
-        """Build prompt for slot extraction"""
+        Depends only on the language, so its evaluated KV state is cached and
+        shared by every request in that language.
+        """
         lang_name = "Arabic" if language == "ar" else "English"
-        return f"""Extract slots from this {lang_name} text for intent: {intent_type.value}
-
-Text: "{text}"
-
-Available slots: item_name, quantity, size, temperature, addon, category
+        intents = ", ".join(t.value for t in IntentType)
+        slot_types = ", ".join(t.value for t in SlotType)
+        return f"""Classify the intent of {lang_name} text for a drive-thru restaurant and extract its slots.
 
-Response format: <slots>slot_type:value confidence; ...</slots>
+Available intents: {intents}
 
-<slots>"""
+Available slots: {slot_types}
 
-    def _parse_intent_response(self, response: str) -> Tuple[IntentType, float]:
-        """Parse LLM intent response"""
-        try:
-            parts = response.strip().split()
-            intent_str = parts[0]
-            confidence = float(parts[1]) if len(parts) > 1 else 0.8
-
-            try:
-                intent_type = IntentType(intent_str)
-            except ValueError:
-                intent_type = IntentType.UNKNOWN
-                confidence = 0.5
+Response format: {{"intent": intent_type, "confidence": 0-1, "slots": [{{"type": slot_type, "value": text, "confidence": 0-1}}]}}
 
-            return intent_type, confidence
-        except Exception:
-            return IntentType.UNKNOWN, 0.5
+"""
 
-    def _parse_slot_response(self, response: str) -> List[Slot]:
-        """Parse LLM slot response"""
-        slots = []
-        try:
-            for item in response.split(';'):
-                item = item.strip()
-                if ':' in item:
-                    parts = item.split(':')
-                    slot_type_str = parts[0].strip()
-                    rest = ':'.join(parts[1:])
-
-                    value_conf = rest.rsplit(' ', 1)
-                    value = value_conf[0].strip()
-                    confidence = float(value_conf[1]) if len(value_conf) > 1 else 0.8
-
-                    try:
-                        slot_type = SlotType(slot_type_str)
-                        slots.append(Slot(
-                            slot_type=slot_type,
-                            value=value,
-                            confidence=confidence
-                        ))
-                    except ValueError:
-                        pass
-        except Exception as e:
-            logger.warning("Failed to parse slot response", error=str(e))
+    def _build_nlu_prompt_suffix(self, text: str, context: Optional[Dict]) -> str:
+        """Build the per-utterance part of the NLU prompt"""
+        return f"""Text: "{text}"
 
-        return slots
+Response: """
 
     def _generate_clarification(self, intent: Intent, language: str) -> str:
         """Generate clarification question"""
-        if language == "ar":
-            return "عفواً، لم أفهم طلبك بوضوح. هل يمكنك إعادة الصياغة؟"
-        else:
-            return "Sorry, I didn't quite understand. Could you rephrase that?"
+        return CANNED_PROMPTS["ar" if language == "ar" else "en"]["clarification"]
 
 
 # Global NLU service instance
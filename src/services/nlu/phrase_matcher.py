@@ -0,0 +1,105 @@
+"""
+Compiled phrase matcher for rule-based NLU
+Finds every vocabulary phrase in an utterance with a single regex pass
+"""
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+# Conjunctions written attached to the next word in Arabic ("وألغي", "فكرر")
+ARABIC_PROCLITICS = "[وف]"
+
+
+@dataclass(frozen=True)
+class PhraseMatch:
+    """One vocabulary phrase found in the text"""
+    phrase: str
+    action: str
+    start: int
+    end: int
+
+
+class PhraseMatcher:
+    """
+    Multi-phrase matcher compiled into one regular expression
+
+    - Phrases are factored into a character trie and rendered as nested
+      alternations, so matching cost grows with phrase length rather than
+      with the number of phrases
+    - Matches are anchored on word boundaries ("no" does not match inside
+      "know"); where phrases overlap at a position the longest one wins
+    - Matching is case-insensitive and spans refer to the original text
+    - The matcher is immutable; build a new one when the vocabulary changes
+    """
+
+    def __init__(self, vocabulary: Dict[str, Iterable[str]], prefix: Optional[str] = None):
+        """
+        Args:
+            vocabulary: Action name -> phrases that signal it. A phrase listed
+                under several actions belongs to the first one.
+            prefix: Optional regex for attached particles allowed before a
+                phrase (e.g. ARABIC_PROCLITICS)
+        """
+        self._actions: Dict[str, str] = {}
+        for action, phrases in vocabulary.items():
+            for phrase in phrases:
+                key = phrase.strip().lower()
+                if key:
+                    self._actions.setdefault(key, action)
+
+        self._pattern = None
+        if self._actions:
+            prefix_pattern = f"(?:{prefix})?" if prefix else ""
+            self._pattern = re.compile(
+                rf"(?<!\w){prefix_pattern}({_trie_pattern(self._actions)})(?!\w)",
+                re.IGNORECASE
+            )
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    def match(self, text: str) -> List[PhraseMatch]:
+        """
+        Find all non-overlapping phrase matches
+
+        Args:
+            text: Utterance to scan
+
+        Returns:
+            Matches in text order
+        """
+        if self._pattern is None:
+            return []
+
+        matches = []
+        for m in self._pattern.finditer(text):
+            phrase = m.group(1).lower()
+            matches.append(PhraseMatch(
+                phrase=phrase,
+                action=self._actions[phrase],
+                start=m.start(1),
+                end=m.end(1)
+            ))
+        return matches
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """Render phrases as a prefix-factored regex that prefers longer matches"""
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # Greedy optional: the longer continuation is tried first
+            return f"(?:{body})?"
+        return body
+
+    return render(trie)
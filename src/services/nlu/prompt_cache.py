@@ -0,0 +1,105 @@
+"""
+llama.cpp prompt prefix cache
+Keeps the evaluated KV state of stable prompt prefixes so each request
+only evaluates its own utterance tokens
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List
+
+
+@dataclass
+class _PrefixState:
+    """Saved model state after evaluating one prefix"""
+    prefix: str
+    tokens: List[int]
+    state: Any
+
+
+class PromptPrefixCache:
+    """
+    LRU cache of llama.cpp states keyed by prompt prefix (e.g. per language)
+
+    Before a completion, `prepare` makes sure the model's KV cache starts
+    with the prefix tokens: it does nothing if the model already holds
+    them, restores the saved state if it holds another prefix, or evaluates
+    and saves the prefix on first use. llama.cpp then reuses the longest
+    matching token prefix, so only the per-request suffix is evaluated.
+
+    Not thread-safe; call from the thread that owns the model, together
+    with the completion that follows.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, _PrefixState]" = OrderedDict()
+
+        self.requests = 0
+        self.builds = 0
+        self.restores = 0
+        self.tokens_evaluated = 0  # Prefix tokens evaluated when building states
+        self.tokens_reused = 0  # Prefix tokens not re-evaluated thanks to the cache
+
+    def prepare(self, model: Any, key: Hashable, prefix: str) -> int:
+        """
+        Load the KV state for a prefix into the model (blocking)
+
+        Args:
+            model: llama_cpp.Llama instance
+            key: Cache key identifying the prefix variant
+            prefix: Prefix text; a changed prefix for the same key is rebuilt
+
+        Returns:
+            Number of prefix tokens available without evaluation
+        """
+        self.requests += 1
+        entry = self._entries.get(key)
+
+        if entry is None or entry.prefix != prefix:
+            tokens = model.tokenize(prefix.encode("utf-8"), add_bos=True)
+            model.reset()
+            model.eval(tokens)
+            entry = _PrefixState(prefix, tokens, model.save_state())
+            self._entries[key] = entry
+            self.builds += 1
+            self.tokens_evaluated += len(tokens)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+            if list(model._input_ids[:len(entry.tokens)]) != entry.tokens:
+                model.load_state(entry.state)
+                self.restores += 1
+            self.tokens_reused += len(entry.tokens)
+
+        return len(entry.tokens)
+
+    def clear(self) -> int:
+        """
+        Drop all saved states
+
+        Returns:
+            Number of states removed
+        """
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get prefix cache statistics
+
+        Returns:
+            State counts and prompt-eval token savings
+        """
+        total = self.tokens_evaluated + self.tokens_reused
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "requests": self.requests,
+            "builds": self.builds,
+            "restores": self.restores,
+            "prefix_tokens_evaluated": self.tokens_evaluated,
+            "prefix_tokens_saved": self.tokens_reused,
+            "prefix_savings_rate": self.tokens_reused / total if total else 0.0,
+        }
@@ -0,0 +1,193 @@
+"""
+NLU Result Cache
+Reuses NLU responses for repeated utterances, keyed on normalized text,
+language, branch and dialog state
+"""
+import re
+import time
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from src.config import settings
+from src.models.nlu import NLUResponse
+
+# Dialog-context fields that can change how an utterance is interpreted
+# ("yes" while confirming the order vs. while choosing a size)
+CONTEXT_KEY_FIELDS = ("state", "last_intent", "awaiting")
+
+# Arabic diacritics (tashkeel) and tatweel carry no meaning for NLU
+_ARABIC_MARKS = re.compile(r"[\u064B-\u065F\u0670\u0640]")
+_PUNCTUATION = re.compile(r"[^\w\s']+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_utterance(text: str) -> str:
+    """
+    Normalize an utterance for cache lookup
+
+    Folds case and Unicode compatibility forms, strips Arabic diacritics,
+    tatweel and punctuation, and collapses whitespace. Spelling (including
+    Arabic letter variants) is preserved since it can change the result.
+
+    Args:
+        text: Raw utterance
+
+    Returns:
+        Normalized text
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = _ARABIC_MARKS.sub("", text)
+    text = _PUNCTUATION.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class NLUResultCache:
+    """
+    LRU + TTL cache of NLU responses
+
+    - Keys combine normalized text, language, branch and CONTEXT_KEY_FIELDS
+    - Each branch has a generation number that is part of the key;
+      invalidating a branch bumps it, so its old entries can never be hit
+      again and simply age out of the LRU
+    - Generations are per process: NLUService resolves the branch keyword
+      index before each lookup, and the index's database stamp check
+      invalidates the branch when another worker changed its keywords
+    - Responses are copied in and out, so callers never share the cached
+      instance
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, NLUResponse]]" = OrderedDict()
+        self._generations: Dict[Optional[int], int] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.invalidations = 0
+
+    def make_key(
+        self,
+        text: str,
+        language: str,
+        branch_id: Optional[int],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Hashable:
+        """
+        Build the cache key for a request
+
+        Take the key before computing a response: it captures the branch
+        generation, so a result computed while the branch was invalidated
+        is stored under the old generation and never served.
+
+        Args:
+            text: Raw utterance
+            language: Language code
+            branch_id: Branch the utterance was spoken at
+            context: Dialog context
+
+        Returns:
+            Hashable cache key
+        """
+        context = context or {}
+        return (
+            normalize_utterance(text),
+            language,
+            branch_id,
+            self._generations.get(branch_id, 0),
+            tuple(str(context.get(field)) for field in CONTEXT_KEY_FIELDS),
+        )
+
+    def get(self, key: Hashable) -> Optional[NLUResponse]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Copy of the cached response, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, response = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return response.model_copy(deep=True)
+
+    def put(self, key: Hashable, response: NLUResponse) -> None:
+        """
+        Store a response
+
+        Args:
+            key: Key from make_key()
+            response: Response to cache
+        """
+        response = response.model_copy(deep=True)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_branch(self, branch_id: int) -> None:
+        """
+        Invalidate every cached response for a branch
+
+        Args:
+            branch_id: Branch whose keywords or menu changed
+        """
+        with self._lock:
+            self._generations[branch_id] = self._generations.get(branch_id, 0) + 1
+            self.invalidations += 1
+
+    def clear(self) -> int:
+        """
+        Drop all entries
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Size, hit/miss counters and hit rate
+        """
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# Global NLU result cache (shared with keyword and menu invalidation)
+nlu_result_cache = NLUResultCache(settings.nlu_cache_max_entries, settings.nlu_cache_ttl)
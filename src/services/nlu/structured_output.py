@@ -0,0 +1,81 @@
+"""
+Structured LLM output for NLU
+GBNF grammar for the joint intent-and-slots JSON answer and its parser
+"""
+import json
+from typing import List, Tuple
+
+from src.models.nlu import IntentType, SlotType, Intent, Slot
+
+
+def _literals(values: List[str]) -> str:
+    """GBNF alternation of JSON string literals"""
+    return " | ".join(f'"\\"{value}\\""' for value in values)
+
+
+def build_nlu_grammar() -> str:
+    """
+    Build the GBNF grammar for a joint NLU answer
+
+    The grammar only admits one compact JSON object of the form
+    {"intent": "...", "confidence": 0.9, "slots": [{"type": "...",
+    "value": "...", "confidence": 0.9}]}, with intent and slot types drawn
+    from IntentType and SlotType. Once the closing brace is produced only
+    end-of-sequence is allowed, so decoding stops as soon as the structure
+    is complete.
+
+    Returns:
+        Grammar text for LlamaGrammar.from_string
+    """
+    return "\n".join([
+        'root ::= "{" ws "\\"intent\\":" ws intent "," ws "\\"confidence\\":" ws confidence'
+        ' "," ws "\\"slots\\":" ws slots ws "}"',
+        f"intent ::= {_literals([t.value for t in IntentType])}",
+        'slots ::= "[" ws ( slot ( "," ws slot )* )? ws "]"',
+        'slot ::= "{" ws "\\"type\\":" ws slottype "," ws "\\"value\\":" ws string'
+        ' "," ws "\\"confidence\\":" ws confidence ws "}"',
+        f"slottype ::= {_literals([t.value for t in SlotType])}",
+        'string ::= "\\"" ( [^"\\\\\\n] | "\\\\" ["\\\\/nt] )* "\\""',
+        'confidence ::= "0" ( "." [0-9] [0-9]? )? | "1" ( ".0" )?',
+        "ws ::= [ ]?",
+    ])
+
+
+def parse_nlu_json(response: str) -> Tuple[Intent, List[Slot]]:
+    """
+    Parse a joint NLU answer
+
+    Args:
+        response: JSON text produced under build_nlu_grammar()
+
+    Returns:
+        Tuple of (intent, slots). Unknown intents map to UNKNOWN with
+        confidence 0.5 and unknown slot types are dropped.
+
+    Raises:
+        ValueError: If the response is not a JSON object
+    """
+    data = json.loads(response)
+    if not isinstance(data, dict):
+        raise ValueError("NLU response is not a JSON object")
+
+    try:
+        intent = Intent(
+            intent_type=IntentType(data.get("intent")),
+            confidence=float(data.get("confidence", 0.8))
+        )
+    except ValueError:
+        intent = Intent(intent_type=IntentType.UNKNOWN, confidence=0.5)
+
+    slots = []
+    for item in data.get("slots") or []:
+        try:
+            slots.append(Slot(
+                slot_type=SlotType(item["type"]),
+                value=str(item["value"]),
+                confidence=float(item.get("confidence", 0.8))
+            ))
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    return intent, slots
@@ -1,4 +1,16 @@
 """STT (Speech-to-Text) service module"""
 from .faster_whisper_service import FasterWhisperService, stt_service
+from .streaming import StreamingTranscriber, StreamingUpdate
+from .endpointing import UtteranceEndpointer, EndpointEvent, EndpointEventType
+from .batch_scheduler import TranscriptionBatchScheduler
 
-__all__ = ["FasterWhisperService", "stt_service"]
+__all__ = [
+    "FasterWhisperService",
+    "stt_service",
+    "StreamingTranscriber",
+    "StreamingUpdate",
+    "UtteranceEndpointer",
+    "EndpointEvent",
+    "EndpointEventType",
+    "TranscriptionBatchScheduler",
+]
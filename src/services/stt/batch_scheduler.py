@@ -0,0 +1,191 @@
+"""
+Cross-lane micro-batching scheduler for STT inference
+Collects utterances from concurrent lanes for a few milliseconds and runs
+them through the model as one batched encode/decode
+"""
+import time
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.config import settings
+from src.utils import logger, log_performance_metric
+
+
+@dataclass
+class _PendingTranscription:
+    """Utterance waiting for a batch slot"""
+    audio: np.ndarray
+    language: Optional[str]
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class TranscriptionBatchScheduler:
+    """
+    Micro-batching scheduler
+
+    - Waits at most `max_wait_ms` after the first pending utterance
+    - Dispatches as soon as `max_batch_size` utterances are pending
+    - Runs one batch at a time; utterances arriving meanwhile form the next
+      batch, so batch size adapts to load
+    - Fans results (or the batch error) back out to each waiting coroutine
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[np.ndarray], List[Optional[str]]], List[Any]],
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+        executor=None
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size or settings.stt_batch_max_size
+        self.max_wait_ms = settings.stt_batch_max_wait_ms if max_wait_ms is None else max_wait_ms
+        self.executor = executor
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.batches_run = 0
+        self.items_processed = 0
+        self.batch_size_histogram: Counter = Counter()
+        self.max_queue_depth = 0
+        self.total_queue_wait_ms = 0.0
+        self.last_batch_latency_ms: Optional[float] = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of utterances waiting for a batch"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def submit(self, audio: np.ndarray, language: Optional[str] = None) -> Any:
+        """
+        Queue one utterance and wait for its result
+
+        Args:
+            audio: Float32 mono audio
+            language: Optional language hint
+
+        Returns:
+            The batch function's result for this utterance
+        """
+        self._ensure_worker()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_PendingTranscription(audio, language, future))
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+
+        return await future
+
+    async def shutdown(self) -> None:
+        """Stop the dispatcher and fail anything still queued"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        while self._queue is not None and not self._queue.empty():
+            pending = self._queue.get_nowait()
+            if not pending.future.done():
+                pending.future.set_exception(RuntimeError("STT scheduler stopped"))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler metrics
+
+        Returns:
+            Queue depth and batch size statistics
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "batches_run": self.batches_run,
+            "items_processed": self.items_processed,
+            "avg_batch_size": (
+                self.items_processed / self.batches_run if self.batches_run else 0.0
+            ),
+            "batch_size_histogram": {
+                str(size): count for size, count in sorted(self.batch_size_histogram.items())
+            },
+            "avg_queue_wait_ms": (
+                self.total_queue_wait_ms / self.items_processed if self.items_processed else 0.0
+            ),
+            "last_batch_latency_ms": self.last_batch_latency_ms,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+        }
+
+    def _ensure_worker(self) -> None:
+        """Start the dispatcher lazily on the running event loop"""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._dispatch_loop())
+
+    async def _dispatch_loop(self) -> None:
+        """Collect pending utterances into batches and run them"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.max_wait_ms / 1000
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._run_batch(batch)
+
+    async def _run_batch(self, batch: List[_PendingTranscription]) -> None:
+        """Run one batch in the executor and fan results back out"""
+        start_time = time.monotonic()
+        for pending in batch:
+            self.total_queue_wait_ms += (start_time - pending.enqueued_at) * 1000
+
+        try:
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(
+                self.executor,
+                self.batch_fn,
+                [pending.audio for pending in batch],
+                [pending.language for pending in batch]
+            )
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"STT batch returned {len(results)} results for {len(batch)} requests"
+                )
+            for pending, result in zip(batch, results):
+                if not pending.future.done():
+                    pending.future.set_result(result)
+
+        except Exception as e:
+            logger.error("STT batch failed", batch_size=len(batch), error=str(e))
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+
+        finally:
+            self.last_batch_latency_ms = (time.monotonic() - start_time) * 1000
+            self.batches_run += 1
+            self.items_processed += len(batch)
+            self.batch_size_histogram[len(batch)] += 1
+
+            log_performance_metric(
+                "stt",
+                "batch_latency",
+                self.last_batch_latency_ms,
+                unit="ms",
+                batch_size=len(batch),
+                queue_depth=self.queue_depth
+            )
@@ -0,0 +1,205 @@
+"""
+Utterance Endpointing
+Streaming VAD state machine that groups PCM frames into utterances so STT
+runs once per utterance instead of once per WebSocket frame
+"""
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, List, Optional
+
+import numpy as np
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+from src.config import settings
+from src.utils import logger
+
+
+class EndpointState(str, Enum):
+    """Endpointer states"""
+    SILENCE = "silence"
+    ONSET = "onset"
+    SPEECH = "speech"
+
+
+class EndpointEventType(str, Enum):
+    """Events emitted by the endpointer"""
+    SPEECH_START = "speech_start"
+    SPEECH_AUDIO = "speech_audio"
+    SPEECH_END = "speech_end"
+
+
+@dataclass
+class EndpointEvent:
+    """
+    Endpointer output
+
+    SPEECH_START carries the pre-roll and onset audio, SPEECH_AUDIO carries
+    one frame inside an utterance and SPEECH_END carries the full utterance.
+    """
+    type: EndpointEventType
+    audio: bytes = b""
+
+
+class UtteranceEndpointer:
+    """
+    Per-connection utterance endpointer
+
+    - Splits incoming 16-bit PCM into fixed VAD frames
+    - Requires `speech_start_ms` of consecutive speech to open an utterance
+    - Closes the utterance after `hangover_ms` of consecutive non-speech
+    - Keeps `pre_roll_ms` of audio before the onset so first phonemes survive
+    - Forces an endpoint after `max_utterance_ms`
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_ms: Optional[int] = None,
+        speech_start_ms: Optional[int] = None,
+        hangover_ms: Optional[int] = None,
+        max_utterance_ms: Optional[int] = None,
+        pre_roll_ms: Optional[int] = None,
+        use_vad: bool = True
+    ):
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms or settings.stt_vad_frame_ms
+        self.speech_start_ms = speech_start_ms or settings.stt_speech_start_ms
+        self.hangover_ms = hangover_ms or settings.stt_speech_hangover_ms
+        self.max_utterance_ms = max_utterance_ms or settings.stt_max_utterance_ms
+        pre_roll_ms = settings.stt_pre_roll_ms if pre_roll_ms is None else pre_roll_ms
+        self.energy_threshold = settings.stt_vad_energy_threshold
+
+        self.frame_bytes = int(sample_rate * self.frame_ms / 1000) * 2  # 16-bit PCM
+
+        self.vad: Optional[Any] = None
+        if use_vad and webrtcvad is not None:
+            self.vad = webrtcvad.Vad(settings.stt_vad_aggressiveness)
+
+        self.pre_roll = deque(maxlen=max(1, pre_roll_ms // self.frame_ms))
+        self.reset()
+
+    def reset(self) -> None:
+        """Return to silence and drop buffered audio"""
+        self.state = EndpointState.SILENCE
+        self.remainder = b""
+        self.onset_frames: List[bytes] = []
+        self.utterance: List[bytes] = []
+        self.speech_run_ms = 0
+        self.silence_run_ms = 0
+        self.pre_roll.clear()
+
+    def process(self, pcm: bytes) -> List[EndpointEvent]:
+        """
+        Feed raw 16-bit PCM and collect endpointing events
+
+        Args:
+            pcm: Raw audio bytes of any length
+
+        Returns:
+            Events produced by the complete frames in this chunk
+        """
+        data = self.remainder + pcm
+        usable = len(data) - (len(data) % self.frame_bytes)
+        self.remainder = data[usable:]
+
+        events: List[EndpointEvent] = []
+        for offset in range(0, usable, self.frame_bytes):
+            event = self._process_frame(data[offset:offset + self.frame_bytes])
+            if event is not None:
+                events.extend(event)
+        return events
+
+    def flush(self) -> Optional[EndpointEvent]:
+        """
+        Close the current utterance, e.g. when the client stops streaming
+
+        Returns:
+            SPEECH_END event if an utterance was open, None otherwise
+        """
+        event = None
+        if self.state == EndpointState.SPEECH:
+            event = self._end_utterance("flush")
+        self.reset()
+        return event
+
+    def _process_frame(self, frame: bytes) -> Optional[List[EndpointEvent]]:
+        """Advance the state machine by one VAD frame"""
+        is_speech = self._is_speech(frame)
+
+        if self.state == EndpointState.SILENCE:
+            if not is_speech:
+                self.pre_roll.append(frame)
+                return None
+            self.state = EndpointState.ONSET
+            self.onset_frames = [frame]
+            self.speech_run_ms = self.frame_ms
+            return self._maybe_start()
+
+        if self.state == EndpointState.ONSET:
+            if not is_speech:
+                # Too short to be speech (click, engine knock): back to silence
+                self.pre_roll.extend(self.onset_frames + [frame])
+                self.onset_frames = []
+                self.speech_run_ms = 0
+                self.state = EndpointState.SILENCE
+                return None
+            self.onset_frames.append(frame)
+            self.speech_run_ms += self.frame_ms
+            return self._maybe_start()
+
+        # SPEECH
+        self.utterance.append(frame)
+        self.silence_run_ms = 0 if is_speech else self.silence_run_ms + self.frame_ms
+        events = [EndpointEvent(EndpointEventType.SPEECH_AUDIO, frame)]
+
+        if self.silence_run_ms >= self.hangover_ms:
+            events.append(self._end_utterance("hangover"))
+        elif len(self.utterance) * self.frame_ms >= self.max_utterance_ms:
+            events.append(self._end_utterance("max_duration"))
+        return events
+
+    def _maybe_start(self) -> Optional[List[EndpointEvent]]:
+        """Open an utterance once the onset is long enough"""
+        if self.speech_run_ms < self.speech_start_ms:
+            return None
+
+        self.utterance = list(self.pre_roll) + self.onset_frames
+        self.pre_roll.clear()
+        self.onset_frames = []
+        self.silence_run_ms = 0
+        self.state = EndpointState.SPEECH
+        return [EndpointEvent(EndpointEventType.SPEECH_START, b"".join(self.utterance))]
+
+    def _end_utterance(self, reason: str) -> EndpointEvent:
+        """Close the utterance and return it"""
+        audio = b"".join(self.utterance)
+        logger.debug(
+            "Utterance endpoint detected",
+            reason=reason,
+            duration_ms=len(audio) / 2 / self.sample_rate * 1000
+        )
+        self.utterance = []
+        self.speech_run_ms = 0
+        self.silence_run_ms = 0
+        self.state = EndpointState.SILENCE
+        return EndpointEvent(EndpointEventType.SPEECH_END, audio)
+
+    def _is_speech(self, frame: bytes) -> bool:
+        """Classify a single frame as speech or non-speech"""
+        samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+        rms = float(np.sqrt(np.mean(samples ** 2))) / 32767.0
+        if rms < self.energy_threshold:
+            return False
+
+        if self.vad is not None:
+            try:
+                return self.vad.is_speech(frame, self.sample_rate)
+            except Exception as e:
+                logger.warning("VAD frame classification failed", error=str(e))
+
+        return True
@@ -3,18 +3,33 @@ Speech-to-Text (STT) Service using Faster Whisper
 Implements STT-001 to STT-003 requirements from Build Phase Plan
 """
 import time
+import zlib
 import asyncio
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, List, Dict, Any
 from pathlib import Path
 import numpy as np
 
 try:
     from faster_whisper import WhisperModel
+    from faster_whisper.tokenizer import Tokenizer
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+    import ctranslate2
 except ImportError:
     WhisperModel = None
+    Tokenizer = None
+    VadOptions = None
+    get_speech_timestamps = None
+    ctranslate2 = None
 
 from src.config import settings
-from src.utils import logger, log_service_event, log_performance_metric, log_error
+from src.utils import (
+    logger,
+    log_service_event,
+    log_performance_metric,
+    log_error,
+    AdmissionController
+)
 from src.models import (
     TranscriptionResponse,
     LanguageCode,
@@ -22,6 +37,28 @@ from src.models import (
     HealthCheckResponse,
     ModelInfo
 )
+from .batch_scheduler import TranscriptionBatchScheduler
+
+# Whisper decodes at most 30 seconds of audio per window
+MAX_BATCH_AUDIO_SAMPLES = 30 * 16000
+
+# Voice activity detection, shared by the single and batched paths
+VAD_PARAMETERS = dict(
+    threshold=0.5,
+    min_speech_duration_ms=250,
+    min_silence_duration_ms=100
+)
+
+# faster-whisper's transcribe() defaults, applied to batched results too
+NO_SPEECH_THRESHOLD = 0.6
+LOG_PROB_THRESHOLD = -1.0
+COMPRESSION_RATIO_THRESHOLD = 2.4
+
+
+def compression_ratio(text: str) -> float:
+    """gzip-style compression ratio; high values indicate repetitive (hallucinated) text"""
+    data = text.encode("utf-8")
+    return len(data) / len(zlib.compress(data)) if data else 0.0
 
 
 class FasterWhisperService:
@@ -33,6 +70,8 @@ class FasterWhisperService:
     - Arabic and English support
     - Metal acceleration on Mac Studio
     - Real-time audio streaming support
+    - Cross-lane micro-batching of concurrent utterances
+    - Admission control (bounded concurrency and wait queue)
     """
 
     def __init__(self):
@@ -42,6 +81,23 @@ class FasterWhisperService:
         self.compute_type = settings.stt_compute_type
         self.status = ServiceStatus.INITIALIZING
         self.load_time_ms: Optional[float] = None
+        self.num_workers = settings.stt_num_workers
+        self.admission = AdmissionController(
+            "stt",
+            max_concurrency=settings.stt_max_concurrency,
+            max_queue=settings.stt_max_queue
+        )
+        # Dedicated pool sized to the CTranslate2 workers so STT never
+        # competes with other blocking work in the default executor
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.num_workers,
+            thread_name_prefix="stt"
+        )
+        self.batching_enabled = settings.stt_batching_enabled
+        self.scheduler = TranscriptionBatchScheduler(
+            self._transcribe_batch_sync,
+            executor=self.executor
+        )
 
         log_service_event(
             "stt",
@@ -85,7 +141,7 @@ class FasterWhisperService:
                 device=self.device,
                 compute_type=self.compute_type,
                 download_root=str(models_dir),
-                num_workers=4  # Optimize for Mac Studio
+                num_workers=self.num_workers
             )
 
             self.load_time_ms = (time.time() - start_time) * 1000
@@ -135,6 +191,7 @@ class FasterWhisperService:
 
         Raises:
             RuntimeError: If model not initialized
+            ServiceSaturatedError: If the STT wait queue is full
             Exception: If transcription fails
         """
         if self.model is None or self.status != ServiceStatus.READY:
@@ -144,48 +201,37 @@ class FasterWhisperService:
 
         try:
             start_time = time.time()
-            self.status = ServiceStatus.PROCESSING
 
-            # Run transcription in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            segments, info = await loop.run_in_executor(
-                None,
-                lambda: self.model.transcribe(
-                    audio_data,
-                    language=language,
-                    beam_size=5,
-                    vad_filter=True,  # Voice Activity Detection
-                    vad_parameters=dict(
-                        threshold=0.5,
-                        min_speech_duration_ms=250,
-                        min_silence_duration_ms=100
+            async with self.admission.slot():
+                if self.batching_enabled:
+                    # Share one batched encode/decode with other lanes
+                    result = await self.scheduler.submit(audio_data, language)
+                else:
+                    # Run transcription in thread pool to avoid blocking
+                    loop = asyncio.get_event_loop()
+                    result = await loop.run_in_executor(
+                        self.executor,
+                        self._transcribe_sync,
+                        audio_data,
+                        language
                     )
-                )
-            )
-
-            # Combine all segments into full transcript
-            full_text = " ".join([segment.text for segment in segments])
 
             # Calculate latency
             latency_ms = (time.time() - start_time) * 1000
 
             # Determine detected language
-            detected_lang = LanguageCode.ARABIC if info.language == "ar" else LanguageCode.ENGLISH
+            detected_lang = LanguageCode.ARABIC if result["language"] == "ar" else LanguageCode.ENGLISH
 
-            # Get average confidence from segments
-            avg_confidence = np.mean([segment.avg_logprob for segment in segments])
             # Convert logprob to confidence score (approximate)
-            confidence = min(1.0, max(0.0, (avg_confidence + 1.0)))
-
-            self.status = ServiceStatus.READY
+            confidence = min(1.0, max(0.0, (result["avg_logprob"] + 1.0)))
 
             log_performance_metric(
                 "stt",
                 "transcription_latency",
                 latency_ms,
                 unit="ms",
-                text_length=len(full_text),
-                audio_duration=info.duration if hasattr(info, 'duration') else None
+                text_length=len(result["text"]),
+                audio_duration=result["duration"]
             )
 
             # Check if latency meets requirements (< 500ms)
@@ -197,28 +243,289 @@ class FasterWhisperService:
                 )
 
             return TranscriptionResponse(
-                text=full_text.strip(),
+                text=result["text"].strip(),
                 confidence=confidence,
                 language=detected_lang,
                 metadata={
                     "latency_ms": latency_ms,
-                    "audio_duration": info.duration if hasattr(info, 'duration') else None,
-                    "language_probability": info.language_probability,
-                    "num_segments": len(list(segments))
+                    "audio_duration": result["duration"],
+                    "language_probability": result["language_probability"],
+                    "num_segments": result["num_segments"],
+                    "batch_size": result.get("batch_size", 1)
                 }
             )
 
         except Exception as e:
-            self.status = ServiceStatus.ERROR
             log_error(
                 "stt",
                 "ERR-VOICE-003",
                 "STT transcription failed",
                 exception=e
             )
-            self.status = ServiceStatus.READY  # Reset to ready for retry
             raise
 
+    def _transcribe_sync(
+        self,
+        audio_data: np.ndarray,
+        language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Transcribe one utterance with the full decoding pipeline (blocking)
+
+        Args:
+            audio_data: Float32 mono audio
+            language: Optional language hint
+
+        Returns:
+            Raw transcription result dictionary
+        """
+        segments, info = self.model.transcribe(
+            audio_data,
+            language=language,
+            beam_size=5,
+            vad_filter=True,  # Voice Activity Detection
+            vad_parameters=VAD_PARAMETERS
+        )
+        segments = list(segments)
+
+        return {
+            "text": " ".join([segment.text for segment in segments]),
+            "language": info.language,
+            "language_probability": info.language_probability,
+            "avg_logprob": float(np.mean([s.avg_logprob for s in segments])) if segments else -1.0,
+            "duration": info.duration if hasattr(info, 'duration') else None,
+            "num_segments": len(segments),
+        }
+
+    def _transcribe_batch_sync(
+        self,
+        audios: List[np.ndarray],
+        languages: List[Optional[str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe several utterances with one batched encode/decode (blocking)
+
+        Utterances from different lanes are VAD-trimmed like the single
+        path, padded to a single 30 second window, encoded together and
+        decoded with one generate() call. Utterances with no speech get an
+        empty result. A batched result that the single path would reject
+        (low log-probability or repetitive text, which it retries at higher
+        temperatures) is re-decoded with _transcribe_sync, so batching never
+        changes which decoding rules apply. Single items and audio longer
+        than one Whisper window use per-utterance decoding directly.
+
+        Args:
+            audios: Float32 mono audio per utterance
+            languages: Optional language hint per utterance
+
+        Returns:
+            Raw transcription result dictionary per utterance
+        """
+        if (
+            len(audios) == 1
+            or Tokenizer is None
+            or any(len(audio) > MAX_BATCH_AUDIO_SAMPLES for audio in audios)
+        ):
+            return [
+                self._transcribe_sync(audio, language)
+                for audio, language in zip(audios, languages)
+            ]
+
+        outputs: List[Optional[Dict[str, Any]]] = [None] * len(audios)
+        speech = {}
+        for i, audio in enumerate(audios):
+            trimmed = self._vad_trim(audio)
+            if len(trimmed):
+                speech[i] = trimmed
+            else:
+                outputs[i] = self._empty_result(audio, languages[i], len(audios))
+
+        batch = list(speech)
+        if len(batch) < 2:
+            for i in batch:
+                outputs[i] = self._transcribe_sync(audios[i], languages[i])
+            return outputs
+
+        decoded = self._decode_batch([speech[i] for i in batch], [languages[i] for i in batch])
+        for i, result in zip(batch, decoded):
+            if result is None:
+                outputs[i] = self._transcribe_sync(audios[i], languages[i])
+            else:
+                result["duration"] = len(audios[i]) / 16000
+                result["batch_size"] = len(audios)
+                outputs[i] = result
+        return outputs
+
+    def _vad_trim(self, audio: np.ndarray) -> np.ndarray:
+        """Keep only the speech regions the single path's vad_filter would keep"""
+        chunks = get_speech_timestamps(audio, VadOptions(**VAD_PARAMETERS))
+        if not chunks:
+            return audio[:0]
+        return np.concatenate([audio[chunk["start"]:chunk["end"]] for chunk in chunks])
+
+    @staticmethod
+    def _empty_result(audio: np.ndarray, language: Optional[str], batch_size: int) -> Dict[str, Any]:
+        """Result for audio without speech, as the single path returns it"""
+        return {
+            "text": "",
+            "language": language or settings.default_language,
+            "language_probability": 1.0 if language else 0.0,
+            "avg_logprob": -1.0,
+            "duration": len(audio) / 16000,
+            "num_segments": 0,
+            "batch_size": batch_size,
+        }
+
+    def _decode_batch(
+        self,
+        audios: List[np.ndarray],
+        languages: List[Optional[str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Encode and decode VAD-trimmed utterances in one batch
+
+        Args:
+            audios: Speech-only audio per utterance
+            languages: Optional language hint per utterance
+
+        Returns:
+            Raw result per utterance, or None where the single path's
+            temperature fallback would have been needed
+        """
+        extractor = self.model.feature_extractor
+        n_frames = extractor.nb_max_frames
+        features = []
+        for audio in audios:
+            mel = extractor(audio)[:, :n_frames]
+            if mel.shape[1] < n_frames:
+                mel = np.pad(mel, ((0, 0), (0, n_frames - mel.shape[1])))
+            features.append(mel)
+
+        batch_features = ctranslate2.StorageView.from_array(
+            np.ascontiguousarray(np.stack(features), dtype=np.float32)
+        )
+        encoder_output = self.model.model.encode(batch_features)
+
+        # Detect language only for utterances without a hint
+        resolved = list(languages)
+        probabilities = [1.0 if language else 0.0 for language in languages]
+        if any(language is None for language in languages):
+            detections = self.model.model.detect_language(encoder_output)
+            for i, language in enumerate(languages):
+                if language is None:
+                    token, probability = detections[i][0]
+                    resolved[i] = token[2:-2]  # "<|ar|>" -> "ar"
+                    probabilities[i] = probability
+
+        tokenizers = [
+            Tokenizer(
+                self.model.hf_tokenizer,
+                self.model.model.is_multilingual,
+                task="transcribe",
+                language=language
+            )
+            for language in resolved
+        ]
+        # Timestamped decoding, as the single path uses
+        prompts = [list(tokenizer.sot_sequence) for tokenizer in tokenizers]
+
+        results = self.model.model.generate(
+            encoder_output,
+            prompts,
+            beam_size=5,
+            max_length=448,
+            return_scores=True,
+            return_no_speech_prob=True,
+            suppress_blank=True,
+            suppress_tokens=[-1]
+        )
+
+        outputs: List[Optional[Dict[str, Any]]] = []
+        for i, result in enumerate(results):
+            tokenizer = tokenizers[i]
+            # Drops timestamp tokens, which sort after end-of-text
+            tokens = [t for t in result.sequences_ids[0] if t < tokenizer.eot]
+            text = tokenizer.decode(tokens)
+            avg_logprob = float(result.scores[0])
+
+            if result.no_speech_prob > NO_SPEECH_THRESHOLD and avg_logprob < LOG_PROB_THRESHOLD:
+                outputs.append(self._empty_result(audios[i], resolved[i], len(audios)))
+            elif avg_logprob < LOG_PROB_THRESHOLD or compression_ratio(text) > COMPRESSION_RATIO_THRESHOLD:
+                outputs.append(None)
+            else:
+                outputs.append({
+                    "text": text,
+                    "language": resolved[i],
+                    "language_probability": probabilities[i],
+                    "avg_logprob": avg_logprob,
+                    "num_segments": 1,
+                })
+        return outputs
+
+    async def transcribe_words(
+        self,
+        audio_data: np.ndarray,
+        language: Optional[str] = None,
+        initial_prompt: Optional[str] = None
+    ) -> Tuple[List[Tuple[float, float, str, float]], Optional[str]]:
+        """
+        Decode audio into timestamped words for incremental streaming
+
+        Uses a cheap decoding configuration (small beam, no VAD, no
+        conditioning on previous windows) since the same tail is re-decoded
+        several times while the customer is speaking.
+
+        Args:
+            audio_data: Audio data as float32 numpy array (16kHz mono)
+            language: Optional language hint ('ar' or 'en')
+            initial_prompt: Already-confirmed text used as decoding context
+
+        Returns:
+            Tuple of (words, detected_language) where each word is
+            (start_seconds, end_seconds, text, probability)
+
+        Raises:
+            RuntimeError: If model not initialized
+            ServiceSaturatedError: If the STT wait queue is full
+        """
+        if self.model is None or self.status != ServiceStatus.READY:
+            error_msg = "STT model not initialized"
+            log_error("stt", "ERR-VOICE-002", error_msg)
+            raise RuntimeError(error_msg)
+
+        def _decode():
+            segments, info = self.model.transcribe(
+                audio_data,
+                language=language,
+                beam_size=settings.stt_streaming_beam_size,
+                word_timestamps=True,
+                condition_on_previous_text=False,
+                initial_prompt=initial_prompt,
+                vad_filter=False
+            )
+            words = [
+                (word.start, word.end, word.word, word.probability)
+                for segment in segments
+                for word in (segment.words or [])
+            ]
+            return words, info.language
+
+        start_time = time.time()
+        async with self.admission.slot():
+            loop = asyncio.get_event_loop()
+            words, detected_language = await loop.run_in_executor(self.executor, _decode)
+
+        log_performance_metric(
+            "stt",
+            "streaming_decode_latency",
+            (time.time() - start_time) * 1000,
+            unit="ms",
+            audio_duration=len(audio_data) / 16000,
+            words=len(words)
+        )
+
+        return words, detected_language
+
     async def transcribe_file(
         self,
         audio_file_path: str,
@@ -239,19 +546,20 @@ class FasterWhisperService:
 
         try:
             start_time = time.time()
-            self.status = ServiceStatus.PROCESSING
 
-            # Run transcription in thread pool
-            loop = asyncio.get_event_loop()
-            segments, info = await loop.run_in_executor(
-                None,
-                lambda: self.model.transcribe(
+            def _transcribe_file():
+                segments, info = self.model.transcribe(
                     audio_file_path,
                     language=language,
                     beam_size=5,
                     vad_filter=True
                 )
-            )
+                return list(segments), info
+
+            # Run transcription in thread pool
+            async with self.admission.slot():
+                loop = asyncio.get_event_loop()
+                segments, info = await loop.run_in_executor(self.executor, _transcribe_file)
 
             full_text = " ".join([segment.text for segment in segments])
             latency_ms = (time.time() - start_time) * 1000
@@ -259,11 +567,9 @@ class FasterWhisperService:
             detected_lang = LanguageCode.ARABIC if info.language == "ar" else LanguageCode.ENGLISH
 
             # Approximate confidence from logprobs
-            avg_confidence = np.mean([segment.avg_logprob for segment in segments])
+            avg_confidence = np.mean([segment.avg_logprob for segment in segments]) if segments else -1.0
             confidence = min(1.0, max(0.0, (avg_confidence + 1.0)))
 
-            self.status = ServiceStatus.READY
-
             log_performance_metric(
                 "stt",
                 "file_transcription_latency",
@@ -283,9 +589,7 @@ class FasterWhisperService:
             )
 
         except Exception as e:
-            self.status = ServiceStatus.ERROR
             log_error("stt", "ERR-VOICE-003", "File transcription failed", exception=e)
-            self.status = ServiceStatus.READY
             raise
 
     async def health_check(self) -> HealthCheckResponse:
@@ -303,15 +607,18 @@ class FasterWhisperService:
                     error_message="Model not loaded"
                 )
 
-            # Perform quick test transcription
-            start_time = time.time()
-            # Create silent audio for test (1 second of silence)
-            test_audio = np.zeros(16000, dtype=np.float32)
+            # Under load, report saturation instead of adding a probe request
+            latency_ms = None
+            if not self.admission.saturated:
+                # Perform quick test transcription
+                start_time = time.time()
+                # Create silent audio for test (1 second of silence)
+                test_audio = np.zeros(16000, dtype=np.float32)
 
-            # Run quick test
-            await self.transcribe(test_audio, sample_rate=16000)
+                # Run quick test
+                await self.transcribe(test_audio, sample_rate=16000)
 
-            latency_ms = (time.time() - start_time) * 1000
+                latency_ms = (time.time() - start_time) * 1000
 
             return HealthCheckResponse(
                 service_name="stt",
@@ -320,7 +627,11 @@ class FasterWhisperService:
                 metadata={
                     "model_size": self.model_size,
                     "device": self.device,
-                    "load_time_ms": self.load_time_ms
+                    "load_time_ms": self.load_time_ms,
+                    "num_workers": self.num_workers,
+                    "admission": self.admission.get_stats(),
+                    "batching_enabled": self.batching_enabled,
+                    "batching": self.scheduler.get_stats()
                 }
             )
 
@@ -351,6 +662,8 @@ class FasterWhisperService:
     async def shutdown(self) -> None:
         """Shutdown the STT service"""
         log_service_event("stt", "shutdown", "Shutting down STT service")
+        await self.scheduler.shutdown()
+        self.executor.shutdown(wait=False)
         self.model = None
         self.status = ServiceStatus.STOPPED
 
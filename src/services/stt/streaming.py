@@ -0,0 +1,209 @@
+"""
+Incremental Streaming STT
+Keeps a rolling per-connection audio window, re-decodes only the unconfirmed
+tail and commits words once consecutive decodes agree on them
+"""
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.config import settings
+from src.utils import logger
+
+# (start_seconds, end_seconds, text) in absolute stream time
+Word = Tuple[float, float, str]
+
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
+
+@dataclass
+class StreamingUpdate:
+    """Transcript delta produced by one decode of the streaming window"""
+    final_text: str = ""
+    partial_text: str = ""
+    committed_text: str = ""
+    language: Optional[str] = None
+
+
+class StreamingTranscriber:
+    """
+    Per-connection incremental transcriber
+
+    Uses a LocalAgreement commit policy:
+    - Audio is appended to a rolling window
+    - The window is re-decoded once enough new audio has arrived
+    - The longest word prefix shared by two consecutive decodes is stable
+      and gets committed (emitted as final)
+    - Committed audio is trimmed from the window so later decodes only
+      cover the unconfirmed tail
+    """
+
+    def __init__(
+        self,
+        stt,
+        language: Optional[str] = None,
+        sample_rate: int = 16000,
+        min_chunk_ms: Optional[int] = None,
+        max_window_s: Optional[float] = None
+    ):
+        self.stt = stt
+        self.language = language
+        self.sample_rate = sample_rate
+        min_chunk_ms = min_chunk_ms or settings.stt_streaming_min_chunk_ms
+        max_window_s = max_window_s or settings.stt_streaming_max_window_s
+        self.min_chunk_samples = int(sample_rate * min_chunk_ms / 1000)
+        self.max_window_samples = int(sample_rate * max_window_s)
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all audio and transcript state"""
+        self.audio = np.zeros(0, dtype=np.float32)
+        self.window_offset = 0.0  # Absolute time of self.audio[0]
+        self.pending_samples = 0
+        self.committed: List[Word] = []
+        self.last_committed_end = 0.0
+        self.hypothesis: List[Word] = []  # Unconfirmed words from previous decode
+        self.detected_language: Optional[str] = self.language
+
+    @property
+    def committed_text(self) -> str:
+        """All text confirmed so far"""
+        return self._join(self.committed)
+
+    async def insert_audio(self, chunk: np.ndarray) -> Optional[StreamingUpdate]:
+        """
+        Append audio and re-decode the tail if enough new audio arrived
+
+        Args:
+            chunk: Float32 mono audio normalized to [-1, 1]
+
+        Returns:
+            StreamingUpdate if a decode ran, None otherwise
+        """
+        self.audio = np.concatenate([self.audio, chunk.astype(np.float32)])
+        self.pending_samples += len(chunk)
+
+        if self.pending_samples < self.min_chunk_samples:
+            return None
+
+        self.pending_samples = 0
+        return await self._process()
+
+    async def finish(self) -> StreamingUpdate:
+        """
+        Commit everything that is left at the end of an utterance
+
+        Returns:
+            StreamingUpdate whose final_text holds the remaining words
+        """
+        words = self.hypothesis
+        if len(self.audio) > 0:
+            words = self._drop_overlap(await self._decode())
+
+        self._commit(words)
+        update = StreamingUpdate(
+            final_text=self._join(words),
+            committed_text=self.committed_text,
+            language=self.detected_language
+        )
+        self.reset()
+        return update
+
+    async def _process(self) -> StreamingUpdate:
+        """Decode the window and commit the prefix agreed with the last decode"""
+        words = self._drop_overlap(await self._decode())
+        stable = self._agreed_prefix(self.hypothesis, words)
+        self.hypothesis = words[len(stable):]
+
+        if not stable and len(self.audio) > self.max_window_samples:
+            # No agreement inside the window: force-commit to bound decode cost
+            stable, self.hypothesis = self.hypothesis, []
+            if not stable:
+                self._trim_window(
+                    self.window_offset
+                    + (len(self.audio) - self.min_chunk_samples) / self.sample_rate
+                )
+
+        self._commit(stable)
+
+        return StreamingUpdate(
+            final_text=self._join(stable),
+            partial_text=self._join(self.hypothesis),
+            committed_text=self.committed_text,
+            language=self.detected_language
+        )
+
+    async def _decode(self) -> List[Word]:
+        """Decode the current window into absolute-time words"""
+        prompt = self.committed_text[-200:] or None
+        raw_words, language = await self.stt.transcribe_words(
+            self.audio,
+            language=self.language,
+            initial_prompt=prompt
+        )
+        if language and not self.language:
+            self.detected_language = language
+
+        words = []
+        for start, end, text, _probability in raw_words:
+            start += self.window_offset
+            end += self.window_offset
+            text = text.strip()
+            # Skip words belonging to audio that was already committed
+            if not text or start < self.last_committed_end - 0.1:
+                continue
+            words.append((start, end, text))
+        return words
+
+    def _commit(self, words: List[Word]) -> None:
+        """Mark words as final and trim their audio from the window"""
+        if not words:
+            return
+        self.committed.extend(words)
+        self.last_committed_end = words[-1][1]
+        self._trim_window(self.last_committed_end)
+        logger.debug(
+            "Streaming words committed",
+            words=len(words),
+            window_s=len(self.audio) / self.sample_rate
+        )
+
+    def _trim_window(self, until: float) -> None:
+        """Drop window audio before the absolute time `until`"""
+        cut = int((until - self.window_offset) * self.sample_rate)
+        if cut <= 0:
+            return
+        cut = min(cut, len(self.audio))
+        self.audio = self.audio[cut:]
+        self.window_offset += cut / self.sample_rate
+
+    def _drop_overlap(self, words: List[Word]) -> List[Word]:
+        """Remove leading words that repeat the tail of the committed text"""
+        if not self.committed or not words:
+            return words
+
+        for n in range(min(len(self.committed), len(words), 5), 0, -1):
+            tail = [self._normalize(w[2]) for w in self.committed[-n:]]
+            head = [self._normalize(w[2]) for w in words[:n]]
+            if tail == head:
+                return words[n:]
+        return words
+
+    def _agreed_prefix(self, previous: List[Word], current: List[Word]) -> List[Word]:
+        """Longest word prefix on which two consecutive decodes agree"""
+        prefix = []
+        for old, new in zip(previous, current):
+            if self._normalize(old[2]) != self._normalize(new[2]):
+                break
+            prefix.append(new)
+        return prefix
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return _PUNCTUATION_PATTERN.sub("", text.lower()).strip()
+
+    @staticmethod
+    def _join(words: List[Word]) -> str:
+        return " ".join(w[2] for w in words)
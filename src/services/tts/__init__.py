@@ -1,4 +1,17 @@
 """TTS (Text-to-Speech) service module"""
 from .xtts_service import XTTSService, tts_service
+from .audio_cache import TTSAudioCache, CachedAudio
+from .disk_cache import TTSDiskCache
+from .text_segmenter import split_for_tts
+from .voice_presets import VoicePresetRegistry, VoiceLatents
 
-__all__ = ["XTTSService", "tts_service"]
+__all__ = [
+    "XTTSService",
+    "tts_service",
+    "TTSAudioCache",
+    "CachedAudio",
+    "TTSDiskCache",
+    "split_for_tts",
+    "VoicePresetRegistry",
+    "VoiceLatents",
+]
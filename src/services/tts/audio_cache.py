@@ -0,0 +1,129 @@
+"""
+TTS Audio Cache
+Byte-budgeted in-memory LRU cache for synthesized speech
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from src.utils import logger
+
+
+@dataclass(frozen=True)
+class CachedAudio:
+    """Synthesized audio with the metadata needed to answer a request"""
+    audio_data: bytes
+    duration: float
+    sample_rate: int
+    format: str = "wav"
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.audio_data)
+
+
+class TTSAudioCache:
+    """
+    LRU cache bounded by total audio bytes
+
+    - Hits move the entry to the most-recently-used end
+    - Inserts evict least-recently-used entries until the budget fits
+    - Entries larger than the whole budget are never stored
+    - Hit, miss and eviction counters for the health endpoint
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CachedAudio]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[CachedAudio]:
+        """
+        Look up cached audio
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CachedAudio if present, None otherwise
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: CachedAudio) -> bool:
+        """
+        Store audio, evicting least-recently-used entries as needed
+
+        Args:
+            key: Cache key
+            entry: Audio to cache
+
+        Returns:
+            True if the entry was stored
+        """
+        if entry.size_bytes > self.max_bytes:
+            logger.debug("TTS entry exceeds cache budget", key=key, size_bytes=entry.size_bytes)
+            return False
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous.size_bytes
+
+            while self._entries and self.current_bytes + entry.size_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.size_bytes
+                self.evictions += 1
+
+            self._entries[key] = entry
+            self.current_bytes += entry.size_bytes
+            return True
+
+    def clear(self) -> int:
+        """
+        Drop all entries
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self.current_bytes = 0
+            return count
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Size, budget and hit/miss/eviction counters
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
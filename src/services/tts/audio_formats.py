@@ -0,0 +1,204 @@
+"""
+TTS Audio Formats
+Converts canonical synthesized audio (mono 16-bit PCM at the model rate)
+into the format and sample rate a client asked for
+"""
+import io
+import wave
+from math import gcd
+from typing import Optional, Tuple
+
+import numpy as np
+
+try:
+    from scipy.signal import resample_poly
+except ImportError:
+    resample_poly = None
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
+
+from src.models import AudioFormat
+
+MEDIA_TYPES = {
+    AudioFormat.WAV: "audio/wav",
+    AudioFormat.PCM: "application/octet-stream",
+    AudioFormat.MULAW: "audio/basic",
+    AudioFormat.OGG: "audio/ogg",
+}
+
+FILE_EXTENSIONS = {
+    AudioFormat.WAV: "wav",
+    AudioFormat.PCM: "pcm",
+    AudioFormat.MULAW: "ulaw",
+    AudioFormat.OGG: "ogg",
+}
+
+# Formats that can be sent as independent chunks while streaming
+STREAMABLE_FORMATS = {AudioFormat.PCM, AudioFormat.MULAW}
+
+# G.711 is defined at 8 kHz
+MULAW_SAMPLE_RATE = 8000
+
+# Opus only encodes at these rates; others fall back to Vorbis
+_OPUS_RATES = {8000, 12000, 16000, 24000, 48000}
+
+_MULAW_BIAS = 0x84
+_MULAW_CLIP = 32635
+
+
+def pcm_to_wav(pcm: bytes, sample_rate: int) -> bytes:
+    """
+    Wrap mono 16-bit PCM in a WAV container
+
+    Args:
+        pcm: Little-endian int16 samples
+        sample_rate: Sample rate
+
+    Returns:
+        WAV file bytes
+    """
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def wav_to_pcm(audio_data: bytes) -> Tuple[bytes, int]:
+    """
+    Strip the WAV header
+
+    Args:
+        audio_data: WAV file bytes
+
+    Returns:
+        Tuple of (raw frames, sample rate)
+    """
+    with wave.open(io.BytesIO(audio_data), "rb") as wav:
+        return wav.readframes(wav.getnframes()), wav.getframerate()
+
+
+def pcm_duration(pcm: bytes, sample_rate: int) -> float:
+    """Exact duration of mono 16-bit PCM in seconds"""
+    return len(pcm) / 2 / sample_rate
+
+
+def resample_pcm(pcm: bytes, from_rate: int, to_rate: int) -> bytes:
+    """
+    Resample mono 16-bit PCM
+
+    Uses polyphase filtering when scipy is available, linear interpolation
+    otherwise.
+
+    Args:
+        pcm: Little-endian int16 samples
+        from_rate: Source sample rate
+        to_rate: Target sample rate
+
+    Returns:
+        Resampled PCM
+    """
+    if from_rate == to_rate or not pcm:
+        return pcm
+
+    samples = np.frombuffer(pcm, dtype="<i2").astype(np.float32)
+    if resample_poly is not None:
+        divisor = gcd(from_rate, to_rate)
+        resampled = resample_poly(samples, to_rate // divisor, from_rate // divisor)
+    else:
+        count = int(round(len(samples) * to_rate / from_rate))
+        positions = np.linspace(0, len(samples) - 1, count)
+        resampled = np.interp(positions, np.arange(len(samples)), samples)
+
+    return np.clip(np.round(resampled), -32768, 32767).astype("<i2").tobytes()
+
+
+def pcm_to_mulaw(pcm: bytes) -> bytes:
+    """
+    Encode mono 16-bit PCM as G.711 μ-law (one byte per sample)
+
+    Args:
+        pcm: Little-endian int16 samples
+
+    Returns:
+        μ-law bytes
+    """
+    samples = np.frombuffer(pcm, dtype="<i2").astype(np.int32)
+    sign = np.where(samples < 0, 0x80, 0)
+    magnitude = np.minimum(np.abs(samples), _MULAW_CLIP) + _MULAW_BIAS
+
+    exponent = np.floor(np.log2(magnitude)).astype(np.int32) - 7
+    exponent = np.clip(exponent, 0, 7)
+    mantissa = (magnitude >> (exponent + 3)) & 0x0F
+
+    return (~(sign | (exponent << 4) | mantissa) & 0xFF).astype(np.uint8).tobytes()
+
+
+def output_sample_rate(output_format: AudioFormat, requested: Optional[int], source_rate: int) -> int:
+    """
+    Sample rate a response will be delivered at
+
+    Args:
+        output_format: Requested format
+        requested: Requested sample rate, if any
+        source_rate: Rate of the canonical audio
+
+    Returns:
+        Output sample rate
+    """
+    if output_format == AudioFormat.MULAW:
+        return MULAW_SAMPLE_RATE
+    return requested or source_rate
+
+
+def encode_audio(
+    pcm: bytes,
+    source_rate: int,
+    output_format: AudioFormat,
+    sample_rate: Optional[int] = None
+) -> Tuple[bytes, int]:
+    """
+    Encode canonical PCM for a client
+
+    Args:
+        pcm: Mono little-endian int16 samples
+        source_rate: Sample rate of `pcm`
+        output_format: Requested format
+        sample_rate: Requested output rate (ignored for μ-law, which is 8 kHz)
+
+    Returns:
+        Tuple of (encoded bytes, output sample rate)
+
+    Raises:
+        RuntimeError: If OGG is requested and soundfile is not installed
+    """
+    target_rate = output_sample_rate(output_format, sample_rate, source_rate)
+    pcm = resample_pcm(pcm, source_rate, target_rate)
+
+    if output_format == AudioFormat.PCM:
+        return pcm, target_rate
+    if output_format == AudioFormat.MULAW:
+        return pcm_to_mulaw(pcm), target_rate
+    if output_format == AudioFormat.OGG:
+        return _encode_ogg(pcm, target_rate), target_rate
+    return pcm_to_wav(pcm, target_rate), target_rate
+
+
+def _encode_ogg(pcm: bytes, sample_rate: int) -> bytes:
+    """Compress PCM to Ogg (Opus where supported, Vorbis otherwise)"""
+    if sf is None:
+        raise RuntimeError("soundfile package not installed, OGG output unavailable")
+
+    subtype = "VORBIS"
+    if sample_rate in _OPUS_RATES and "OPUS" in sf.available_subtypes("OGG"):
+        subtype = "OPUS"
+
+    buffer = io.BytesIO()
+    samples = np.frombuffer(pcm, dtype="<i2")
+    sf.write(buffer, samples, sample_rate, format="OGG", subtype=subtype)
+    return buffer.getvalue()
@@ -0,0 +1,304 @@
+"""
+TTS Disk Cache
+Persistent, content-addressed audio cache shared by all workers on a host
+"""
+import os
+import mmap
+import struct
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from src.services.tts.audio_cache import CachedAudio
+from src.utils import logger
+
+# magic, version, sample_rate, duration, format
+_HEADER = struct.Struct("<4sBIf8s")
+_MAGIC = b"TTSC"
+_VERSION = 1
+_SUFFIX = ".tts"
+
+# Evict down to this fraction of the budget so eviction is not re-run per write
+_LOW_WATERMARK = 0.9
+
+# Temp files older than this were left by a crashed writer; younger ones may
+# still be in flight in another worker
+_STALE_TMP_SECONDS = 300
+
+
+class TTSDiskCache:
+    """
+    On-disk TTS cache tier
+
+    - One file per cache key (`<dir>/<key[:2]>/<key>.tts`): fixed binary
+      header followed by the encoded audio
+    - Reads are memory-mapped; hits refresh the file mtime for LRU ordering
+    - Writes go to a temp file in the same directory and are published with
+      os.replace, so readers never see a partial entry
+    - Size-based eviction (oldest mtime first) runs under an exclusive
+      flock so concurrent workers do not evict over each other
+    - Temp files orphaned by a crash mid-write are swept on startup
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock_path = self.directory / ".lock"
+
+        # Bytes on disk as last seen by this process; other workers also
+        # write, so this is reconciled by a directory scan during eviction
+        self._approx_bytes: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+
+        self.sweep_temp_files()
+
+    def get(self, key: str) -> Optional[CachedAudio]:
+        """
+        Read cached audio from disk
+
+        Args:
+            key: Cache key (hex digest)
+
+        Returns:
+            CachedAudio if present and valid, None otherwise
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    entry = self._decode(mm)
+        except (FileNotFoundError, ValueError):
+            # ValueError: empty file (mmap of length 0)
+            self.misses += 1
+            return None
+        except OSError as e:
+            self.errors += 1
+            self.misses += 1
+            logger.warning("TTS disk cache read failed", key=key, error=str(e))
+            return None
+
+        if entry is None:
+            logger.warning("Discarding corrupt TTS disk cache entry", key=key)
+            self._unlink(path)
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: CachedAudio) -> bool:
+        """
+        Atomically write audio to disk, evicting old entries if over budget
+
+        Args:
+            key: Cache key (hex digest)
+            entry: Audio to cache
+
+        Returns:
+            True if the entry was written
+        """
+        path = self._path(key)
+        size = _HEADER.size + entry.size_bytes
+        if size > self.max_bytes:
+            return False
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=_SUFFIX)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(self._encode_header(entry))
+                    f.write(entry.audio_data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                self._unlink(Path(tmp_path))
+                raise
+        except OSError as e:
+            self.errors += 1
+            logger.warning("TTS disk cache write failed", key=key, error=str(e))
+            return False
+
+        self.writes += 1
+        if self._approx_bytes is None:
+            self._approx_bytes = self._scan_size()
+        else:
+            self._approx_bytes += size
+
+        if self._approx_bytes > self.max_bytes:
+            self.evict()
+        return True
+
+    def evict(self) -> int:
+        """
+        Delete least-recently-used entries until under the low watermark
+
+        Returns:
+            Number of entries deleted
+        """
+        target = int(self.max_bytes * _LOW_WATERMARK)
+        removed = 0
+
+        with self._exclusive_lock():
+            files = self._scan()
+            total = sum(size for _, size, _ in files)
+
+            for path, size, _ in sorted(files, key=lambda f: f[2]):
+                if total <= target:
+                    break
+                if self._unlink(path):
+                    total -= size
+                    removed += 1
+
+            self._approx_bytes = total
+
+        self.evictions += removed
+        if removed:
+            logger.info("TTS disk cache evicted entries", removed=removed, bytes=total)
+        return removed
+
+    def clear(self) -> int:
+        """
+        Delete every cached entry
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._exclusive_lock():
+            removed = sum(1 for path, _, _ in self._scan() if self._unlink(path))
+            self._approx_bytes = 0
+        return removed
+
+    def sweep_temp_files(self, max_age_seconds: float = _STALE_TMP_SECONDS) -> int:
+        """
+        Delete temp files left behind by writers that died before os.replace
+
+        Args:
+            max_age_seconds: Only files not modified for this long are removed
+
+        Returns:
+            Number of temp files deleted
+        """
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+
+        with self._exclusive_lock():
+            for path in self.directory.glob(f"*/.tmp-*{_SUFFIX}"):
+                try:
+                    if path.stat().st_mtime > cutoff:
+                        continue
+                except FileNotFoundError:
+                    continue
+                if self._unlink(path):
+                    removed += 1
+
+        if removed:
+            logger.info("TTS disk cache removed stale temp files", removed=removed)
+        return removed
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get disk cache statistics
+
+        Returns:
+            Size, budget and hit/miss/write/eviction counters
+        """
+        lookups = self.hits + self.misses
+        return {
+            "directory": str(self.directory),
+            "approx_bytes": self._approx_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _path(self, key: str) -> Path:
+        """Shard entries by key prefix to keep directories small"""
+        return self.directory / key[:2] / f"{key}{_SUFFIX}"
+
+    @staticmethod
+    def _encode_header(entry: CachedAudio) -> bytes:
+        return _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            entry.sample_rate,
+            entry.duration,
+            entry.format.encode("ascii")[:8]
+        )
+
+    @staticmethod
+    def _decode(buffer: mmap.mmap) -> Optional[CachedAudio]:
+        """Parse header and payload; None if the file is not a valid entry"""
+        if len(buffer) < _HEADER.size:
+            return None
+        magic, version, sample_rate, duration, fmt = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            return None
+        return CachedAudio(
+            audio_data=buffer[_HEADER.size:],
+            duration=duration,
+            sample_rate=sample_rate,
+            format=fmt.rstrip(b"\x00").decode("ascii")
+        )
+
+    def _scan(self) -> List[Tuple[Path, int, float]]:
+        """List (path, size, mtime) for every entry on disk"""
+        files = []
+        for path in self.directory.glob(f"*/*{_SUFFIX}"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # Evicted by another worker
+            files.append((path, stat.st_size, stat.st_mtime))
+        return files
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._scan())
+
+    @contextmanager
+    def _exclusive_lock(self) -> Iterator[None]:
+        """Cross-process lock for eviction (no-op where flock is unavailable)"""
+        if fcntl is None:
+            yield
+            return
+
+        with open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _unlink(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
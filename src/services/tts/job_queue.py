@@ -0,0 +1,176 @@
+"""
+TTS Job Queue
+Priority-ordered admission to TTS synthesis with cancellation-safe waiting
+"""
+import time
+import heapq
+import asyncio
+import itertools
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional
+
+from src.utils import ServiceSaturatedError
+
+
+class TTSPriority(IntEnum):
+    """Synthesis priority (lower runs first)"""
+    LIVE = 0  # A customer is waiting for this audio
+    PREFETCH = 1  # Pre-rendering audio likely to be needed soon
+    WARMUP = 2  # Health probes and cache warming
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False, default_factory=time.time)
+
+
+class TTSJobQueue:
+    """
+    Priority scheduler for TTS synthesis
+
+    - At most `max_concurrency` jobs hold a slot at once
+    - Waiting jobs are granted slots by priority, then arrival order, so
+      live responses overtake queued prefetch and warmup work
+    - At most `max_queue` jobs wait; beyond that ServiceSaturatedError
+    - Cancelling a waiting job removes it from the queue immediately;
+      cancelling a running job releases its slot when the block exits
+    - A waiting job queued under a key can be moved to a more urgent
+      priority (e.g. a live caller joined a shared prefetch job)
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+
+        self._heap: List[_Waiter] = []
+        self._keyed: Dict[Hashable, _Waiter] = {}
+        self._seq = itertools.count()
+        self.running = 0
+        self.waiting = 0
+
+        self.admitted: Counter = Counter()
+        self.cancelled_waiting = 0
+        self.rejected = 0
+        self.raised = 0
+        self.total_wait_ms: Counter = Counter()
+
+    @property
+    def saturated(self) -> bool:
+        """Whether every slot is in use"""
+        return self.running >= self.max_concurrency
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: TTSPriority = TTSPriority.LIVE,
+        key: Optional[Hashable] = None
+    ) -> AsyncIterator[None]:
+        """
+        Hold one synthesis slot for the duration of the block
+
+        Args:
+            priority: Job priority
+            key: Identity of the job while it waits, for raise_priority()
+
+        Raises:
+            ServiceSaturatedError: If the wait queue is full
+        """
+        start_time = time.time()
+        priority = await self._acquire(priority, key)
+        self.admitted[priority.name] += 1
+        self.total_wait_ms[priority.name] += (time.time() - start_time) * 1000
+        try:
+            yield
+        finally:
+            self._release()
+
+    def raise_priority(self, key: Hashable, priority: TTSPriority) -> bool:
+        """
+        Move a waiting job to a more urgent priority
+
+        Args:
+            key: Key the job passed to slot()
+            priority: New priority
+
+        Returns:
+            True if a waiting job was re-prioritized
+        """
+        waiter = self._keyed.get(key)
+        if waiter is None or waiter.future.done() or int(priority) >= waiter.priority:
+            return False
+        waiter.priority = int(priority)
+        heapq.heapify(self._heap)
+        self.raised += 1
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics
+
+        Returns:
+            Running/waiting counts and per-priority admission and wait times
+        """
+        return {
+            "running": self.running,
+            "waiting": self.waiting,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "saturated": self.saturated,
+            "admitted": dict(self.admitted),
+            "avg_wait_ms": {
+                name: self.total_wait_ms[name] / count
+                for name, count in self.admitted.items() if count
+            },
+            "cancelled_waiting": self.cancelled_waiting,
+            "rejected": self.rejected,
+            "raised": self.raised,
+        }
+
+    async def _acquire(self, priority: TTSPriority, key: Optional[Hashable]) -> TTSPriority:
+        """Wait for a slot; returns the priority the job was admitted at"""
+        if self.running < self.max_concurrency and self.waiting == 0:
+            self.running += 1
+            return priority
+
+        if self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise ServiceSaturatedError(
+                f"tts saturated: {self.running} running, {self.waiting} waiting"
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = _Waiter(int(priority), next(self._seq), future)
+        heapq.heappush(self._heap, waiter)
+        if key is not None:
+            self._keyed[key] = waiter
+        self.waiting += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted just as we were cancelled; hand it on
+                self._release()
+            else:
+                self.waiting -= 1
+                self.cancelled_waiting += 1
+            raise
+        finally:
+            if key is not None and self._keyed.get(key) is waiter:
+                del self._keyed[key]
+        return TTSPriority(waiter.priority)
+
+    def _release(self) -> None:
+        self.running -= 1
+        while self._heap and self.running < self.max_concurrency:
+            waiter = heapq.heappop(self._heap)
+            if waiter.future.done():
+                continue  # Cancelled while waiting, already uncounted
+            self.waiting -= 1
+            self.running += 1
+            waiter.future.set_result(None)
@@ -0,0 +1,107 @@
+"""
+TTS Pre-rendering
+Warms the TTS cache with menu names and fixed prompts when a menu is published
+"""
+import time
+from itertools import chain
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.database import SessionLocal
+from src.models import TTSRequest, LanguageCode
+from src.services.menu.snapshot import menu_snapshots
+from src.services.nlu.nlu_service import CANNED_PROMPTS
+from src.services.tts.job_queue import TTSPriority
+from src.services.tts.xtts_service import tts_service
+from src.utils import logger, log_service_event, log_error, ServiceSaturatedError
+
+
+def collect_menu_phrases(db: Session, menu_id: int) -> List[Tuple[str, LanguageCode]]:
+    """
+    Collect every phrase worth pre-rendering for a menu
+
+    Args:
+        db: Database session
+        menu_id: Menu ID
+
+    Returns:
+        Unique (text, language) pairs: item, variant and add-on names in both
+        languages followed by the canned prompts
+    """
+    phrases: Dict[Tuple[str, LanguageCode], None] = {}
+    snapshot = menu_snapshots.get(db, menu_id)
+    if snapshot is not None:
+        # Snapshot add-ons include global ones (no item), which apply to every menu
+        nodes = chain(snapshot.items.values(), snapshot.variants.values(), snapshot.addons.values())
+        for node in nodes:
+            if node.name_ar:
+                phrases[(node.name_ar.strip(), LanguageCode.ARABIC)] = None
+            if node.name_en:
+                phrases[(node.name_en.strip(), LanguageCode.ENGLISH)] = None
+
+    for language, prompts in CANNED_PROMPTS.items():
+        for text in prompts.values():
+            phrases[(text, LanguageCode(language))] = None
+
+    return list(phrases)
+
+
+async def prerender_menu(menu_id: int) -> Dict[str, Any]:
+    """
+    Synthesize and cache TTS for a published menu
+
+    Runs as a background task after the publish response is sent, so it
+    opens its own database session. Phrases are rendered one at a time at
+    prefetch priority, so live requests always go first.
+
+    Args:
+        menu_id: Published menu ID
+
+    Returns:
+        Counts of rendered, already cached, and failed phrases
+    """
+    stats = {"menu_id": menu_id, "phrases": 0, "rendered": 0, "cached": 0, "failed": 0}
+
+    if not settings.tts_prerender_enabled or not tts_service.cache_enabled:
+        return stats
+
+    if tts_service.model is None:
+        logger.info("Skipping TTS pre-render, model not loaded", menu_id=menu_id)
+        return stats
+
+    db = SessionLocal()
+    try:
+        phrases = collect_menu_phrases(db, menu_id)
+    finally:
+        db.close()
+
+    stats["phrases"] = len(phrases)
+    start_time = time.time()
+
+    for text, language in phrases:
+        if tts_service.is_cached(text, language.value):
+            stats["cached"] += 1
+            continue
+
+        try:
+            await tts_service.generate_speech(
+                TTSRequest(text=text, language=language),
+                priority=TTSPriority.PREFETCH
+            )
+            stats["rendered"] += 1
+        except ServiceSaturatedError:
+            stats["failed"] += 1
+        except Exception as e:
+            stats["failed"] += 1
+            log_error("tts", "ERR-VOICE-004", "TTS pre-render failed", exception=e, text=text[:100])
+
+    log_service_event(
+        "tts",
+        "menu_prerendered",
+        f"Pre-rendered TTS for menu {menu_id}",
+        duration_ms=(time.time() - start_time) * 1000,
+        **stats
+    )
+    return stats
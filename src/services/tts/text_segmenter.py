@@ -0,0 +1,74 @@
+"""
+Text segmentation for streaming TTS
+Splits responses into sentences and clauses so synthesis can start on the
+first one while the rest are still pending
+"""
+import re
+from typing import List
+
+# Sentence terminators, including the Arabic question mark
+_SENTENCE_END = re.compile(r"(?<=[.!?؟…])\s+|\n+")
+
+# Clause separators, including the Arabic comma and semicolon
+_CLAUSE_END = re.compile(r"(?<=[,،;؛:])\s+")
+
+# Default segment bound; XTTS degrades (and truncates Arabic) on long inputs
+DEFAULT_MAX_CHARS = 160
+
+# Segments shorter than this are merged with the next one; very short
+# inputs synthesize poorly and cost a full decoder pass each
+DEFAULT_MIN_CHARS = 12
+
+
+def split_for_tts(
+    text: str,
+    max_chars: int = DEFAULT_MAX_CHARS,
+    min_chars: int = DEFAULT_MIN_CHARS
+) -> List[str]:
+    """
+    Split text into synthesis segments
+
+    Sentences are the primary unit. Sentences longer than `max_chars` are
+    split at clause separators, and clauses still too long are split at the
+    last word boundary before the limit.
+
+    Args:
+        text: Text to speak
+        max_chars: Maximum segment length
+        min_chars: Minimum segment length before merging with the next
+
+    Returns:
+        Non-empty segments in speaking order
+    """
+    pieces: List[str] = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if len(sentence) <= max_chars:
+            pieces.append(sentence)
+            continue
+        for clause in _CLAUSE_END.split(sentence):
+            pieces.extend(_split_words(clause.strip(), max_chars))
+
+    segments: List[str] = []
+    for piece in pieces:
+        if segments and len(segments[-1]) < min_chars and len(segments[-1]) + len(piece) < max_chars:
+            segments[-1] = f"{segments[-1]} {piece}"
+        else:
+            segments.append(piece)
+    return segments
+
+
+def _split_words(text: str, max_chars: int) -> List[str]:
+    """Hard-wrap text at word boundaries"""
+    chunks: List[str] = []
+    while len(text) > max_chars:
+        cut = text.rfind(" ", 0, max_chars)
+        if cut <= 0:
+            cut = max_chars
+        chunks.append(text[:cut].strip())
+        text = text[cut:].strip()
+    if text:
+        chunks.append(text)
+    return chunks
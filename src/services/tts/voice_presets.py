@@ -0,0 +1,217 @@
+"""
+XTTS Voice Presets
+Computes speaker conditioning latents once per reference recording and
+reuses them for every synthesis with that voice
+"""
+import os
+import time
+import hashlib
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+from src.utils import logger, log_performance_metric
+
+
+@dataclass(frozen=True)
+class VoiceLatents:
+    """XTTS conditioning for one reference voice"""
+    digest: str
+    gpt_cond_latent: Any
+    speaker_embedding: Any
+
+
+class VoicePresetRegistry:
+    """
+    Speaker latent cache
+
+    - Named presets map to reference WAV paths; a request may also pass a
+      raw `speaker_wav` path
+    - Latents are keyed by the SHA-256 of the reference file, so editing or
+      replacing the file invalidates them
+    - Cached in memory and persisted with torch.save under `cache_dir`
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        presets: Optional[Dict[str, str]] = None,
+        default_voice: Optional[str] = None
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.presets = dict(presets or {})
+        self.default_voice = default_voice
+
+        self._latents: Dict[str, VoiceLatents] = {}
+        self._digests: Dict[str, Tuple[int, int, str]] = {}  # path -> (mtime_ns, size, sha256)
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.computed = 0
+
+    def resolve(self, voice_config: Optional[Dict[str, Any]]) -> Optional[str]:
+        """
+        Resolve the reference recording for a request
+
+        Args:
+            voice_config: Request voice configuration ("voice" preset name or
+                "speaker_wav" path)
+
+        Returns:
+            Reference WAV path, or None if no voice applies
+
+        Raises:
+            ValueError: If a named preset is unknown
+        """
+        voice_config = voice_config or {}
+        if voice_config.get("speaker_wav"):
+            return voice_config["speaker_wav"]
+
+        name = voice_config.get("voice") or self.default_voice
+        if not name:
+            return None
+        if name not in self.presets:
+            raise ValueError(f"Unknown voice preset: {name}")
+        return self.presets[name]
+
+    def fingerprint(self, voice_config: Optional[Dict[str, Any]]) -> Optional[str]:
+        """
+        Content digest of the voice a request resolves to
+
+        Args:
+            voice_config: Request voice configuration
+
+        Returns:
+            SHA-256 of the reference file, or None if no voice applies
+        """
+        path = self.resolve(voice_config)
+        return self.reference_digest(path) if path else None
+
+    def reference_digest(self, path: str) -> str:
+        """
+        SHA-256 of a reference file, re-hashed only when its mtime or size changes
+
+        Args:
+            path: Reference WAV path
+
+        Returns:
+            Hex digest
+        """
+        stat = os.stat(path)
+        memo = self._digests.get(path)
+        if memo and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+            return memo[2]
+
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                sha.update(block)
+        digest = sha.hexdigest()
+        self._digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def get_latents(self, xtts: Any, path: str) -> VoiceLatents:
+        """
+        Get conditioning latents for a reference file (blocking)
+
+        Args:
+            xtts: Loaded XTTS model (synthesizer.tts_model)
+            path: Reference WAV path
+
+        Returns:
+            VoiceLatents from memory, disk, or freshly computed
+        """
+        digest = self.reference_digest(path)
+        latents = self._latents.get(digest)
+        if latents is not None:
+            self.memory_hits += 1
+            return latents
+
+        with self._lock:
+            latents = self._latents.get(digest)
+            if latents is not None:
+                self.memory_hits += 1
+                return latents
+
+            latents = self._load(digest, getattr(xtts, "device", "cpu"))
+            if latents is not None:
+                self.disk_hits += 1
+            else:
+                latents = self._compute(xtts, path, digest)
+                self.computed += 1
+                self._save(latents)
+
+            self._latents[digest] = latents
+            return latents
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get latent cache statistics
+
+        Returns:
+            Preset names and hit/compute counters
+        """
+        return {
+            "presets": sorted(self.presets),
+            "default_voice": self.default_voice,
+            "cached_voices": len(self._latents),
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "computed": self.computed,
+        }
+
+    def _compute(self, xtts: Any, path: str, digest: str) -> VoiceLatents:
+        start_time = time.time()
+        gpt_cond_latent, speaker_embedding = xtts.get_conditioning_latents(audio_path=[path])
+        log_performance_metric(
+            "tts",
+            "speaker_latents_computed",
+            (time.time() - start_time) * 1000,
+            unit="ms",
+            digest=digest[:12]
+        )
+        return VoiceLatents(digest, gpt_cond_latent, speaker_embedding)
+
+    def _path(self, digest: str) -> Path:
+        return self.cache_dir / f"{digest}.pt"
+
+    def _load(self, digest: str, device: Any) -> Optional[VoiceLatents]:
+        path = self._path(digest)
+        if torch is None or not path.exists():
+            return None
+        try:
+            data = torch.load(path, map_location=device)
+            return VoiceLatents(digest, data["gpt_cond_latent"], data["speaker_embedding"])
+        except Exception as e:
+            logger.warning("Discarding unreadable speaker latents", path=str(path), error=str(e))
+            return None
+
+    def _save(self, latents: VoiceLatents) -> None:
+        if torch is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-", suffix=".pt")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    torch.save(
+                        {
+                            "gpt_cond_latent": latents.gpt_cond_latent,
+                            "speaker_embedding": latents.speaker_embedding
+                        },
+                        f
+                    )
+                os.replace(tmp_path, self._path(latents.digest))
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except Exception as e:
+            logger.warning("Failed to persist speaker latents", digest=latents.digest, error=str(e))
@@ -6,7 +6,10 @@ import time
 import asyncio
 import io
 import hashlib
-from typing import Optional, Dict, Any
+import wave
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Tuple, List, AsyncIterator, Iterator, Callable
 from pathlib import Path
 import numpy as np
 
@@ -16,8 +19,29 @@ except ImportError:
     TTS = None
 
 from src.config import settings
-from src.utils import logger, log_service_event, log_performance_metric, log_error
+from src.utils import (
+    logger,
+    log_service_event,
+    log_performance_metric,
+    log_error,
+    SingleFlight
+)
+from src.services.tts.audio_cache import TTSAudioCache, CachedAudio
+from src.services.tts.disk_cache import TTSDiskCache
+from src.services.tts.text_segmenter import split_for_tts
+from src.services.tts.voice_presets import VoicePresetRegistry, VoiceLatents
+from src.services.tts.job_queue import TTSJobQueue, TTSPriority
+from src.services.tts.audio_formats import (
+    STREAMABLE_FORMATS,
+    encode_audio,
+    output_sample_rate,
+    pcm_duration,
+    pcm_to_wav,
+    resample_pcm,
+    wav_to_pcm
+)
 from src.models import (
+    AudioFormat,
     TTSRequest,
     TTSResponse,
     LanguageCode,
@@ -26,6 +50,9 @@ from src.models import (
     ModelInfo
 )
 
+# XTTS v2 native output rate
+XTTS_SAMPLE_RATE = 24000
+
 
 class XTTSService:
     """
@@ -35,8 +62,13 @@ class XTTSService:
     - Low latency (< 1s target)
     - Arabic and English support
     - High-quality, natural-sounding speech
-    - Voice cloning capabilities
-    - TTS output caching
+    - Voice cloning capabilities (speaker latents cached per reference file)
+    - Sentence-level streaming synthesis (low time-to-first-audio)
+    - WAV, raw PCM, G.711 μ-law and Ogg output at negotiable sample rates
+    - TTS output caching (in-memory LRU in front of a shared disk tier)
+    - Priority job queue (live ahead of prefetch/warmup, bounded wait queue)
+    - Cancellation when the customer barges in
+    - Coalescing of identical concurrent requests into one synthesis
     """
 
     def __init__(self):
@@ -45,8 +77,25 @@ class XTTSService:
         self.use_gpu = settings.tts_use_gpu
         self.status = ServiceStatus.INITIALIZING
         self.load_time_ms: Optional[float] = None
-        self.cache: Dict[str, bytes] = {}  # In-memory cache for TTS outputs
+        self.cache = TTSAudioCache(settings.tts_cache_max_bytes)  # In-memory LRU for TTS outputs
         self.cache_enabled = settings.enable_tts_caching
+        self.disk_cache: Optional[TTSDiskCache] = None  # Shared across workers, created on initialize
+        self.voices = VoicePresetRegistry(
+            Path(settings.models_cache_dir) / "voice_latents",
+            presets=settings.tts_voice_presets,
+            default_voice=settings.tts_default_voice
+        )
+        self.jobs = TTSJobQueue(
+            max_concurrency=settings.tts_max_concurrency,
+            max_queue=settings.tts_max_queue
+        )
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.tts_max_concurrency,
+            thread_name_prefix="tts"
+        )
+        self.inflight = SingleFlight("tts")
+        # Most urgent priority among the callers of each in-flight synthesis
+        self._job_priorities: Dict[str, TTSPriority] = {}
 
         log_service_event(
             "tts",
@@ -78,6 +127,12 @@ class XTTSService:
             models_dir = Path(settings.models_cache_dir)
             models_dir.mkdir(parents=True, exist_ok=True)
 
+            if self.cache_enabled and settings.tts_disk_cache_enabled:
+                self.disk_cache = TTSDiskCache(
+                    models_dir / "tts_cache",
+                    max_bytes=settings.tts_disk_cache_max_bytes
+                )
+
             log_service_event(
                 "tts",
                 "loading_model",
@@ -125,24 +180,109 @@ class XTTSService:
         voice_config: Optional[Dict[str, Any]] = None
     ) -> str:
         """Generate cache key for TTS request"""
-        cache_data = f"{text}:{language}:{str(voice_config)}"
+        try:
+            voice = self.voices.fingerprint(voice_config)
+        except (OSError, ValueError):
+            voice = None  # Synthesis reports the bad voice
+        cache_data = f"{text}:{language}:{str(voice_config)}:{voice}"
         return hashlib.md5(cache_data.encode()).hexdigest()
 
+    def is_cached(
+        self,
+        text: str,
+        language: str,
+        voice_config: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Check whether audio for a request is cached in memory or on disk
+
+        Does not read the entry or affect hit/miss counters.
+
+        Args:
+            text: Text to synthesize
+            language: Language code
+            voice_config: Optional voice configuration
+
+        Returns:
+            True if either cache tier holds the audio
+        """
+        cache_key = self._generate_cache_key(text, language, voice_config)
+        if cache_key in self.cache:
+            return True
+        return self.disk_cache is not None and cache_key in self.disk_cache
+
+    async def _cache_lookup(self, cache_key: str) -> Optional[CachedAudio]:
+        """
+        Look up audio in memory, then on disk (promoting disk hits to memory)
+
+        Args:
+            cache_key: Key from _generate_cache_key
+
+        Returns:
+            CachedAudio if found in either tier, None otherwise
+        """
+        cached = self.cache.get(cache_key)
+        if cached is not None or self.disk_cache is None:
+            return cached
+
+        loop = asyncio.get_event_loop()
+        cached = await loop.run_in_executor(None, self.disk_cache.get, cache_key)
+        if cached is not None:
+            self.cache.put(cache_key, cached)
+        return cached
+
+    async def _cache_store(self, cache_key: str, entry: CachedAudio) -> None:
+        """
+        Store audio in memory and write it through to disk
+
+        Args:
+            cache_key: Key from _generate_cache_key
+            entry: Synthesized audio
+        """
+        if self.cache.put(cache_key, entry):
+            logger.debug("TTS response cached", cache_key=cache_key)
+
+        if self.disk_cache is not None:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self.disk_cache.put, cache_key, entry)
+
+    @staticmethod
+    def _read_wav_info(audio_data: bytes) -> Tuple[float, int]:
+        """
+        Read duration and sample rate from a WAV header
+
+        Args:
+            audio_data: WAV file bytes
+
+        Returns:
+            Tuple of (duration in seconds, sample rate)
+        """
+        with wave.open(io.BytesIO(audio_data), "rb") as wav:
+            sample_rate = wav.getframerate()
+            return wav.getnframes() / float(sample_rate), sample_rate
+
     async def generate_speech(
         self,
-        tts_request: TTSRequest
+        tts_request: TTSRequest,
+        priority: TTSPriority = TTSPriority.LIVE
     ) -> TTSResponse:
         """
         Generate speech from text
 
+        Cancelling the calling task withdraws the request: queued work is
+        dropped at once, and running work stops when no other caller is
+        waiting for the same audio.
+
         Args:
             tts_request: TTS request with text and configuration
+            priority: Job priority
 
         Returns:
             TTSResponse with generated audio
 
         Raises:
             RuntimeError: If model not initialized
+            ServiceSaturatedError: If the TTS wait queue is full
             Exception: If speech generation fails
         """
         if self.model is None or self.status != ServiceStatus.READY:
@@ -150,29 +290,63 @@ class XTTSService:
             log_error("tts", "ERR-VOICE-002", error_msg)
             raise RuntimeError(error_msg)
 
+        cache_key = self._generate_cache_key(
+            tts_request.text,
+            tts_request.language.value,
+            tts_request.voice_config
+        )
+
         # Check cache first
         if self.cache_enabled:
-            cache_key = self._generate_cache_key(
-                tts_request.text,
-                tts_request.language.value,
-                tts_request.voice_config
-            )
-            if cache_key in self.cache:
+            cached = await self._cache_lookup(cache_key)
+            if cached is not None:
                 logger.debug(
                     "TTS cache hit",
                     cache_key=cache_key,
                     text_length=len(tts_request.text)
                 )
-                return TTSResponse(
-                    audio_data=self.cache[cache_key],
-                    duration=0.0,  # Duration not tracked for cached responses
-                    sample_rate=22050,
-                    format="wav"
-                )
+                return self._render(cached, tts_request)
+
+        # Identical concurrent requests share one synthesis, which waits at
+        # the most urgent priority among its callers so a live caller never
+        # queues behind the prefetch or warmup job it joined
+        current = self._job_priorities.get(cache_key)
+        if current is None or priority < current:
+            self._job_priorities[cache_key] = priority
+            self.jobs.raise_priority(cache_key, priority)
+        try:
+            canonical = await self.inflight.do(
+                cache_key,
+                lambda: self._synthesize(tts_request, cache_key, priority)
+            )
+        finally:
+            if cache_key not in self.inflight:
+                self._job_priorities.pop(cache_key, None)
+        return self._render(canonical, tts_request)
 
+    async def _synthesize(
+        self,
+        tts_request: TTSRequest,
+        cache_key: str,
+        priority: TTSPriority
+    ) -> CachedAudio:
+        """
+        Run XTTS for a request and cache the canonical audio
+
+        Args:
+            tts_request: TTS request with text and configuration
+            cache_key: Key from _generate_cache_key
+            priority: Job priority (raised if a more urgent caller joins)
+
+        Returns:
+            Canonical WAV at the model sample rate
+
+        Raises:
+            ServiceSaturatedError: If the TTS wait queue is full
+            Exception: If speech generation fails
+        """
         try:
             start_time = time.time()
-            self.status = ServiceStatus.PROCESSING
 
             # Extract voice configuration
             voice_config = tts_request.voice_config or {}
@@ -181,23 +355,38 @@ class XTTSService:
             # Convert language code to full name
             language = "Arabic" if tts_request.language == LanguageCode.ARABIC else "English"
 
-            # Generate speech in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-
             # Create temporary file for output
             temp_output = io.BytesIO()
 
-            # Run TTS generation
-            await loop.run_in_executor(
-                None,
-                lambda: self.model.tts_to_file(
-                    text=tts_request.text,
-                    file_path=temp_output,
-                    speaker_wav=voice_config.get("speaker_wav"),
-                    language=tts_request.language.value,
-                    speed=speed
-                )
-            )
+            # Run TTS generation in thread pool to avoid blocking
+            priority = self._job_priorities.get(cache_key, priority)
+            async with self.jobs.slot(priority, key=cache_key):
+                latents = await self._speaker_latents(voice_config)
+                if latents is not None:
+                    # Reuse cached conditioning instead of re-encoding the reference WAV
+                    wav = await self._run_blocking(
+                        lambda: self._xtts_model().inference(
+                            tts_request.text,
+                            tts_request.language.value,
+                            latents.gpt_cond_latent,
+                            latents.speaker_embedding,
+                            speed=speed,
+                            enable_text_splitting=True
+                        )["wav"]
+                    )
+                    temp_output.write(
+                        pcm_to_wav(self._float_to_pcm16(wav), self.output_sample_rate)
+                    )
+                else:
+                    await self._run_blocking(
+                        lambda: self.model.tts_to_file(
+                            text=tts_request.text,
+                            file_path=temp_output,
+                            speaker_wav=voice_config.get("speaker_wav"),
+                            language=tts_request.language.value,
+                            speed=speed
+                        )
+                    )
 
             # Get audio data
             audio_data = temp_output.getvalue()
@@ -205,12 +394,8 @@ class XTTSService:
             # Calculate latency
             latency_ms = (time.time() - start_time) * 1000
 
-            # Estimate duration (rough approximation)
-            # Typical speech rate is ~150 words per minute
+            duration, sample_rate = self._read_wav_info(audio_data)
             word_count = len(tts_request.text.split())
-            estimated_duration = (word_count / 150.0) * 60.0 / speed
-
-            self.status = ServiceStatus.READY
 
             log_performance_metric(
                 "tts",
@@ -230,25 +415,20 @@ class XTTSService:
                     target_ms=settings.tts_latency_target
                 )
 
-            # Cache the result if caching is enabled
-            if self.cache_enabled and len(self.cache) < 1000:  # Limit cache size
-                cache_key = self._generate_cache_key(
-                    tts_request.text,
-                    tts_request.language.value,
-                    tts_request.voice_config
-                )
-                self.cache[cache_key] = audio_data
-                logger.debug("TTS response cached", cache_key=cache_key)
-
-            return TTSResponse(
+            canonical = CachedAudio(
                 audio_data=audio_data,
-                duration=estimated_duration,
-                sample_rate=22050,  # XTTS v2 default sample rate
+                duration=duration,
+                sample_rate=sample_rate,
                 format="wav"
             )
 
+            # Cache the canonical audio if caching is enabled
+            if self.cache_enabled:
+                await self._cache_store(cache_key, canonical)
+
+            return canonical
+
         except Exception as e:
-            self.status = ServiceStatus.ERROR
             log_error(
                 "tts",
                 "ERR-VOICE-004",
@@ -256,47 +436,349 @@ class XTTSService:
                 exception=e,
                 text=tts_request.text[:100]  # Log first 100 chars
             )
-            self.status = ServiceStatus.READY  # Reset to ready for retry
             raise
 
+    def _render(self, audio: CachedAudio, tts_request: TTSRequest) -> TTSResponse:
+        """
+        Convert canonical (cached or synthesized) audio to the requested format
+
+        Args:
+            audio: Canonical WAV at the model sample rate
+            tts_request: Request with output format and sample rate
+
+        Returns:
+            TTSResponse with exact duration from the sample count
+        """
+        if tts_request.output_format == AudioFormat.WAV and tts_request.sample_rate in (None, audio.sample_rate):
+            return TTSResponse(
+                audio_data=audio.audio_data,
+                duration=audio.duration,
+                sample_rate=audio.sample_rate,
+                format=audio.format
+            )
+
+        pcm, source_rate = wav_to_pcm(audio.audio_data)
+        encoded, sample_rate = encode_audio(
+            pcm,
+            source_rate,
+            tts_request.output_format,
+            tts_request.sample_rate
+        )
+        return TTSResponse(
+            audio_data=encoded,
+            duration=pcm_duration(pcm, source_rate),
+            sample_rate=sample_rate,
+            format=tts_request.output_format.value
+        )
+
     async def generate_speech_streaming(
         self,
         text: str,
         language: LanguageCode,
-        voice_config: Optional[Dict[str, Any]] = None
-    ) -> bytes:
+        voice_config: Optional[Dict[str, Any]] = None,
+        output_format: AudioFormat = AudioFormat.PCM,
+        sample_rate: Optional[int] = None,
+        priority: TTSPriority = TTSPriority.LIVE
+    ) -> AsyncIterator[bytes]:
         """
-        Generate speech with streaming (placeholder for future implementation)
+        Generate speech incrementally
+
+        Text is split into sentences/clauses; each segment is served from the
+        cache or synthesized (with XTTS streaming inference when a speaker
+        reference is given) and its PCM is yielded as soon as it is ready.
+        Synthesis buffers the segment instead of waiting on the consumer, so
+        a slow client never holds a job slot; closing the generator (or
+        cancelling its consumer) stops synthesis at the next chunk. Output
+        that needs resampling or μ-law encoding is converted a whole segment
+        at a time.
 
         Args:
             text: Text to convert to speech
             language: Target language
             voice_config: Optional voice configuration
+            output_format: Chunk encoding (pcm_s16le or mulaw)
+            sample_rate: Output sample rate (defaults to `output_sample_rate`)
+            priority: Job priority for segments that need synthesis
 
-        Returns:
-            Audio data as bytes
+        Yields:
+            Audio chunks in the requested format
 
-        Note:
-            Streaming implementation would yield chunks of audio data
-            Current implementation returns complete audio
+        Raises:
+            RuntimeError: If model not initialized
+            ValueError: If the format cannot be streamed
+            ServiceSaturatedError: If the TTS wait queue is full
         """
-        request = TTSRequest(
-            text=text,
-            language=language,
-            voice_config=voice_config
+        if self.model is None or self.status != ServiceStatus.READY:
+            error_msg = "TTS model not initialized"
+            log_error("tts", "ERR-VOICE-002", error_msg)
+            raise RuntimeError(error_msg)
+
+        if output_format not in STREAMABLE_FORMATS:
+            raise ValueError(f"Format {output_format.value} cannot be streamed")
+
+        segments = split_for_tts(text)
+        start_time = time.time()
+        first_audio_ms: Optional[float] = None
+        total_bytes = 0
+        transcode = output_format != AudioFormat.PCM or sample_rate not in (None, self.output_sample_rate)
+
+        for segment in segments:
+            chunks = self._stream_segment(segment, language, voice_config, priority)
+            if transcode:
+                chunks = self._encode_segment(chunks, output_format, sample_rate)
+            async for chunk in chunks:
+                if first_audio_ms is None:
+                    first_audio_ms = (time.time() - start_time) * 1000
+                    log_performance_metric(
+                        "tts",
+                        "time_to_first_audio",
+                        first_audio_ms,
+                        unit="ms",
+                        segments=len(segments),
+                        language=language.value
+                    )
+                total_bytes += len(chunk)
+                yield chunk
+
+        bytes_per_sample = 1 if output_format == AudioFormat.MULAW else 2
+        log_performance_metric(
+            "tts",
+            "stream_total_latency",
+            (time.time() - start_time) * 1000,
+            unit="ms",
+            segments=len(segments),
+            audio_duration=total_bytes / bytes_per_sample / output_sample_rate(
+                output_format, sample_rate, self.output_sample_rate
+            ),
+            language=language.value
         )
-        response = await self.generate_speech(request)
-        return response.audio_data
 
-    def clear_cache(self) -> int:
+    @property
+    def output_sample_rate(self) -> int:
+        """Sample rate of synthesized audio"""
+        synthesizer = getattr(self.model, "synthesizer", None)
+        return getattr(synthesizer, "output_sample_rate", None) or XTTS_SAMPLE_RATE
+
+    async def _stream_segment(
+        self,
+        segment: str,
+        language: LanguageCode,
+        voice_config: Optional[Dict[str, Any]],
+        priority: TTSPriority
+    ) -> AsyncIterator[bytes]:
+        """Serve one segment from cache, or synthesize, stream and cache it"""
+        cache_key = None
+        if self.cache_enabled:
+            cache_key = self._generate_cache_key(segment, language.value, voice_config)
+            cached = await self._cache_lookup(cache_key)
+            if cached is not None:
+                pcm, rate = wav_to_pcm(cached.audio_data)
+                yield resample_pcm(pcm, rate, self.output_sample_rate)
+                return
+
+        # The producer owns the job slot and never waits on the consumer; the
+        # buffer is bounded by the segment, which split_for_tts keeps short
+        buffer: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        async def synthesize() -> List[bytes]:
+            chunks: List[bytes] = []
+            try:
+                async with self.jobs.slot(priority):
+                    async for chunk in self._synthesize_pcm(segment, language, voice_config or {}):
+                        chunks.append(chunk)
+                        buffer.put_nowait(chunk)
+            finally:
+                buffer.put_nowait(done)
+            return chunks
+
+        producer = asyncio.ensure_future(synthesize())
+        try:
+            while True:
+                chunk = await buffer.get()
+                if chunk is done:
+                    break
+                yield chunk
+            chunks = await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+            # Errors after the consumer left have nobody to report to
+            await asyncio.gather(producer, return_exceptions=True)
+
+        if cache_key is not None and chunks:
+            pcm = b"".join(chunks)
+            sample_rate = self.output_sample_rate
+            await self._cache_store(
+                cache_key,
+                CachedAudio(
+                    audio_data=pcm_to_wav(pcm, sample_rate),
+                    duration=pcm_duration(pcm, sample_rate),
+                    sample_rate=sample_rate,
+                    format="wav"
+                )
+            )
+
+    async def _encode_segment(
+        self,
+        chunks: AsyncIterator[bytes],
+        output_format: AudioFormat,
+        sample_rate: Optional[int]
+    ) -> AsyncIterator[bytes]:
+        """
+        Resample and encode a whole segment in one pass
+
+        Converting chunk by chunk would restart the resampling filter at
+        every chunk boundary and click.
+        """
+        pcm = b"".join([chunk async for chunk in chunks])
+        if pcm:
+            encoded, _ = encode_audio(pcm, self.output_sample_rate, output_format, sample_rate)
+            yield encoded
+
+    async def _synthesize_pcm(
+        self,
+        segment: str,
+        language: LanguageCode,
+        voice_config: Dict[str, Any]
+    ) -> AsyncIterator[bytes]:
+        """Synthesize one segment, chunk by chunk where the model supports it"""
+        speed = voice_config.get("speed", 1.0)
+        xtts = self._xtts_model()
+        latents = await self._speaker_latents(voice_config)
+
+        if latents is not None and hasattr(xtts, "inference_stream"):
+            def stream():
+                for chunk in xtts.inference_stream(
+                    segment,
+                    language.value,
+                    latents.gpt_cond_latent,
+                    latents.speaker_embedding,
+                    speed=speed
+                ):
+                    yield self._float_to_pcm16(chunk)
+
+            async for chunk in self._iterate_in_executor(stream):
+                yield chunk
+            return
+
+        if latents is not None:
+            wav = await self._run_blocking(
+                lambda: xtts.inference(
+                    segment,
+                    language.value,
+                    latents.gpt_cond_latent,
+                    latents.speaker_embedding,
+                    speed=speed
+                )["wav"]
+            )
+        else:
+            wav = await self._run_blocking(
+                lambda: self.model.tts(
+                    text=segment,
+                    speaker_wav=voice_config.get("speaker_wav"),
+                    language=language.value,
+                    speed=speed
+                )
+            )
+        yield self._float_to_pcm16(wav)
+
+    def _xtts_model(self) -> Optional[Any]:
+        """Underlying XTTS model when the loaded TTS exposes conditioning latents"""
+        xtts = getattr(getattr(self.model, "synthesizer", None), "tts_model", None)
+        return xtts if hasattr(xtts, "get_conditioning_latents") else None
+
+    async def _speaker_latents(self, voice_config: Optional[Dict[str, Any]]) -> Optional[VoiceLatents]:
+        """
+        Cached conditioning latents for the request's voice
+
+        Args:
+            voice_config: Request voice configuration
+
+        Returns:
+            VoiceLatents, or None if no voice applies or the model cannot use them
+        """
+        xtts = self._xtts_model()
+        if xtts is None:
+            return None
+        path = self.voices.resolve(voice_config)
+        if path is None:
+            return None
+
+        return await self._run_blocking(lambda: self.voices.get_latents(xtts, path))
+
+    async def _run_blocking(self, fn: Callable[[], Any]) -> Any:
+        """
+        Run a blocking model call on the TTS executor
+
+        A model call cannot be interrupted once started, so on cancellation
+        this waits for the thread to finish before propagating; the job slot
+        is therefore never released while the executor is still busy.
+        """
+        future = asyncio.get_event_loop().run_in_executor(self.executor, fn)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            await asyncio.wait([future])
+            raise
+
+    async def _iterate_in_executor(self, factory: Callable[[], Iterator[bytes]]) -> AsyncIterator[bytes]:
+        """
+        Drive a blocking generator on the TTS executor and yield its items
+
+        The producer stops at the next item once the consumer goes away.
+        """
+        loop = asyncio.get_event_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stopped = threading.Event()
+        done = object()
+
+        def produce():
+            try:
+                for item in factory():
+                    if stopped.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, item)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        producer = loop.run_in_executor(self.executor, produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stopped.set()
+            # Keep the job slot until the model is actually idle
+            await asyncio.shield(producer)
+
+    @staticmethod
+    def _float_to_pcm16(wav: Any) -> bytes:
+        """Convert float audio in [-1, 1] (list, array or tensor) to 16-bit PCM"""
+        if hasattr(wav, "cpu"):
+            wav = wav.squeeze().detach().cpu().numpy()
+        samples = np.clip(np.asarray(wav, dtype=np.float32), -1.0, 1.0)
+        return (samples * 32767).astype("<i2").tobytes()
+
+    def clear_cache(self, include_disk: bool = False) -> int:
         """
         Clear TTS cache
 
+        Args:
+            include_disk: Also delete the shared on-disk tier
+
         Returns:
             Number of cached items cleared
         """
-        cache_size = len(self.cache)
-        self.cache.clear()
+        cache_size = self.cache.clear()
+        if include_disk and self.disk_cache is not None:
+            cache_size += self.disk_cache.clear()
         log_service_event(
             "tts",
             "cache_cleared",
@@ -319,16 +801,19 @@ class XTTSService:
                     error_message="Model not loaded"
                 )
 
-            # Perform quick test generation
-            start_time = time.time()
-            test_request = TTSRequest(
-                text="مرحبا",  # "Hello" in Arabic
-                language=LanguageCode.ARABIC
-            )
+            # Under load, report saturation instead of adding a probe request
+            latency_ms = None
+            if not self.jobs.saturated:
+                # Perform quick test generation
+                start_time = time.time()
+                test_request = TTSRequest(
+                    text="مرحبا",  # "Hello" in Arabic
+                    language=LanguageCode.ARABIC
+                )
 
-            await self.generate_speech(test_request)
+                await self.generate_speech(test_request, priority=TTSPriority.WARMUP)
 
-            latency_ms = (time.time() - start_time) * 1000
+                latency_ms = (time.time() - start_time) * 1000
 
             return HealthCheckResponse(
                 service_name="tts",
@@ -338,7 +823,12 @@ class XTTSService:
                     "model_name": self.model_name,
                     "use_gpu": self.use_gpu,
                     "load_time_ms": self.load_time_ms,
-                    "cache_size": len(self.cache)
+                    "cache_size": len(self.cache),
+                    "cache": self.cache.get_stats(),
+                    "disk_cache": self.disk_cache.get_stats() if self.disk_cache else None,
+                    "job_queue": self.jobs.get_stats(),
+                    "voices": self.voices.get_stats(),
+                    "coalescing": self.inflight.get_stats()
                 }
             )
 
@@ -369,6 +859,7 @@ class XTTSService:
         """Shutdown the TTS service"""
         log_service_event("tts", "shutdown", "Shutting down TTS service")
         self.clear_cache()
+        self.executor.shutdown(wait=False)
         self.model = None
         self.status = ServiceStatus.STOPPED
 
@@ -0,0 +1 @@
+"""Performance tests module"""
@@ -0,0 +1,98 @@
+"""
+Benchmark for validating and publishing a large menu
+"""
+import time
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database import Base, models as db_models
+from src.services.menu.menu_service import MenuService
+from src.services.menu.snapshot import menu_snapshots
+from src.services.menu.validation_service import MenuValidationService
+from src.utils import logger
+
+CATEGORIES = 20
+ITEMS_PER_CATEGORY = 100  # 2,000 items
+
+
+@pytest.fixture
+def db():
+    """In-memory database with a 2,000-item menu (3 variants and 2 add-ons per item)"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+
+    session.add(db_models.Branch(id=1, name="Main", code="MAIN"))
+    session.add(db_models.Menu(id=1, branch_id=1, name="Main Menu"))
+    session.flush()
+
+    items, variants, addons = [], [], []
+    for category_id in range(1, CATEGORIES + 1):
+        session.add(db_models.Category(
+            id=category_id, menu_id=1, name_ar=f"فئة {category_id}", name_en=f"Category {category_id}"
+        ))
+        for n in range(ITEMS_PER_CATEGORY):
+            item_id = len(items) + 1
+            items.append({
+                "id": item_id, "category_id": category_id,
+                "name_ar": f"صنف {item_id}", "name_en": f"Item {item_id}", "base_price": 10.0 + n
+            })
+            for size, is_default in (("Small", False), ("Medium", True), ("Large", False)):
+                variants.append({
+                    "item_id": item_id, "name_ar": size, "name_en": size,
+                    "variant_type": "size", "is_default": is_default
+                })
+            addons.append({"item_id": item_id, "name_ar": "جبنة", "name_en": "Cheese", "price": 2.0})
+            addons.append({
+                "item_id": item_id, "name_ar": "ثلج", "name_en": "Extra Ice", "price": 0.5,
+                "is_conditional": True, "condition_variant_type": "size", "condition_variant_value": "Large"
+            })
+    session.flush()
+    session.execute(insert(db_models.Item), items)
+    session.execute(insert(db_models.Variant), variants)
+    session.execute(insert(db_models.AddOn), addons)
+    session.commit()
+
+    session.queries = []
+    event.listen(engine, "before_cursor_execute", lambda *args: session.queries.append(args[2]))
+
+    menu_snapshots.invalidate()
+    yield session
+    menu_snapshots.invalidate()
+    session.close()
+    engine.dispose()
+
+
+@pytest.mark.slow
+@pytest.mark.menu
+class TestMenuPublishBenchmark:
+    """Publish-time benchmark on a 2,000-item menu"""
+
+    def test_validation_query_count_is_constant(self, db):
+        """Test that validation issues a fixed number of queries regardless of menu size"""
+        start_time = time.perf_counter()
+        result = MenuValidationService().validate_menu(db, 1)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        logger.info("validate_menu benchmark", elapsed_ms=round(elapsed_ms, 1), queries=len(db.queries))
+        assert result.valid
+        assert result.stats == {"categories": 20, "items": 2000, "variants": 6000, "addons": 4000}
+        assert len(db.queries) <= 6
+
+    def test_publish_time(self, db):
+        """Benchmark publish (validation, version bump, snapshot build)"""
+        start_time = time.perf_counter()
+        menu = MenuService().publish_menu(db, 1)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        logger.info("publish_menu benchmark", elapsed_ms=round(elapsed_ms, 1), queries=len(db.queries))
+        assert menu.published and menu.version == 2
+        assert len(menu_snapshots.get(db, 1).items) == 2000
+        assert len(db.queries) <= 20
+        assert elapsed_ms < 5000
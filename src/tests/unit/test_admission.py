@@ -0,0 +1,65 @@
+"""
+Unit tests for inference admission control
+"""
+import asyncio
+import pytest
+
+from src.utils.admission import AdmissionController, ServiceSaturatedError
+
+
+class TestAdmissionController:
+    """Test cases for AdmissionController"""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_accounting(self):
+        """Test that in-flight count tracks held slots"""
+        admission = AdmissionController("test", max_concurrency=2, max_queue=2)
+
+        async with admission.slot():
+            assert admission.in_flight == 1
+            assert admission.saturated is False
+
+        assert admission.in_flight == 0
+        assert admission.admitted == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_do_not_fail(self):
+        """Test that simultaneous requests wait for a slot instead of erroring"""
+        admission = AdmissionController("test", max_concurrency=1, max_queue=4)
+        order = []
+
+        async def work(n):
+            async with admission.slot():
+                order.append(n)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[work(n) for n in range(3)])
+
+        assert sorted(order) == [0, 1, 2]
+        assert admission.peak_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        """Test that requests beyond the wait queue are rejected"""
+        admission = AdmissionController("test", max_concurrency=1, max_queue=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with admission.slot():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert admission.saturated is True
+        assert admission.waiting == 1
+        with pytest.raises(ServiceSaturatedError):
+            async with admission.slot():
+                pass
+
+        release.set()
+        await asyncio.gather(holder, waiter)
+        assert admission.rejected == 1
+        assert admission.get_stats()["in_flight"] == 0
@@ -0,0 +1,91 @@
+"""
+Unit tests for utterance endpointing
+Tests the UtteranceEndpointer state machine with synthetic PCM frames
+"""
+import pytest
+import numpy as np
+
+from src.services.stt.endpointing import (
+    UtteranceEndpointer,
+    EndpointEventType,
+    EndpointState
+)
+
+
+def pcm(ms: int, amplitude: int = 0) -> bytes:
+    """Create 16kHz 16-bit PCM of the given duration and constant amplitude"""
+    samples = int(16000 * ms / 1000)
+    return np.full(samples, amplitude, dtype=np.int16).tobytes()
+
+
+SPEECH = 8000  # Well above the energy threshold
+SILENCE = 0
+
+
+class TestUtteranceEndpointer:
+    """Test cases for UtteranceEndpointer"""
+
+    @pytest.fixture
+    def endpointer(self):
+        """Create energy-only endpointer with short timings"""
+        return UtteranceEndpointer(
+            frame_ms=30,
+            speech_start_ms=90,
+            hangover_ms=300,
+            max_utterance_ms=3000,
+            pre_roll_ms=60,
+            use_vad=False
+        )
+
+    def test_silence_produces_no_events(self, endpointer):
+        """Test that silence and noise never reach STT"""
+        events = endpointer.process(pcm(1000, SILENCE))
+
+        assert events == []
+        assert endpointer.state == EndpointState.SILENCE
+
+    def test_short_click_is_ignored(self, endpointer):
+        """Test that speech shorter than speech_start_ms does not open an utterance"""
+        events = endpointer.process(pcm(60, SPEECH) + pcm(300, SILENCE))
+
+        assert events == []
+        assert endpointer.state == EndpointState.SILENCE
+
+    def test_single_utterance_endpoint(self, endpointer):
+        """Test that one utterance yields exactly one SPEECH_END"""
+        audio = pcm(300, SILENCE) + pcm(600, SPEECH) + pcm(600, SILENCE)
+        events = endpointer.process(audio)
+
+        types = [e.type for e in events]
+        assert types[0] == EndpointEventType.SPEECH_START
+        assert types.count(EndpointEventType.SPEECH_END) == 1
+
+        utterance = [e for e in events if e.type == EndpointEventType.SPEECH_END][0]
+        # Pre-roll + speech + hangover
+        assert len(utterance.audio) == len(pcm(60 + 600 + 300))
+
+    def test_frames_split_across_chunks(self, endpointer):
+        """Test that odd-sized WebSocket chunks are reassembled into frames"""
+        audio = pcm(600, SPEECH) + pcm(300, SILENCE)
+        events = []
+        for offset in range(0, len(audio), 500):
+            events.extend(endpointer.process(audio[offset:offset + 500]))
+
+        assert [e.type for e in events].count(EndpointEventType.SPEECH_END) == 1
+
+    def test_max_utterance_forces_endpoint(self, endpointer):
+        """Test that continuous speech is cut at max_utterance_ms"""
+        events = endpointer.process(pcm(4000, SPEECH))
+
+        assert [e.type for e in events].count(EndpointEventType.SPEECH_END) == 1
+
+    def test_flush_closes_open_utterance(self, endpointer):
+        """Test that flush returns the utterance in progress"""
+        endpointer.process(pcm(300, SPEECH))
+
+        event = endpointer.flush()
+
+        assert event is not None
+        assert event.type == EndpointEventType.SPEECH_END
+        assert endpointer.state == EndpointState.SILENCE
+        assert endpointer.flush() is None
@@ -0,0 +1,94 @@
+"""
+Unit tests for the trigram fuzzy index
+"""
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from src.services.nlu.fuzzy_index import TrigramIndex, char_masks, lcs_length, similarity
+from src.services.nlu.keyword_index import BranchKeyword, BranchKeywordIndex, keyword_tokens
+
+
+class TestSimilarity:
+    """Test cases for the bit-parallel similarity"""
+
+    def test_matches_sequence_matcher_on_typos(self):
+        """Test that the ratio agrees with difflib for simple misspellings"""
+        for a, b in (("chicken", "chiken"), ("coffee", "cofee"), ("burger", "burgers"), ("برجر", "برقر")):
+            assert similarity(a, b) == SequenceMatcher(None, a, b).ratio()
+
+    def test_lcs_length(self):
+        """Test LCS across the word boundary of multi-word strings"""
+        assert lcs_length(char_masks("cheese burger"), 13, "cheeseburger") == 12
+        assert lcs_length(char_masks(""), 0, "abc") == 0
+
+
+class TestTrigramIndex:
+    """Test cases for TrigramIndex"""
+
+    def test_search_equals_brute_force(self):
+        """Test that candidate filtering never drops a string above the threshold"""
+        rng = random.Random(7)
+        words = {
+            "".join(rng.choice("abcdefghilmnoprstu") for _ in range(rng.randint(3, 12)))
+            for _ in range(500)
+        }
+        index = TrigramIndex()
+        for word in words:
+            index.add(word)
+
+        for word in rng.sample(sorted(words), 50):
+            query = list(word)
+            del query[rng.randrange(len(query))]
+            query.insert(rng.randrange(len(query) + 1), rng.choice("xyz"))
+            query = "".join(query)
+
+            expected = {w for w in words if similarity(query, w) >= 0.8}
+            assert {w for w, _ in index.search(query, 0.8)} == expected
+
+    def test_short_strings_without_shared_trigrams(self):
+        """Test that matches sharing no trigram with the query are still found"""
+        index = TrigramIndex()
+        for word in ("dca", "xyz", "dcab"):
+            index.add(word)
+
+        assert similarity("da", "dca") == pytest.approx(0.8)
+        assert {w for w, _ in index.search("da", 0.8)} == {"dca"}
+
+    def test_low_threshold_equals_brute_force(self):
+        """Test exactness where the trigram bound rejects nothing"""
+        rng = random.Random(11)
+        words = {"".join(rng.choice("abcd") for _ in range(rng.randint(1, 5))) for _ in range(200)}
+        index = TrigramIndex()
+        for word in words:
+            index.add(word)
+
+        for query in rng.sample(sorted(words), 20):
+            expected = {w for w in words if similarity(query, w) >= 0.5}
+            assert {w for w, _ in index.search(query, 0.5)} == expected
+
+
+class TestBranchFuzzyLookup:
+    """Test cases for BranchKeywordIndex.fuzzy_lookup"""
+
+    def lookup(self, index, text, language="en"):
+        return {
+            (span, phrase) for span, phrase, _ in
+            index.fuzzy_lookup(keyword_tokens(text, language), language, 0.85)
+        }
+
+    def test_multi_token_spans(self):
+        """Test misspelled words inside multi-word keywords and merged/split words"""
+        index = BranchKeywordIndex(1, [
+            BranchKeyword(None, "chicken burger", 1.0, 1, "برجر دجاج", "Chicken Burger"),
+            BranchKeyword(None, "cheeseburger", 1.0, 2, "تشيز برجر", "Cheeseburger"),
+            BranchKeyword(None, "iced tea", 1.0, 3, "شاي مثلج", "Iced Tea"),
+            BranchKeyword("بطاطس", None, 1.0, 4, "بطاطس", "Fries"),
+        ])
+
+        assert (("chiken", "burgr"), ("chicken", "burger")) in self.lookup(index, "two chiken burgr please")
+        assert (("cheese", "burger"), ("cheeseburger",)) in self.lookup(index, "a cheese burger")
+        assert (("icedtea",), ("iced", "tea")) in self.lookup(index, "one icedtea")
+        assert (("بطاطا",), ("بطاطس",)) not in self.lookup(index, "بطاطا", "ar")
+        assert self.lookup(index, "chicken wings") == set()
@@ -0,0 +1,126 @@
+"""
+Unit tests for the in-memory branch keyword index
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database import Base, models as db_models
+from src.services.nlu.keyword_index import BranchKeyword, BranchKeywordIndex, keyword_tokens
+from src.services.nlu.keyword_service import KeywordMatchingService
+
+
+class TestBranchKeywordIndex:
+    """Test cases for BranchKeywordIndex"""
+
+    def test_multi_token_and_arabic_article(self):
+        """Test whole-span lookup and Arabic definite-article folding"""
+        index = BranchKeywordIndex(1, [
+            BranchKeyword("برجر", "cheese burger", 1.0, 1, "برجر", "Cheese Burger"),
+        ])
+
+        assert list(index.lookup(keyword_tokens("one Cheese Burger please", "en"), "en")) == [("cheese", "burger")]
+        assert list(index.lookup(keyword_tokens("أريد البرجر", "ar"), "ar")) == [("برجر",)]
+        assert index.lookup(keyword_tokens("cheeseburger", "en"), "en") == {}
+
+
+class TestKeywordServiceIndex:
+    """Test cases for index-backed keyword matching"""
+
+    @pytest.fixture
+    def db(self):
+        """In-memory database with one keyword and a query counter"""
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+
+        branch = db_models.Branch(name="Main", code="MAIN")
+        session.add(branch)
+        session.flush()
+        menu = db_models.Menu(branch_id=branch.id, name="Lunch")
+        session.add(menu)
+        session.flush()
+        category = db_models.Category(menu_id=menu.id, name_ar="برجر", name_en="Burgers")
+        session.add(category)
+        session.flush()
+        for name_ar, name_en in (("برجر", "Burger"), ("قهوة", "Coffee")):
+            session.add(db_models.Item(
+                category_id=category.id, name_ar=name_ar, name_en=name_en, base_price=10.0
+            ))
+        session.flush()
+        session.add(db_models.Keyword(branch_id=branch.id, item_id=1, keyword_en="burger", weight=1.0))
+        session.commit()
+
+        session.queries = []
+        event.listen(engine, "before_cursor_execute", lambda *args: session.queries.append(args[2]))
+
+        yield session
+        session.close()
+        engine.dispose()
+
+    def test_matching_needs_no_queries_after_load(self, db):
+        """Test that the branch is loaded once and matched from memory"""
+        service = KeywordMatchingService()
+
+        first = service.match_keywords("a burger", "en", 1, db)
+        loads = len(db.queries)
+        service.match_keywords("two burgers", "en", 1, db)
+        service.match_keywords("burger again", "en", 1, db)
+
+        assert [m.item_name_en for m in first] == ["Burger"]
+        assert loads == 2  # Stamp and keywords
+        assert len(db.queries) == loads
+
+    def test_incremental_refresh(self, db):
+        """Test that added keywords and renamed items show up without a reload"""
+        service = KeywordMatchingService()
+        service.match_keywords("burger", "en", 1, db)
+
+        service.add_keyword(db, branch_id=1, item_id=2, keyword_en="latte")
+        affected = service.update_item_names(1, "برجر لحم", "Beef Burger")
+
+        assert affected == [1]
+        assert [m.item_name_en for m in service.match_keywords("latte", "en", 1, db)] == ["Coffee"]
+        assert [m.item_name_en for m in service.match_keywords("burger", "en", 1, db)] == ["Beef Burger"]
+        assert service.get_stats()["index_loads"] == 1
+
+    def test_reloads_after_changes_from_other_workers(self, db):
+        """Test that keywords deleted, added or renamed behind the index are picked up"""
+        service = KeywordMatchingService()
+        service.check_interval = 0
+        assert service.match_keywords("burger", "en", 1, db)
+
+        # Another worker deletes the keyword
+        db.query(db_models.Keyword).delete()
+        db.commit()
+        assert service.match_keywords("burger", "en", 1, db) == []
+
+        # ... adds one, then renames its item
+        db.add(db_models.Keyword(branch_id=1, item_id=2, keyword_en="latte", weight=1.0))
+        db.commit()
+        assert [m.item_name_en for m in service.match_keywords("latte", "en", 1, db)] == ["Coffee"]
+
+        db.query(db_models.Item).filter(db_models.Item.id == 2).update({"name_en": "Flat White"})
+        db.commit()
+        assert [m.item_name_en for m in service.match_keywords("latte", "en", 1, db)] == ["Flat White"]
+
+        stats = service.get_stats()
+        assert stats["stale_reloads"] == 3
+        assert stats["index_loads"] == 4
+
+    def test_unchanged_branch_is_not_reloaded(self, db):
+        """Test that a due check with an unchanged stamp costs one query and no reload"""
+        service = KeywordMatchingService()
+        service.check_interval = 0
+        service.match_keywords("burger", "en", 1, db)
+        before = len(db.queries)
+
+        service.match_keywords("burger", "en", 1, db)
+
+        assert len(db.queries) == before + 1
+        assert service.get_stats()["index_loads"] == 1
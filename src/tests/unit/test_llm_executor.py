@@ -0,0 +1,106 @@
+"""
+Unit tests for the LLM executor
+"""
+import time
+import asyncio
+import threading
+import pytest
+
+from src.services.nlu.llm_executor import LLMExecutor, LLMTimeoutError
+from src.utils import ServiceSaturatedError
+
+
+class TestLLMExecutor:
+    """Test cases for LLMExecutor"""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self):
+        """Test that a blocking call leaves the event loop responsive"""
+        executor = LLMExecutor(max_queue=4, timeout_ms=2000)
+        threads = []
+
+        def generate():
+            threads.append(threading.current_thread().name)
+            time.sleep(0.1)
+            return "ok"
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        result = await executor.run(generate)
+        ticking.cancel()
+
+        assert result == "ok"
+        assert threads[0].startswith("llm")
+        assert ticks >= 5
+        assert executor.get_stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_bound_rejects(self):
+        """Test backpressure once the wait queue is full"""
+        executor = LLMExecutor(max_queue=1, timeout_ms=2000)
+        release = threading.Event()
+
+        running = asyncio.create_task(executor.run(release.wait))
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(executor.run(lambda: "queued"))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ServiceSaturatedError):
+            await executor.run(lambda: "rejected")
+
+        release.set()
+        assert await queued == "queued"
+        await running
+        assert executor.get_stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timed_out_queued_call_is_skipped(self):
+        """Test that a call timing out in the queue never runs"""
+        executor = LLMExecutor(max_queue=4, timeout_ms=2000)
+        release = threading.Event()
+        ran = []
+
+        running = asyncio.create_task(executor.run(release.wait))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(LLMTimeoutError):
+            await executor.run(lambda: ran.append(1), timeout_ms=50)
+
+        release.set()
+        await running
+        await asyncio.sleep(0.01)
+
+        stats = executor.get_stats()
+        assert ran == []
+        assert stats["timeouts"] == 1
+        assert stats["skipped"] == 1
+        assert stats["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_timed_out_running_call_frees_the_thread(self):
+        """Test that a generating call that times out stops and the next call runs"""
+        executor = LLMExecutor(max_queue=4, timeout_ms=2000)
+        stop = threading.Event()
+
+        def generate():
+            # Stand-in for llama.cpp checking its stopping criteria per token
+            for _ in range(500):
+                if stop.is_set():
+                    return "stopped"
+                time.sleep(0.01)
+            return "finished"
+
+        with pytest.raises(LLMTimeoutError):
+            await executor.run(generate, timeout_ms=50, stop=stop)
+
+        start = time.time()
+        assert await executor.run(lambda: "next") == "next"
+        assert time.time() - start < 0.5
+        assert stop.is_set()
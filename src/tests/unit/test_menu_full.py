@@ -0,0 +1,89 @@
+"""
+Unit tests for the full menu tree endpoint service methods
+"""
+import json
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database import Base, models as db_models
+from src.models.menu import ItemUpdate
+from src.services.menu.menu_service import MenuService
+from src.services.menu.snapshot import menu_snapshots
+
+
+@pytest.fixture
+def db():
+    """In-memory database with a 3-category, 30-item menu and a query counter"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+
+    branch = db_models.Branch(name="Main", code="MAIN")
+    session.add(branch)
+    session.flush()
+    menu = db_models.Menu(branch_id=branch.id, name="Lunch")
+    session.add(menu)
+    session.flush()
+    for c in range(3):
+        category = db_models.Category(menu_id=menu.id, name_ar=f"فئة {c}", name_en=f"Category {c}", display_order=2 - c)
+        session.add(category)
+        session.flush()
+        for i in range(10):
+            item = db_models.Item(
+                category_id=category.id, name_ar=f"صنف {c}-{i}", name_en=f"Item {c}-{i}", base_price=10.0 + i
+            )
+            session.add(item)
+            session.flush()
+            session.add_all([
+                db_models.Variant(item_id=item.id, name_ar="عادي", name_en="Regular", variant_type="size", is_default=True),
+                db_models.Variant(item_id=item.id, name_ar="كبير", name_en="Large", variant_type="size", price_modifier=3.0),
+                db_models.AddOn(item_id=item.id, name_ar="جبنة", name_en="Cheese", price=2.0),
+            ])
+    session.commit()
+
+    session.queries = []
+    event.listen(engine, "before_cursor_execute", lambda *args: session.queries.append(args[2]))
+
+    menu_snapshots.invalidate()
+    yield session
+    menu_snapshots.invalidate()
+    session.close()
+    engine.dispose()
+
+
+class TestFullMenu:
+    """Test cases for MenuService.get_full_menu_json"""
+
+    def test_whole_tree_in_fixed_queries(self, db):
+        """Test that a draft tree loads in a constant number of queries, in display order"""
+        builds = menu_snapshots.builds
+        body = MenuService().get_full_menu_json(db, 1)
+        tree = json.loads(body)
+
+        assert len(db.queries) == 6  # published check + menu + categories + items + variants + add-ons
+        assert menu_snapshots.builds == builds
+        assert [c["name_en"] for c in tree["categories"]] == ["Category 2", "Category 1", "Category 0"]
+        item = tree["categories"][0]["items"][0]
+        assert [v["name_en"] for v in item["variants"]] == ["Regular", "Large"]
+        assert [a["name_en"] for a in item["addons"]] == ["Cheese"]
+        assert MenuService().get_full_menu_json(db, 99) is None
+
+    def test_body_is_the_snapshot_payload(self, db):
+        """Test that the body is serialized once per version and refreshed on edits"""
+        service = MenuService()
+        service.publish_menu(db, 1)
+
+        first = service.get_full_menu_json(db, 1)
+        db.queries.clear()
+        assert service.get_full_menu_json(db, 1) is first
+        assert first is menu_snapshots.get(db, 1).payload
+        assert len(db.queries) == 2
+
+        service.update_item(db, 1, ItemUpdate(name_en="Renamed"))
+        assert b"Renamed" in service.get_full_menu_json(db, 1)
@@ -0,0 +1,221 @@
+"""
+Unit tests for the published menu snapshot
+"""
+import json
+import threading
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database import Base, models as db_models
+from src.models.menu import (
+    AddOnCreate, CategoryCreate, FullMenuResponse, ItemCreate, ItemResponse, ItemUpdate, VariantCreate
+)
+from src.services.menu.menu_service import MenuService
+from src.services.menu import snapshot as snapshot_module
+from src.services.menu.snapshot import MenuSnapshotStore, build_menu_snapshot, menu_snapshots
+
+
+@pytest.fixture
+def db():
+    """In-memory database with one valid menu and a query counter"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+
+    branch = db_models.Branch(name="Main", code="MAIN")
+    session.add(branch)
+    session.flush()
+    menu = db_models.Menu(branch_id=branch.id, name="Lunch")
+    session.add(menu)
+    session.flush()
+    category = db_models.Category(menu_id=menu.id, name_ar="برجر", name_en="Burgers")
+    session.add(category)
+    session.flush()
+    item = db_models.Item(category_id=category.id, name_ar="برجر", name_en="Burger", base_price=20.0)
+    session.add(item)
+    session.flush()
+    session.add_all([
+        db_models.Variant(item_id=item.id, name_ar="عادي", name_en="Regular", variant_type="size", is_default=True),
+        db_models.Variant(item_id=item.id, name_ar="كبير", name_en="Large", variant_type="size", price_modifier=4.0),
+        db_models.AddOn(item_id=item.id, name_ar="جبنة", name_en="Cheese", price=2.5),
+        db_models.AddOn(item_id=None, name_ar="صوص", name_en="Sauce", price=1.0),
+    ])
+    session.commit()
+
+    session.queries = []
+    event.listen(engine, "before_cursor_execute", lambda *args: session.queries.append(args[2]))
+
+    menu_snapshots.invalidate()
+    yield session
+    menu_snapshots.invalidate()
+    session.close()
+    engine.dispose()
+
+
+class TestMenuSnapshot:
+    """Test cases for build_menu_snapshot"""
+
+    def test_tree_lookup_tables_and_payload(self, db):
+        """Test the frozen tree, its id tables and the serialized FullMenuResponse"""
+        snapshot = build_menu_snapshot(db, 1)
+
+        item = snapshot.items[1]
+        assert snapshot.key == (1, 1)
+        assert snapshot.categories[0].items == (item,)
+        assert [v.name_en for v in item.variants] == ["Regular", "Large"]
+        assert [a.name_en for a in snapshot.global_addons] == ["Sauce"]
+        assert json.loads(snapshot.payload)["categories"][0]["items"][0]["name_en"] == "Burger"
+        assert snapshot.payload == FullMenuResponse.model_validate(
+            db.get(db_models.Menu, 1), from_attributes=True
+        ).model_dump_json().encode("utf-8")
+
+        with pytest.raises(AttributeError):
+            item.base_price = 0
+        with pytest.raises(TypeError):
+            snapshot.items[2] = item
+
+
+class TestMenuReads:
+    """Test cases for MenuService reads served from the snapshot"""
+
+    def test_reads_cost_one_query_once_built(self, db):
+        """Test that category, item, variant and add-on reads skip the ORM"""
+        service = MenuService()
+        service.publish_menu(db, 1)
+        db.queries.clear()
+
+        assert [c.name_en for c in service.get_categories(db, 1)] == ["Burgers"]
+        assert [i.name_en for i in service.get_items(db, 1)] == ["Burger"]
+        assert service.get_item_node(db, 1).base_price == 20.0
+        assert [v.name_en for v in service.get_variants(db, 1)] == ["Regular", "Large"]
+        assert [a.name_en for a in service.get_addons(db, 1)] == ["Cheese"]
+        assert len(db.queries) == 5
+        assert ItemResponse.model_validate(service.get_item_node(db, 1)).name_en == "Burger"
+
+    def test_draft_reads_skip_the_snapshot(self, db):
+        """Test that editing a draft never rebuilds a snapshot"""
+        service = MenuService()
+        builds = menu_snapshots.builds
+
+        for n in range(3):
+            service.create_item(db, ItemCreate(category_id=1, name_ar=f"صنف {n}", name_en=f"Item {n}", base_price=5.0))
+            assert len(service.get_items(db, 1)) == n + 2
+
+        assert [c.name_en for c in service.get_categories(db, 1)] == ["Burgers"]
+        assert [v.name_en for v in service.get_variants(db, 1)] == ["Regular", "Large"]
+        assert [a.name_en for a in service.get_addons(db, 1)] == ["Cheese"]
+        assert menu_snapshots.builds == builds and menu_snapshots.get_stats()["snapshots"] == []
+
+    def test_missing_ids(self, db):
+        """Test that unknown ids read as empty"""
+        service = MenuService()
+
+        assert service.get_categories(db, 99) == []
+        assert service.get_items(db, 99) == []
+        assert service.get_item_node(db, 99) is None
+        assert service.get_variants(db, 99) == []
+
+
+class MenuSnapshotStub:
+    """Stand-in for a built snapshot"""
+
+    def __init__(self, menu_id: int):
+        self.version = 1
+        self.key = (menu_id, 1)
+        self.items = {}
+        self.payload = b"{}"
+
+
+class TestMenuSnapshotStore:
+    """Test cases for versioned snapshot caching"""
+
+    def test_store_reuses_snapshot(self, db):
+        """Test that repeated reads cost one version lookup and no tree load"""
+        store = MenuSnapshotStore()
+        first = store.get(db, 1)
+        db.queries.clear()
+
+        assert store.get(db, 1) is first
+        assert len(db.queries) == 1
+        assert store.get(db, 99) is None
+
+    def test_published_only_skips_drafts(self, db):
+        """Test that readers asking for published snapshots get None for drafts"""
+        store = MenuSnapshotStore()
+
+        assert store.get(db, 1, published_only=True) is None
+        assert store.get_owning(db, item_id=1, published_only=True) is None
+        assert store.builds == 0
+
+        db.query(db_models.Menu).update({"published": True})
+        db.commit()
+        assert store.get_owning(db, item_id=1, published_only=True) is store.get(db, 1)
+
+    def test_builds_lock_per_menu(self, monkeypatch):
+        """Test that a slow build of one menu does not block another menu's build"""
+        store = MenuSnapshotStore()
+        started, release = threading.Event(), threading.Event()
+
+        def build(db, menu_id):
+            if menu_id == 1:
+                started.set()
+                release.wait(5)
+            return MenuSnapshotStub(menu_id)
+
+        monkeypatch.setattr(snapshot_module, "build_menu_snapshot", build)
+        slow = threading.Thread(target=store._get_or_build, args=(None, 1, 1))
+        slow.start()
+        try:
+            assert started.wait(5)
+            assert store._get_or_build(None, 2, 1).key == (2, 1)
+            assert store.builds == 1
+        finally:
+            release.set()
+            slow.join()
+        assert store.builds == 2
+
+    def test_publish_bumps_version_and_edits_invalidate(self, db):
+        """Test that publishing creates a new snapshot key and edits rebuild it"""
+        service = MenuService()
+        before = menu_snapshots.get(db, 1)
+
+        menu = service.publish_menu(db, 1)
+        published = menu_snapshots.get(db, 1)
+
+        assert menu.version == 2
+        assert published.key == (1, 2) and published is not before
+        assert service.get_menu(db, 1) is menu
+
+        service.create_item(db, ItemCreate(category_id=1, name_ar="قهوة", name_en="Coffee", base_price=8.0))
+
+        assert [i.name_en for i in service.get_items(db, 1)] == ["Burger", "Coffee"]
+
+    def test_every_edit_bumps_the_version(self, db):
+        """Test that edits change the version other workers check, not just local state"""
+        service = MenuService()
+        db.add(db_models.Menu(branch_id=1, name="Dinner"))
+        db.commit()
+
+        def versions():
+            return dict(db.query(db_models.Menu.id, db_models.Menu.version).all())
+
+        service.create_category(db, CategoryCreate(menu_id=1, name_ar="مشروبات", name_en="Drinks"))
+        assert versions() == {1: 2, 2: 1}
+        service.create_item(db, ItemCreate(category_id=1, name_ar="بطاطس", name_en="Fries", base_price=5.0))
+        assert versions() == {1: 3, 2: 1}
+        service.update_item(db, 1, ItemUpdate(base_price=21.0))
+        assert versions() == {1: 4, 2: 1}
+        service.create_variant(db, VariantCreate(item_id=1, name_ar="صغير", name_en="Small", variant_type="size"))
+        assert versions() == {1: 5, 2: 1}
+        service.create_addon(db, AddOnCreate(item_id=1, name_ar="لحم", name_en="Bacon", price=3.0))
+        assert versions() == {1: 6, 2: 1}
+
+        # Global add-ons appear in every menu
+        service.create_addon(db, AddOnCreate(name_ar="كاتشب", name_en="Ketchup", price=0.5))
+        assert versions() == {1: 7, 2: 2}
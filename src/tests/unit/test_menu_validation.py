@@ -2,6 +2,11 @@
 Unit tests for Menu Validation Service
 """
 import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database import Base, models as db_models
 from src.services.menu import MenuValidationService
 
 
@@ -62,3 +67,61 @@ class TestMenuValidation:
 
         result = validator.validate_item_structure(item_data)
         assert result.valid is False
+
+
+class TestMenuValidationQueries:
+    """Test cases for set-based validate_menu"""
+
+    @pytest.fixture
+    def db(self):
+        """In-memory database with one menu holding every kind of problem"""
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+
+        session.add(db_models.Branch(id=1, name="Main", code="MAIN"))
+        session.add(db_models.Menu(id=1, branch_id=1, name="Lunch"))
+        session.add(db_models.Category(id=1, menu_id=1, name_ar="", name_en="Burgers"))
+        session.add(db_models.Category(id=2, menu_id=1, name_ar="مشروبات", name_en="Drinks"))
+        session.flush()
+        session.add(db_models.Item(id=1, category_id=1, name_ar="برجر", name_en="Burger", base_price=-1.0))
+        session.add(db_models.Item(id=2, category_id=1, name_ar="", name_en="Fries", base_price=0.0))
+        session.flush()
+        session.add_all([
+            db_models.Variant(item_id=1, name_ar="ص", name_en="S", variant_type="size", is_default=True),
+            db_models.Variant(item_id=1, name_ar="ك", name_en="L", variant_type="size", is_default=True),
+            db_models.Variant(item_id=1, name_ar="ح", name_en="Hot", variant_type="temperature"),
+            db_models.AddOn(item_id=2, name_ar="ج", name_en="Cheese", price=-2.0,
+                            is_conditional=True, condition_variant_type="size"),
+        ])
+        session.commit()
+
+        session.queries = []
+        event.listen(engine, "before_cursor_execute", lambda *args: session.queries.append(args[2]))
+
+        yield session
+        session.close()
+        engine.dispose()
+
+    def test_messages_and_query_count(self, db):
+        """Test that every problem is reported, in menu order, with a fixed number of queries"""
+        result = MenuValidationService().validate_menu(db, 1)
+
+        assert result.valid is False
+        assert result.errors == [
+            "Category 1 missing Arabic or English name",
+            "Item 'Burger' has negative price",
+            "Item 'Burger' has multiple default size variants",
+            "Item 'Burger' has no default temperature variant",
+            "Item 2 missing Arabic or English name",
+            "Item 'Fries' has zero price (may be intentional)",
+            "Add-on 'Cheese' for item 'Fries' has negative price",
+            "Conditional add-on 'Cheese' missing condition details",
+        ]
+        assert result.warnings == ["Category 'Drinks' has no items"]
+        assert result.stats == {"categories": 2, "items": 2, "variants": 3, "addons": 1}
+        assert len(db.queries) == 6
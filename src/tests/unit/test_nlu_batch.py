@@ -0,0 +1,86 @@
+"""
+Unit tests for batch NLU processing
+"""
+import pytest
+from fastapi import HTTPException
+
+from src.api.routes import nlu as nlu_routes
+from src.config import settings
+from src.models.nlu import NLURequest, IntentType
+from src.services.nlu.nlu_service import NLUService
+from src.services.nlu.keyword_service import KeywordMatchingService
+from src.services.nlu.keyword_index import BranchKeyword, BranchKeywordIndex
+from src.services.nlu.result_cache import NLUResultCache
+
+
+class TestNLUBatch:
+    """Test cases for NLUService.process_batch"""
+
+    @pytest.fixture
+    def service(self):
+        """Create rule-based NLU service with caching out of the way"""
+        service = NLUService()
+        service.result_cache = NLUResultCache(max_entries=0, ttl_seconds=0)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_duplicates_processed_once(self, service):
+        """Test that identical texts share one result and keep input order"""
+        processed = []
+        original = service.process
+
+        async def counting_process(request, *args, **kwargs):
+            processed.append(request.text)
+            return await original(request, *args, **kwargs)
+
+        service.process = counting_process
+        requests = [
+            NLURequest(text="Hello", language="en"),
+            NLURequest(text="cancel", language="en"),
+            NLURequest(text="hello!", language="en"),
+        ]
+
+        results = [item async for item in service.process_batch(requests)]
+
+        assert [index for index, _ in results] == [0, 1, 2]
+        assert processed == ["Hello", "cancel"]
+        assert results[2][1].text == "hello!"
+        assert results[2][1].intent.intent_type == IntentType.GREETING
+
+    @pytest.mark.asyncio
+    async def test_shared_branch_keywords(self, service):
+        """Test keyword matching against a shared branch index"""
+        keywords = {7: BranchKeywordIndex(7, [BranchKeyword("برجر", "burger", 1.0, 3, "برجر لحم", "Beef Burger")])}
+        requests = [NLURequest(text="one burger please", language="en", branch_id=7)]
+
+        results = [item async for item in service.process_batch(requests, keywords)]
+
+        assert results[0][1].matched_keywords == ["Beef Burger (1.00)"]
+
+    @pytest.mark.asyncio
+    async def test_batch_size_is_capped(self, service, monkeypatch):
+        """Test that oversized batches are rejected before any work is done"""
+        monkeypatch.setattr(settings, "nlu_batch_max_size", 2)
+        requests = [NLURequest(text="Hello", language="en")] * 3
+
+        with pytest.raises(ValueError):
+            [item async for item in service.process_batch(requests)]
+        with pytest.raises(HTTPException) as exc_info:
+            await nlu_routes.process_batch(requests, db=None)
+        assert exc_info.value.status_code == 413
+
+
+class TestLoadedKeywordMatching:
+    """Test cases for matching without database access"""
+
+    def test_match_index_exact_and_fuzzy(self):
+        """Test exact and fuzzy matches from a keyword index"""
+        service = KeywordMatchingService()
+        index = BranchKeywordIndex(1, [
+            BranchKeyword(None, "chicken", 1.0, 1, "دجاج", "Chicken"),
+            BranchKeyword(None, "coffee", 1.0, 2, "قهوة", "Coffee"),
+        ])
+
+        matches = service.match_index("chiken and coffee", "en", index)
+
+        assert {(m.item_id, m.match_type) for m in matches} == {(1, "fuzzy"), (2, "exact")}
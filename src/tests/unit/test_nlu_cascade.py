@@ -0,0 +1,131 @@
+"""
+Unit tests for the tiered NLU cascade
+"""
+import json
+import time
+import asyncio
+import pytest
+
+from src.config import settings
+from src.models.nlu import NLURequest, IntentType, SlotType
+from src.services.nlu.nlu_service import NLUService
+from src.services.nlu.keyword_index import BranchKeyword, BranchKeywordIndex
+from src.services.nlu.result_cache import NLUResultCache
+
+
+class FakeLlama:
+    """Counts completions and always answers with an order"""
+
+    def __init__(self):
+        self._input_ids = []
+        self.calls = 0
+
+    def tokenize(self, text, add_bos=True):
+        return list(text)
+
+    def reset(self):
+        self._input_ids = []
+
+    def eval(self, tokens):
+        self._input_ids = list(tokens)
+
+    def save_state(self):
+        return list(self._input_ids)
+
+    def load_state(self, state):
+        self._input_ids = list(state)
+
+    def __call__(self, prompt, **kwargs):
+        self.calls += 1
+        return {"choices": [{"text": json.dumps({
+            "intent": "order_item", "confidence": 0.8, "slots": []
+        })}]}
+
+
+class TestNLUCascade:
+    """Test cases for NLUService.process_traced"""
+
+    @pytest.fixture
+    def service(self):
+        """Create NLU service with a fake model and no result caching"""
+        service = NLUService()
+        service.model = FakeLlama()
+        service.result_cache = NLUResultCache(max_entries=0, ttl_seconds=0)
+        return service
+
+    @pytest.fixture
+    def keywords(self):
+        """Branch keyword index"""
+        return BranchKeywordIndex(1, [BranchKeyword("برجر", "burger", 1.0, 3, "برجر لحم", "Beef Burger")])
+
+    @pytest.mark.asyncio
+    async def test_confident_rules_skip_llm(self, service):
+        """Test that a greeting is answered by the rules tier"""
+        response, trace = await service.process_traced(NLURequest(text="hello", language="en"))
+
+        assert response.intent.intent_type == IntentType.GREETING
+        assert trace.final_tier == "rules"
+        assert service.model.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_keyword_tier_resolves_menu_items(self, service, keywords):
+        """Test that a fuzzy menu match is answered by the keyword tier"""
+        request = NLURequest(text="two burgers", language="en", branch_id=1)
+
+        response, trace = await service.process_traced(request, keyword_index=keywords)
+
+        assert [result.tier for result in trace.tiers] == ["rules", "keywords"]
+        assert response.intent.intent_type == IntentType.ORDER_ITEM
+        assert any(slot.slot_type == SlotType.ITEM_NAME and slot.value == "Beef Burger" for slot in response.slots)
+        assert service.model.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_unresolved_escalates_to_llm(self, service):
+        """Test that low-confidence utterances reach the LLM and are traced"""
+        response, trace = await service.process_traced(NLURequest(text="the usual", language="en"))
+
+        assert trace.final_tier == "llm"
+        assert response.intent.intent_type == IntentType.ORDER_ITEM
+        assert service.model.calls == 1
+        assert trace.server_timing().startswith("rules;dur=")
+        assert service.tier_stats.get_stats()["resolved"] == {"llm": 1}
+
+    @pytest.mark.asyncio
+    async def test_per_intent_threshold(self, service, monkeypatch):
+        """Test that raising an intent's threshold escalates it"""
+        monkeypatch.setattr(settings, "nlu_intent_thresholds", {"greeting": 0.99})
+
+        _, trace = await service.process_traced(NLURequest(text="hello", language="en"))
+
+        assert trace.final_tier == "llm"
+
+    @pytest.mark.asyncio
+    async def test_deadline_returns_degraded_rules_answer(self, service):
+        """Test that a late LLM is abandoned in favour of the rules answer"""
+        original_call = FakeLlama.__call__
+
+        class SlowLlama(FakeLlama):
+            def __call__(self, prompt, **kwargs):
+                # Generates for up to 3s, checking the stopping criteria per "token"
+                for _ in range(300):
+                    if kwargs["stopping_criteria"]([], None):
+                        break
+                    time.sleep(0.01)
+                return original_call(self, prompt, **kwargs)
+
+        service.model = SlowLlama()
+        start = time.time()
+
+        response, trace = await service.process_traced(
+            NLURequest(text="I want something", language="en"), deadline_ms=50
+        )
+
+        assert time.time() - start < 0.2
+        assert response.intent.intent_type == IntentType.ORDER_ITEM
+        assert response.intent.confidence == 0.85
+        assert trace.degraded and trace.deadline_missed
+        assert trace.final_tier == "rules"
+
+        # The abandoned generation stops at the next token and frees the LLM thread
+        await asyncio.sleep(0.1)
+        assert service.llm.get_stats()["in_flight"] == 0
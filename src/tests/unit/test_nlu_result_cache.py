@@ -0,0 +1,135 @@
+"""
+Unit tests for the NLU result cache
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database import Base, models as db_models
+from src.models.nlu import NLURequest, IntentType
+from src.services.nlu.keyword_service import keyword_service
+from src.services.nlu.nlu_service import NLUService
+from src.services.nlu.result_cache import NLUResultCache, nlu_result_cache, normalize_utterance
+
+
+class TestNLUResultCache:
+    """Test cases for NLUResultCache"""
+
+    @pytest.fixture
+    def service(self):
+        """Create rule-based NLU service with a private cache"""
+        service = NLUService()
+        service.result_cache = NLUResultCache(max_entries=100, ttl_seconds=60)
+        return service
+
+    def test_normalization(self):
+        """Test case, punctuation, whitespace and diacritic folding"""
+        assert normalize_utterance("  One LARGE coffee, please! ") == "one large coffee please"
+        assert normalize_utterance("نَعَم؟") == normalize_utterance("نعم")
+        assert normalize_utterance("I'll have") == "i'll have"
+
+    @pytest.mark.asyncio
+    async def test_repeat_is_served_from_cache(self, service):
+        """Test that a normalized repeat hits and keeps the caller's text"""
+        first = await service.process(NLURequest(text="Hello", language="en"))
+        second = await service.process(NLURequest(text="hello!", language="en"))
+
+        assert second.intent.intent_type == first.intent.intent_type == IntentType.GREETING
+        assert second.text == "hello!"
+        assert first.text == "Hello"
+        assert service.result_cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_branch_invalidation_and_context(self, service):
+        """Test that invalidation is per branch and dialog state is part of the key"""
+        cache = service.result_cache
+        key_a = cache.make_key("yes", "en", 1, {"state": "confirming"})
+        key_b = cache.make_key("yes", "en", 2, {"state": "confirming"})
+        response = await service.process(NLURequest(text="yes", language="en"))
+        cache.put(key_a, response)
+        cache.put(key_b, response)
+
+        assert cache.get(cache.make_key("yes", "en", 1, {"state": "choosing_size"})) is None
+
+        cache.invalidate_branch(1)
+
+        assert cache.get(cache.make_key("yes", "en", 1, {"state": "confirming"})) is None
+        assert cache.get(cache.make_key("yes", "en", 2, {"state": "confirming"})) == response
+
+    @pytest.mark.asyncio
+    async def test_hits_are_private_copies(self, service):
+        """Test that modifying a returned response does not change the cached one"""
+        first = await service.process(NLURequest(text="one large burger", language="en"))
+        first.slots.clear()
+        first.entities["tampered"] = True
+
+        second = await service.process(NLURequest(text="one large burger", language="en"))
+        second.slots.clear()
+        third = await service.process(NLURequest(text="one large burger", language="en"))
+
+        assert third.slots and "tampered" not in third.entities
+
+    @pytest.mark.asyncio
+    async def test_failed_llm_result_not_cached(self, service):
+        """Test that rule fallbacks after an LLM failure are not cached"""
+        def broken_model(prompt, **kwargs):
+            raise RuntimeError("model crashed")
+
+        service.model = broken_model
+        await service.process(NLURequest(text="something odd", language="en"))
+
+        assert len(service.result_cache) == 0
+
+
+class TestCrossWorkerInvalidation:
+    """Test cases for cached results after another worker edits a branch"""
+
+    @pytest.fixture
+    def db(self, monkeypatch):
+        """In-memory database with one branch keyword; stamp checked on every request"""
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+
+        session.add(db_models.Branch(id=1, name="Main", code="MAIN"))
+        session.add(db_models.Menu(id=1, branch_id=1, name="Lunch"))
+        session.add(db_models.Category(id=1, menu_id=1, name_ar="برجر", name_en="Burgers"))
+        session.add(db_models.Item(id=1, category_id=1, name_ar="برجر", name_en="Burger", base_price=10.0))
+        session.add(db_models.Keyword(branch_id=1, item_id=1, keyword_en="burger", weight=1.0))
+        session.commit()
+
+        monkeypatch.setattr(keyword_service, "check_interval", 0)
+        keyword_service.invalidate_index(1)
+        nlu_result_cache.clear()
+        yield session
+        keyword_service.invalidate_index(1)
+        nlu_result_cache.clear()
+        session.close()
+        engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_repeat_after_rename_elsewhere_is_recomputed(self, db):
+        """Test that a rename committed by another worker is not hidden by the cache"""
+        service = NLUService()
+        request = NLURequest(text="a burger please", language="en", branch_id=1)
+
+        first = await service.process(request, db)
+        hits = nlu_result_cache.hits
+        await service.process(request, db)
+        assert nlu_result_cache.hits == hits + 1
+        hits += 1
+
+        # Another worker renames the item; this worker's cache was never told
+        db.query(db_models.Item).filter(db_models.Item.id == 1).update({"name_en": "Beef Burger"})
+        db.commit()
+
+        second = await service.process(request, db)
+
+        assert first.matched_keywords == ["Burger (1.00)"]
+        assert second.matched_keywords == ["Beef Burger (1.00)"]
+        assert nlu_result_cache.hits == hits
@@ -0,0 +1,83 @@
+"""
+Unit tests for the joint intent-and-slot LLM output
+"""
+import json
+import pytest
+
+from src.models.nlu import IntentType, SlotType
+from src.services.nlu.nlu_service import NLUService
+from src.services.nlu.structured_output import build_nlu_grammar, parse_nlu_json
+
+
+class TestStructuredOutput:
+    """Test cases for the NLU grammar and parser"""
+
+    def test_grammar_lists_every_intent_and_slot_type(self):
+        """Test that the grammar is generated from the enums"""
+        grammar = build_nlu_grammar()
+
+        assert grammar.startswith("root ::= ")
+        for value in [t.value for t in IntentType] + [t.value for t in SlotType]:
+            assert f'"\\"{value}\\""' in grammar
+
+    def test_parse_joint_response(self):
+        """Test parsing intent, confidence and slots"""
+        intent, slots = parse_nlu_json(
+            '{"intent": "order_item", "confidence": 0.93, "slots": ['
+            '{"type": "item_name", "value": "برجر", "confidence": 0.9}, '
+            '{"type": "bogus", "value": "x", "confidence": 0.5}]}'
+        )
+
+        assert intent.intent_type == IntentType.ORDER_ITEM
+        assert intent.confidence == 0.93
+        assert [(s.slot_type, s.value) for s in slots] == [(SlotType.ITEM_NAME, "برجر")]
+
+    def test_parse_unknown_intent(self):
+        """Test that an unrecognized intent degrades to UNKNOWN"""
+        intent, slots = parse_nlu_json('{"intent": "dance", "confidence": 1, "slots": []}')
+
+        assert intent.intent_type == IntentType.UNKNOWN
+        assert intent.confidence == 0.5
+        assert slots == []
+
+
+class TestJointLLMCall:
+    """Test cases for NLUService._analyze_llm"""
+
+    @pytest.mark.asyncio
+    async def test_single_call_returns_intent_and_slots(self):
+        """Test that intent and slots come from one model call"""
+        calls = []
+
+        class FakeModel:
+            _input_ids = []
+
+            def tokenize(self, text, add_bos=True):
+                return list(text)
+
+            def reset(self):
+                pass
+
+            def eval(self, tokens):
+                pass
+
+            def save_state(self):
+                return None
+
+            def __call__(self, prompt, **kwargs):
+                calls.append(kwargs)
+                return {"choices": [{"text": json.dumps({
+                    "intent": "order_item",
+                    "confidence": 0.9,
+                    "slots": [{"type": "quantity", "value": "2", "confidence": 0.95}]
+                })}]}
+
+        service = NLUService()
+        service.model = FakeModel()
+
+        intent, slots = await service._analyze_llm("two burgers please", "en")
+
+        assert len(calls) == 1
+        assert "grammar" in calls[0]
+        assert intent.intent_type == IntentType.ORDER_ITEM
+        assert [(s.slot_type, s.value) for s in slots] == [(SlotType.QUANTITY, "2")]
@@ -0,0 +1,71 @@
+"""
+Unit tests for the compiled NLU phrase matcher
+"""
+import pytest
+
+from src.services.nlu.phrase_matcher import PhraseMatcher, ARABIC_PROCLITICS
+from src.services.nlu.nlu_service import NLUService
+from src.models.nlu import IntentType
+
+
+class TestPhraseMatcher:
+    """Test cases for PhraseMatcher"""
+
+    @pytest.fixture
+    def matcher(self):
+        """Create matcher with overlapping phrases"""
+        return PhraseMatcher({
+            "reject": ["no", "nope"],
+            "cancel": ["no thanks", "cancel"],
+            "greeting": ["hi"],
+        })
+
+    def test_matches_whole_words_only(self, matcher):
+        """Test that phrases do not match inside other words"""
+        assert matcher.match("I know this chicken") == []
+
+    def test_returns_all_matches_with_spans(self, matcher):
+        """Test that every match is reported with its action and span"""
+        text = "Hi, no thanks. Cancel"
+        matches = matcher.match(text)
+
+        assert [(m.phrase, m.action) for m in matches] == [
+            ("hi", "greeting"), ("no thanks", "cancel"), ("cancel", "cancel")
+        ]
+        assert text[matches[1].start:matches[1].end] == "no thanks"
+
+    def test_longest_phrase_wins_with_boundary_backtracking(self, matcher):
+        """Test that a longer phrase is preferred only when it ends on a word boundary"""
+        assert [m.action for m in matcher.match("no thanks")] == ["cancel"]
+        assert [m.phrase for m in matcher.match("no thanksgiving")] == ["no"]
+
+    def test_arabic_attached_conjunction(self):
+        """Test that Arabic phrases match after an attached conjunction"""
+        matcher = PhraseMatcher({"repeat": ["كرر"]}, prefix=ARABIC_PROCLITICS)
+        matches = matcher.match("من فضلك وكرر الطلب")
+
+        assert [m.phrase for m in matches] == ["كرر"]
+
+
+class TestRuleBasedNLU:
+    """Test cases for matcher-backed trigger and intent rules"""
+
+    @pytest.fixture
+    def service(self):
+        """Create NLU service without a model"""
+        return NLUService()
+
+    def test_no_false_trigger_inside_words(self, service):
+        """Test that 'know' and 'what' no longer fire reject/repeat"""
+        assert service._detect_trigger_words("what burger do you know", "en") is None
+        intent = service._classify_intent_rules("what burger do you know", "en")
+        assert intent.intent_type == IntentType.ORDER_ITEM
+        assert intent.confidence == 0.70
+
+    def test_update_vocabulary_rebuilds_matcher(self, service):
+        """Test that vocabulary changes take effect immediately"""
+        assert service._classify_intent_rules("howdy", "en").intent_type == IntentType.UNKNOWN
+
+        service.update_vocabulary("en", "greeting", ["hello", "hi", "howdy"])
+
+        assert service._classify_intent_rules("howdy", "en").intent_type == IntentType.GREETING
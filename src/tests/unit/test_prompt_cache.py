@@ -0,0 +1,75 @@
+"""
+Unit tests for the llama.cpp prompt prefix cache
+"""
+import pytest
+
+from src.services.nlu.prompt_cache import PromptPrefixCache
+
+
+class FakeLlama:
+    """Character-tokenized stand-in recording evaluated tokens"""
+
+    def __init__(self):
+        self._input_ids = []
+        self.evaluated = 0
+
+    def tokenize(self, text, add_bos=True):
+        return [0] + list(text) if add_bos else list(text)
+
+    def reset(self):
+        self._input_ids = []
+
+    def eval(self, tokens):
+        self._input_ids = self._input_ids + list(tokens)
+        self.evaluated += len(tokens)
+
+    def save_state(self):
+        return list(self._input_ids)
+
+    def load_state(self, state):
+        self._input_ids = list(state)
+
+
+class TestPromptPrefixCache:
+    """Test cases for PromptPrefixCache"""
+
+    @pytest.fixture
+    def model(self):
+        """Create fake model"""
+        return FakeLlama()
+
+    def test_prefix_evaluated_once(self, model):
+        """Test that repeated requests reuse the live prefix"""
+        cache = PromptPrefixCache()
+
+        assert cache.prepare(model, "en", "english prefix") == 15
+        assert cache.prepare(model, "en", "english prefix") == 15
+
+        assert model.evaluated == 15
+        stats = cache.get_stats()
+        assert stats["builds"] == 1
+        assert stats["restores"] == 0
+        assert stats["prefix_tokens_saved"] == 15
+
+    def test_alternating_prefixes_restore_state(self, model):
+        """Test that switching language restores instead of re-evaluating"""
+        cache = PromptPrefixCache()
+        cache.prepare(model, "ar", "arabic")
+        cache.prepare(model, "en", "english")
+
+        cache.prepare(model, "ar", "arabic")
+
+        assert model._input_ids == [0] + list(b"arabic")
+        assert model.evaluated == 7 + 8
+        assert cache.get_stats()["restores"] == 1
+
+    def test_changed_prefix_and_lru_eviction(self, model):
+        """Test that edited prefixes rebuild and old keys are evicted"""
+        cache = PromptPrefixCache(max_entries=1)
+        cache.prepare(model, "en", "v1")
+        cache.prepare(model, "en", "v2")
+        cache.prepare(model, "ar", "ar")
+
+        stats = cache.get_stats()
+        assert stats["builds"] == 3
+        assert stats["entries"] == 1
@@ -0,0 +1,107 @@
+"""
+Unit tests for single-flight request coalescing
+"""
+import asyncio
+import pytest
+
+from src.utils.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight"""
+
+    @pytest.fixture
+    def flight(self):
+        """Create single-flight group"""
+        return SingleFlight("test")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_execution(self, flight):
+        """Test that identical concurrent calls run the work once"""
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "audio"
+
+        results = await asyncio.gather(*[flight.do("greeting", work) for _ in range(5)])
+
+        assert results == ["audio"] * 5
+        assert len(calls) == 1
+        assert flight.get_stats()["coalesced"] == 4
+        assert flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_all_waiters(self, flight):
+        """Test that every waiter receives the shared exception"""
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("synthesis failed")
+
+        results = await asyncio.gather(
+            flight.do("greeting", work),
+            flight.do("greeting", work),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self, flight):
+        """Test that one caller going away leaves the work running for the rest"""
+        async def work():
+            await asyncio.sleep(0.05)
+            return "audio"
+
+        first = asyncio.ensure_future(flight.do("greeting", work))
+        second = asyncio.ensure_future(flight.do("greeting", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "audio"
+
+    @pytest.mark.asyncio
+    async def test_last_waiter_cancels_work(self, flight):
+        """Test that the work is cancelled once nobody is waiting for it"""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def work():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiter = asyncio.ensure_future(flight.do("greeting", work))
+        await started.wait()
+        waiter.cancel()
+        await asyncio.sleep(0.01)
+
+        assert cancelled.is_set()
+        assert flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_request_right_after_cancel_starts_fresh(self, flight):
+        """Test that a barge-in followed by an immediate re-request is not cancelled"""
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(10)
+
+        async def fast():
+            return "audio"
+
+        waiter = asyncio.ensure_future(flight.do("greeting", slow))
+        await started.wait()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        # Same loop iteration as the cancellation: the old task's done
+        # callback has not run yet
+        assert await flight.do("greeting", fast) == "audio"
+        assert flight.get_stats()["executions"] == 2
@@ -0,0 +1,101 @@
+"""
+Unit tests for incremental streaming STT
+Tests the StreamingTranscriber commit policy with a scripted STT service
+"""
+import pytest
+import numpy as np
+from unittest.mock import AsyncMock
+
+from src.services.stt.streaming import StreamingTranscriber
+
+
+def make_stt(*decodes):
+    """Create mock STT service returning one scripted word list per decode"""
+    stt = AsyncMock()
+    stt.transcribe_words.side_effect = [(words, "en") for words in decodes]
+    return stt
+
+
+def chunk(ms: int) -> np.ndarray:
+    """Create a chunk of silent audio of the given duration"""
+    return np.zeros(int(16000 * ms / 1000), dtype=np.float32)
+
+
+class TestStreamingTranscriber:
+    """Test cases for StreamingTranscriber"""
+
+    @pytest.mark.asyncio
+    async def test_no_decode_below_min_chunk(self):
+        """Test that small frames are buffered without decoding"""
+        stt = make_stt()
+        session = StreamingTranscriber(stt, min_chunk_ms=200)
+
+        update = await session.insert_audio(chunk(30))
+
+        assert update is None
+        stt.transcribe_words.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_first_decode_is_partial_only(self):
+        """Test that a single decode never commits words"""
+        stt = make_stt([(0.0, 0.1, " I", 0.9), (0.1, 0.2, " want", 0.9)])
+        session = StreamingTranscriber(stt, min_chunk_ms=200)
+
+        update = await session.insert_audio(chunk(200))
+
+        assert update.final_text == ""
+        assert update.partial_text == "I want"
+
+    @pytest.mark.asyncio
+    async def test_agreed_prefix_is_committed(self):
+        """Test that words shared by consecutive decodes become final"""
+        stt = make_stt(
+            [(0.0, 0.1, " I", 0.9), (0.1, 0.2, " want", 0.9)],
+            [(0.0, 0.1, " I", 0.9), (0.1, 0.2, " want", 0.9), (0.2, 0.4, " a", 0.9)],
+        )
+        session = StreamingTranscriber(stt, min_chunk_ms=200)
+
+        await session.insert_audio(chunk(200))
+        update = await session.insert_audio(chunk(200))
+
+        assert update.final_text == "I want"
+        assert update.partial_text == "a"
+        assert session.committed_text == "I want"
+        # Committed audio is trimmed so only the tail is re-decoded
+        assert session.window_offset == pytest.approx(0.2)
+        assert len(session.audio) == int(16000 * 0.2)
+
+    @pytest.mark.asyncio
+    async def test_repeated_committed_words_are_dropped(self):
+        """Test that a decode repeating committed words does not duplicate them"""
+        stt = make_stt(
+            [(0.0, 0.1, " one", 0.9)],
+            [(0.0, 0.1, " one", 0.9)],
+            [(0.0, 0.05, " one", 0.9), (0.05, 0.2, " large", 0.9)],
+        )
+        session = StreamingTranscriber(stt, min_chunk_ms=200)
+
+        await session.insert_audio(chunk(200))
+        await session.insert_audio(chunk(200))
+        update = await session.insert_audio(chunk(200))
+
+        assert session.committed_text == "one"
+        assert update.partial_text == "large"
+
+    @pytest.mark.asyncio
+    async def test_finish_commits_remaining_words(self):
+        """Test that finishing an utterance flushes the unconfirmed tail"""
+        stt = make_stt(
+            [(0.0, 0.3, " coffee", 0.9)],
+            [(0.0, 0.3, " coffee", 0.9), (0.3, 0.5, " please", 0.9)],
+        )
+        session = StreamingTranscriber(stt, min_chunk_ms=200)
+
+        await session.insert_audio(chunk(200))
+        update = await session.finish()
+
+        assert update.final_text == "coffee please"
+        assert update.committed_text == "coffee please"
+        # State is reset for the next utterance
+        assert session.committed_text == ""
+        assert len(session.audio) == 0
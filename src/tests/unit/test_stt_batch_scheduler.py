@@ -0,0 +1,148 @@
+"""
+Unit tests for the STT micro-batching scheduler
+"""
+import asyncio
+import pytest
+import numpy as np
+
+from src.services.stt.batch_scheduler import TranscriptionBatchScheduler
+
+
+class TestTranscriptionBatchScheduler:
+    """Test cases for TranscriptionBatchScheduler"""
+
+    @pytest.fixture
+    def calls(self):
+        """Record of batches passed to the batch function"""
+        return []
+
+    @pytest.fixture
+    def scheduler(self, calls):
+        """Create scheduler with an echoing batch function"""
+        def batch_fn(audios, languages):
+            calls.append(len(audios))
+            return [{"samples": len(audio), "language": lang} for audio, lang in zip(audios, languages)]
+
+        return TranscriptionBatchScheduler(batch_fn, max_batch_size=4, max_wait_ms=20)
+
+    @pytest.mark.asyncio
+    async def test_single_request(self, scheduler, calls):
+        """Test that a lone utterance is dispatched after the wait budget"""
+        result = await scheduler.submit(np.zeros(100, dtype=np.float32), "ar")
+
+        assert result == {"samples": 100, "language": "ar"}
+        assert calls == [1]
+        await scheduler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_batched(self, scheduler, calls):
+        """Test that simultaneous utterances share one batch and get their own results"""
+        results = await asyncio.gather(*[
+            scheduler.submit(np.zeros(n, dtype=np.float32), None)
+            for n in (10, 20, 30)
+        ])
+
+        assert [r["samples"] for r in results] == [10, 20, 30]
+        assert calls == [3]
+        await scheduler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_respected(self, scheduler, calls):
+        """Test that batches never exceed max_batch_size"""
+        await asyncio.gather(*[
+            scheduler.submit(np.zeros(10, dtype=np.float32)) for _ in range(6)
+        ])
+
+        assert max(calls) <= 4
+        assert sum(calls) == 6
+        stats = scheduler.get_stats()
+        assert stats["items_processed"] == 6
+        assert stats["max_queue_depth"] >= 1
+        await scheduler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_batch_error_propagates_to_all_waiters(self):
+        """Test that a failing batch fails every waiting coroutine"""
+        def failing(audios, languages):
+            raise ValueError("decode failed")
+
+        scheduler = TranscriptionBatchScheduler(failing, max_batch_size=4, max_wait_ms=20)
+        results = await asyncio.gather(
+            scheduler.submit(np.zeros(10, dtype=np.float32)),
+            scheduler.submit(np.zeros(10, dtype=np.float32)),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        await scheduler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_short_result_list_fails_every_waiter(self):
+        """Test that a batch returning too few results does not leave waiters hanging"""
+        def short(audios, languages):
+            return [{"text": "only one"}]
+
+        scheduler = TranscriptionBatchScheduler(short, max_batch_size=4, max_wait_ms=20)
+        results = await asyncio.wait_for(asyncio.gather(
+            scheduler.submit(np.zeros(10, dtype=np.float32)),
+            scheduler.submit(np.zeros(10, dtype=np.float32)),
+            return_exceptions=True
+        ), timeout=2)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        await scheduler.shutdown()
+
+
+class TestBatchedDecodingRules:
+    """Test that the batched path applies the single path's VAD and rejection rules"""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        """Service with VAD, batched decoding and single decoding replaced by recorders"""
+        from src.services.stt import faster_whisper_service as module
+
+        monkeypatch.setattr(module, "Tokenizer", object)
+        service = module.FasterWhisperService()
+        service.single_calls = []
+
+        # Silence is all zeros; speech keeps its samples
+        service._vad_trim = lambda audio: audio[audio != 0]
+
+        def decode_batch(audios, languages):
+            # An utterance of exactly 300 speech samples is "hallucinated"
+            return [
+                None if len(audio) == 300 else {"text": f"{len(audio)} samples", "num_segments": 1}
+                for audio in audios
+            ]
+
+        def transcribe_sync(audio, language=None):
+            service.single_calls.append(len(audio))
+            return {"text": "single", "duration": len(audio) / 16000}
+
+        service._decode_batch = decode_batch
+        service._transcribe_sync = transcribe_sync
+        return service
+
+    def test_silence_and_rejected_results(self, service):
+        """Test that silence is empty and rejected batch results are re-decoded singly"""
+        speech = np.ones(1600, dtype=np.float32)
+        silence = np.zeros(1600, dtype=np.float32)
+        rejected = np.concatenate([np.ones(300, dtype=np.float32), np.zeros(500, dtype=np.float32)])
+
+        results = service._transcribe_batch_sync([speech, silence, rejected, speech], ["ar", "en", "ar", None])
+
+        assert results[0]["text"] == "1600 samples"
+        assert results[0]["duration"] == 0.1 and results[0]["batch_size"] == 4
+        assert results[1]["text"] == "" and results[1]["language"] == "en" and results[1]["num_segments"] == 0
+        assert results[2]["text"] == "single"
+        assert service.single_calls == [800]
+
+    def test_single_speech_item_uses_full_pipeline(self, service):
+        """Test that a batch left with one speech utterance after VAD decodes it singly"""
+        speech = np.ones(1600, dtype=np.float32)
+        silence = np.zeros(1600, dtype=np.float32)
+
+        results = service._transcribe_batch_sync([speech, silence], ["ar", "ar"])
+
+        assert results[0]["text"] == "single"
+        assert results[1]["text"] == ""
@@ -0,0 +1,64 @@
+"""
+Unit tests for the byte-budgeted TTS audio cache
+"""
+import pytest
+
+from src.services.tts.audio_cache import TTSAudioCache, CachedAudio
+
+
+def entry(size: int) -> CachedAudio:
+    """Create a cache entry of the given size"""
+    return CachedAudio(audio_data=b"\x00" * size, duration=size / 44100, sample_rate=22050)
+
+
+class TestTTSAudioCache:
+    """Test cases for TTSAudioCache"""
+
+    @pytest.fixture
+    def cache(self):
+        """Create cache with a 100-byte budget"""
+        return TTSAudioCache(max_bytes=100)
+
+    def test_hit_returns_metadata(self, cache):
+        """Test that hits return duration and sample rate, not just bytes"""
+        cache.put("a", entry(40))
+
+        cached = cache.get("a")
+
+        assert cached.duration == pytest.approx(40 / 44100)
+        assert cached.sample_rate == 22050
+        assert cache.get("missing") is None
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_evicts_least_recently_used(self, cache):
+        """Test that the byte budget evicts the LRU entry first"""
+        cache.put("a", entry(40))
+        cache.put("b", entry(40))
+        cache.get("a")  # "b" is now least recently used
+
+        cache.put("c", entry(40))
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.current_bytes == 80
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_replacing_key_updates_size(self, cache):
+        """Test that re-inserting a key does not double count its bytes"""
+        cache.put("a", entry(40))
+        cache.put("a", entry(60))
+
+        assert len(cache) == 1
+        assert cache.current_bytes == 60
+
+    def test_oversized_entry_not_stored(self, cache):
+        """Test that entries larger than the budget are rejected without evicting"""
+        cache.put("a", entry(40))
+
+        assert cache.put("big", entry(101)) is False
+        assert "a" in cache
+        assert cache.clear() == 1
+        assert cache.current_bytes == 0
@@ -0,0 +1,124 @@
+"""
+Unit tests for TTS output formats
+"""
+import asyncio
+import numpy as np
+import pytest
+
+from src.models import AudioFormat, LanguageCode, ServiceStatus, TTSRequest
+from src.services.tts.audio_formats import (
+    encode_audio,
+    pcm_to_mulaw,
+    pcm_to_wav,
+    resample_pcm,
+    wav_to_pcm
+)
+from src.services.tts.xtts_service import XTTSService
+
+
+def tone(seconds: float, sample_rate: int = 24000) -> bytes:
+    """440 Hz int16 tone"""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (np.sin(2 * np.pi * 440 * t) * 10000).astype("<i2").tobytes()
+
+
+class TestAudioFormats:
+    """Test cases for the audio format helpers"""
+
+    def test_resample_length(self):
+        """Test that resampling scales the sample count exactly"""
+        pcm = tone(1.0)
+
+        assert len(resample_pcm(pcm, 24000, 16000)) == 16000 * 2
+        assert len(resample_pcm(pcm, 24000, 8000)) == 8000 * 2
+        assert resample_pcm(pcm, 24000, 24000) is pcm
+
+    def test_mulaw_encoding(self):
+        """Test G.711 reference values and one byte per sample"""
+        pcm = np.array([0, 32767, -32768], dtype="<i2").tobytes()
+
+        assert pcm_to_mulaw(pcm) == bytes([0xFF, 0x80, 0x00])
+
+    def test_mulaw_is_8khz(self):
+        """Test that μ-law output is always resampled to 8 kHz"""
+        encoded, rate = encode_audio(tone(0.5), 24000, AudioFormat.MULAW, sample_rate=16000)
+
+        assert rate == 8000
+        assert len(encoded) == 4000
+
+    def test_wav_round_trip(self):
+        """Test that WAV output carries the requested rate"""
+        encoded, rate = encode_audio(tone(0.5), 24000, AudioFormat.WAV, sample_rate=16000)
+        pcm, header_rate = wav_to_pcm(encoded)
+
+        assert rate == header_rate == 16000
+        assert len(pcm) == 8000 * 2
+
+
+class FakeTTS:
+    """Stand-in for TTS.api.TTS writing a 24 kHz WAV"""
+
+    def tts_to_file(self, text, file_path, speaker_wav=None, language="ar", speed=1.0):
+        file_path.write(pcm_to_wav(tone(0.75), 24000))
+
+
+class TestTTSResponseFormats:
+    """Test cases for format negotiation in XTTSService.generate_speech"""
+
+    @pytest.fixture
+    def service(self):
+        """Create service with a fake model and memory-only cache"""
+        service = XTTSService()
+        service.model = FakeTTS()
+        service.status = ServiceStatus.READY
+        return service
+
+    @pytest.mark.asyncio
+    async def test_exact_duration_for_every_format(self, service):
+        """Test that duration comes from the sample count, cached or not"""
+        for output_format in (AudioFormat.WAV, AudioFormat.PCM, AudioFormat.MULAW):
+            response = await service.generate_speech(TTSRequest(
+                text="Welcome",
+                language=LanguageCode.ENGLISH,
+                output_format=output_format
+            ))
+            assert response.duration == pytest.approx(0.75)
+            assert response.format == output_format.value
+
+        assert service.cache.get_stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_resampled_pcm(self, service):
+        """Test that 16 kHz PCM is a third smaller than native 24 kHz"""
+        response = await service.generate_speech(TTSRequest(
+            text="Welcome",
+            language=LanguageCode.ENGLISH,
+            output_format=AudioFormat.PCM,
+            sample_rate=16000
+        ))
+
+        assert response.sample_rate == 16000
+        assert len(response.audio_data) == int(0.75 * 16000) * 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_synthesize_once(self, service):
+        """Test that simultaneous identical prompts share one synthesis"""
+        calls = []
+        original = service.model.tts_to_file
+
+        def counting_tts_to_file(**kwargs):
+            calls.append(kwargs["text"])
+            original(**kwargs)
+
+        service.model.tts_to_file = counting_tts_to_file
+        responses = await asyncio.gather(*[
+            service.generate_speech(TTSRequest(
+                text="Welcome",
+                language=LanguageCode.ENGLISH,
+                output_format=output_format
+            ))
+            for output_format in (AudioFormat.WAV, AudioFormat.PCM, AudioFormat.MULAW)
+        ])
+
+        assert len(calls) == 1
+        assert [r.format for r in responses] == ["wav", "pcm_s16le", "mulaw"]
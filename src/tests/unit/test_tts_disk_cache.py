@@ -0,0 +1,82 @@
+"""
+Unit tests for the persistent TTS disk cache
+"""
+import os
+import time
+import pytest
+
+from src.services.tts.audio_cache import CachedAudio
+from src.services.tts.disk_cache import TTSDiskCache
+
+
+def entry(size: int) -> CachedAudio:
+    """Create a cache entry of the given size"""
+    return CachedAudio(audio_data=b"\x01" * size, duration=1.5, sample_rate=24000)
+
+
+class TestTTSDiskCache:
+    """Test cases for TTSDiskCache"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create disk cache with a small budget"""
+        return TTSDiskCache(tmp_path / "tts_cache", max_bytes=1000)
+
+    def test_round_trip(self, cache):
+        """Test that audio and metadata survive a write and mmap read"""
+        assert cache.put("abcdef", entry(100))
+
+        cached = cache.get("abcdef")
+
+        assert cached.audio_data == b"\x01" * 100
+        assert cached.duration == pytest.approx(1.5)
+        assert cached.sample_rate == 24000
+        assert cached.format == "wav"
+
+    def test_shared_between_instances(self, cache, tmp_path):
+        """Test that a second process-level instance sees existing entries"""
+        cache.put("abcdef", entry(100))
+
+        other = TTSDiskCache(tmp_path / "tts_cache", max_bytes=1000)
+
+        assert other.get("abcdef") is not None
+        assert other.get("missing") is None
+
+    def test_corrupt_entry_is_discarded(self, cache):
+        """Test that a file with a bad header is treated as a miss and removed"""
+        cache.put("abcdef", entry(100))
+        path = cache._path("abcdef")
+        path.write_bytes(b"garbage" * 10)
+
+        assert cache.get("abcdef") is None
+        assert not path.exists()
+
+    def test_evicts_oldest_over_budget(self, cache):
+        """Test that size-based eviction removes least recently used files"""
+        for i, key in enumerate(["aa01", "bb02", "cc03"]):
+            cache.put(key, entry(300))
+            past = time.time() - 100 + i
+            os.utime(cache._path(key), (past, past))
+
+        cache.put("dd04", entry(300))
+
+        assert cache.get("aa01") is None
+        assert cache.get("dd04") is not None
+        assert cache.evictions >= 1
+        assert cache._scan_size() <= 1000
+
+    def test_stale_temp_files_swept_on_startup(self, cache, tmp_path):
+        """Test that orphaned temp files are removed but in-flight ones are kept"""
+        shard = cache.directory / "ab"
+        shard.mkdir()
+        stale = shard / ".tmp-crashed.tts"
+        fresh = shard / ".tmp-writing.tts"
+        stale.write_bytes(b"\x00" * 50)
+        fresh.write_bytes(b"\x00" * 50)
+        past = time.time() - 3600
+        os.utime(stale, (past, past))
+
+        TTSDiskCache(tmp_path / "tts_cache", max_bytes=1000)
+
+        assert not stale.exists()
+        assert fresh.exists()
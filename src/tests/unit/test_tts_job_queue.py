@@ -0,0 +1,163 @@
+"""
+Unit tests for the priority TTS job queue
+"""
+import asyncio
+import pytest
+
+from src.models import LanguageCode, ServiceStatus, TTSRequest
+from src.services.tts.audio_formats import pcm_to_wav
+from src.services.tts.job_queue import TTSJobQueue, TTSPriority
+from src.services.tts.xtts_service import XTTSService
+from src.utils import ServiceSaturatedError
+
+
+class TestTTSJobQueue:
+    """Test cases for TTSJobQueue"""
+
+    @pytest.fixture
+    def queue(self):
+        """Create queue with a single worker slot"""
+        return TTSJobQueue(max_concurrency=1, max_queue=3)
+
+    @staticmethod
+    async def job(queue, priority, name, order, hold=0.01):
+        async with queue.slot(priority):
+            order.append(name)
+            await asyncio.sleep(hold)
+
+    @pytest.mark.asyncio
+    async def test_live_overtakes_queued_prefetch(self, queue):
+        """Test that waiting jobs are granted by priority, then arrival"""
+        order = []
+        first = asyncio.ensure_future(self.job(queue, TTSPriority.WARMUP, "running", order))
+        await asyncio.sleep(0)
+
+        await asyncio.gather(
+            first,
+            self.job(queue, TTSPriority.PREFETCH, "prefetch", order),
+            self.job(queue, TTSPriority.WARMUP, "warmup", order),
+            self.job(queue, TTSPriority.LIVE, "live", order)
+        )
+
+        assert order == ["running", "live", "prefetch", "warmup"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_waiting_job(self, queue):
+        """Test that a cancelled waiting job never runs and frees its queue spot"""
+        order = []
+        running = asyncio.ensure_future(self.job(queue, TTSPriority.LIVE, "running", order, hold=0.05))
+        await asyncio.sleep(0)
+        waiting = asyncio.ensure_future(self.job(queue, TTSPriority.PREFETCH, "cancelled", order))
+        await asyncio.sleep(0)
+        assert queue.waiting == 1
+
+        waiting.cancel()
+        await running
+
+        assert order == ["running"]
+        assert queue.waiting == 0
+        assert queue.running == 0
+        assert queue.get_stats()["cancelled_waiting"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_job_releases_slot(self, queue):
+        """Test that cancelling the running job hands the slot to the next one"""
+        order = []
+        running = asyncio.ensure_future(self.job(queue, TTSPriority.LIVE, "running", order, hold=10))
+        await asyncio.sleep(0)
+        nxt = asyncio.ensure_future(self.job(queue, TTSPriority.LIVE, "next", order))
+        await asyncio.sleep(0)
+
+        running.cancel()
+        await asyncio.wait_for(nxt, timeout=1)
+
+        assert order == ["running", "next"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects(self, queue):
+        """Test that requests beyond max_queue are rejected"""
+        order = []
+        jobs = [
+            asyncio.ensure_future(self.job(queue, TTSPriority.LIVE, i, order, hold=0.02))
+            for i in range(4)
+        ]
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServiceSaturatedError):
+            async with queue.slot(TTSPriority.LIVE):
+                pass
+
+        await asyncio.gather(*jobs)
+        assert queue.rejected == 1
+
+    @pytest.mark.asyncio
+    async def test_raise_priority_of_waiting_job(self, queue):
+        """Test that a keyed waiting job can overtake jobs queued before it"""
+        order = []
+        running = asyncio.ensure_future(self.job(queue, TTSPriority.LIVE, "running", order))
+        await asyncio.sleep(0)
+        warmup = asyncio.ensure_future(self.job(queue, TTSPriority.PREFETCH, "prefetch", order))
+
+        async def keyed():
+            async with queue.slot(TTSPriority.WARMUP, key="hello"):
+                order.append("raised")
+
+        raised = asyncio.ensure_future(keyed())
+        await asyncio.sleep(0)
+
+        assert queue.raise_priority("hello", TTSPriority.LIVE)
+        assert not queue.raise_priority("missing", TTSPriority.LIVE)
+        await asyncio.gather(running, warmup, raised)
+
+        assert order == ["running", "raised", "prefetch"]
+        assert queue.get_stats()["admitted"]["LIVE"] == 2
+
+
+class FakeTTS:
+    """Stand-in for TTS.api.TTS that records the order of synthesized texts"""
+
+    def __init__(self):
+        self.calls = []
+
+    def tts_to_file(self, text, file_path, speaker_wav=None, language="ar", speed=1.0):
+        self.calls.append(text)
+        file_path.write(pcm_to_wav(b"\x00\x00" * 240, 24000))
+
+
+class TestSharedJobPriority:
+    """Test cases for the priority of coalesced synthesis jobs"""
+
+    @pytest.mark.asyncio
+    async def test_live_caller_joining_prefetch_job_raises_it(self):
+        """Test that a live request for text being pre-rendered does not wait in the prefetch lane"""
+        service = XTTSService()
+        service.model = FakeTTS()
+        service.status = ServiceStatus.READY
+        service.cache_enabled = False
+        service.jobs = TTSJobQueue(max_concurrency=1, max_queue=10)
+
+        def request(text):
+            return TTSRequest(text=text, language=LanguageCode.ENGLISH)
+
+        blocker = asyncio.Event()
+
+        async def hold_slot():
+            async with service.jobs.slot(TTSPriority.LIVE):
+                await blocker.wait()
+
+        holder = asyncio.ensure_future(hold_slot())
+        await asyncio.sleep(0)
+        other = asyncio.ensure_future(service.generate_speech(request("Other"), TTSPriority.PREFETCH))
+        prefetch = asyncio.ensure_future(service.generate_speech(request("Large"), TTSPriority.PREFETCH))
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        live = asyncio.ensure_future(service.generate_speech(request("Large"), TTSPriority.LIVE))
+        await asyncio.sleep(0)
+        blocker.set()
+        await asyncio.gather(holder, other, prefetch, live)
+
+        assert service.model.calls == ["Large", "Other"]
+        assert service.inflight.get_stats()["coalesced"] == 1
+        assert service.jobs.get_stats()["raised"] == 1
+        assert service._job_priorities == {}
@@ -0,0 +1,95 @@
+"""
+Unit tests for TTS pre-rendering at menu publish
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database import Base, models as db_models
+from src.models import LanguageCode
+from src.services.menu.snapshot import menu_snapshots
+from src.services.nlu.nlu_service import CANNED_PROMPTS
+from src.services.tts.audio_cache import CachedAudio
+from src.services.tts.disk_cache import TTSDiskCache
+from src.services.tts.prerender import collect_menu_phrases
+from src.services.tts.xtts_service import XTTSService
+
+
+class TestCollectMenuPhrases:
+    """Test cases for collect_menu_phrases"""
+
+    @pytest.fixture
+    def db(self):
+        """In-memory database with one menu and a second unrelated menu"""
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+
+        branch = db_models.Branch(name="Main", code="MAIN")
+        session.add(branch)
+        session.flush()
+
+        for menu_name, item_en in (("Lunch", "Classic Burger"), ("Other", "Other Item")):
+            menu = db_models.Menu(branch_id=branch.id, name=menu_name)
+            session.add(menu)
+            session.flush()
+            category = db_models.Category(menu_id=menu.id, name_ar="برجر", name_en="Burgers")
+            session.add(category)
+            session.flush()
+            item = db_models.Item(
+                category_id=category.id, name_ar="برجر كلاسيك", name_en=item_en, base_price=25.0
+            )
+            session.add(item)
+            session.flush()
+            session.add(db_models.Variant(
+                item_id=item.id, name_ar="كبير", name_en="Large", variant_type="size"
+            ))
+            session.add(db_models.AddOn(
+                item_id=item.id, name_ar="جبنة إضافية", name_en="Extra Cheese", price=3.0
+            ))
+
+        session.add(db_models.AddOn(item_id=None, name_ar="صوص", name_en="Sauce", price=1.0))
+        session.commit()
+
+        # Snapshots are keyed by menu id and version, which every test database reuses
+        menu_snapshots.invalidate()
+        yield session
+        menu_snapshots.invalidate()
+        session.close()
+        engine.dispose()
+
+    def test_collects_names_and_prompts(self, db):
+        """Test that item, variant, add-on names and canned prompts are collected once"""
+        phrases = collect_menu_phrases(db, menu_id=1)
+
+        assert ("Classic Burger", LanguageCode.ENGLISH) in phrases
+        assert ("برجر كلاسيك", LanguageCode.ARABIC) in phrases
+        assert ("Large", LanguageCode.ENGLISH) in phrases
+        assert ("Extra Cheese", LanguageCode.ENGLISH) in phrases
+        assert ("Sauce", LanguageCode.ENGLISH) in phrases
+        assert (CANNED_PROMPTS["ar"]["clarification"], LanguageCode.ARABIC) in phrases
+        assert ("Other Item", LanguageCode.ENGLISH) not in phrases
+        assert len(phrases) == len(set(phrases))
+
+
+class TestIsCached:
+    """Test cases for XTTSService.is_cached, used to skip already rendered phrases"""
+
+    def test_checks_memory_and_disk(self, tmp_path):
+        """Test that entries in either cache tier count as cached"""
+        service = XTTSService()
+        audio = CachedAudio(audio_data=b"\x01" * 10, duration=0.1, sample_rate=24000)
+
+        service.cache.put(service._generate_cache_key("Large", "en"), audio)
+        assert service.is_cached("Large", "en")
+        assert not service.is_cached("Small", "en")
+
+        service.disk_cache = TTSDiskCache(tmp_path / "tts_cache", max_bytes=10000)
+        service.disk_cache.put(service._generate_cache_key("Small", "en"), audio)
+        assert service.is_cached("Small", "en")
+        assert service.disk_cache.get_stats()["hits"] == 0
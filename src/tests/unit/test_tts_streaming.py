@@ -0,0 +1,112 @@
+"""
+Unit tests for streaming TTS
+Tests text segmentation and incremental synthesis with a fake model
+"""
+import asyncio
+import math
+
+import pytest
+
+from src.models import AudioFormat, LanguageCode, ServiceStatus
+from src.services.tts.audio_formats import encode_audio
+from src.services.tts.text_segmenter import split_for_tts
+from src.services.tts.xtts_service import XTTSService, XTTS_SAMPLE_RATE
+
+
+class FakeTTS:
+    """Stand-in for TTS.api.TTS that records calls"""
+
+    def __init__(self):
+        self.calls = []
+
+    def tts(self, text, speaker_wav=None, language="ar", speed=1.0):
+        self.calls.append(text)
+        return [0.1] * 240  # 10ms at 24kHz
+
+
+class TestSplitForTTS:
+    """Test cases for split_for_tts"""
+
+    def test_splits_sentences(self):
+        """Test that English and Arabic terminators both split"""
+        segments = split_for_tts("Your order is one burger. Anything else? هل تريد مشروب؟ شكراً لك.")
+
+        assert segments == ["Your order is one burger.", "Anything else?", "هل تريد مشروب؟", "شكراً لك."]
+
+    def test_long_sentence_split_at_clauses(self):
+        """Test that overlong sentences split at commas, including the Arabic comma"""
+        text = "برجر كبير مع جبنة إضافية، بطاطس وسط، ومشروب بارد بدون ثلج من فضلك"
+
+        segments = split_for_tts(text, max_chars=30)
+
+        assert all(len(s) <= 30 for s in segments)
+        assert segments[0] == "برجر كبير مع جبنة إضافية،"
+
+    def test_short_fragments_merged(self):
+        """Test that tiny fragments are merged with the next segment"""
+        segments = split_for_tts("OK. Your total is 25 riyals.")
+
+        assert segments == ["OK. Your total is 25 riyals."]
+
+
+class TestStreamingSynthesis:
+    """Test cases for XTTSService.generate_speech_streaming"""
+
+    @pytest.fixture
+    def service(self):
+        """Create service with a fake model and memory-only cache"""
+        service = XTTSService()
+        service.model = FakeTTS()
+        service.status = ServiceStatus.READY
+        return service
+
+    @pytest.mark.asyncio
+    async def test_yields_one_chunk_per_segment(self, service):
+        """Test that audio is yielded per sentence as 16-bit PCM"""
+        chunks = [
+            chunk async for chunk in service.generate_speech_streaming(
+                "Welcome to our restaurant. What would you like today?",
+                LanguageCode.ENGLISH
+            )
+        ]
+
+        assert len(chunks) == 2
+        assert all(len(chunk) == 240 * 2 for chunk in chunks)
+        assert service.output_sample_rate == XTTS_SAMPLE_RATE
+
+    @pytest.mark.asyncio
+    async def test_segments_are_cached(self, service):
+        """Test that repeated sentences are served from cache"""
+        text = "Welcome to our restaurant. What would you like today?"
+        first = [c async for c in service.generate_speech_streaming(text, LanguageCode.ENGLISH)]
+        second = [c async for c in service.generate_speech_streaming(text, LanguageCode.ENGLISH)]
+
+        assert first == second
+        assert len(service.model.calls) == 2
+        assert service.cache.get_stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_does_not_hold_the_job_slot(self, service):
+        """Test that the slot is released once the segment is buffered, not when it is read"""
+        stream = service.generate_speech_streaming("Welcome to our restaurant.", LanguageCode.ENGLISH)
+
+        first = await stream.__anext__()
+        await asyncio.sleep(0)
+
+        assert len(first) == 240 * 2
+        assert service.jobs.running == 0
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_segment_is_resampled_in_one_pass(self, service):
+        """Test that chunked PCM is converted as one buffer, not chunk by chunk"""
+        samples = [int(8000 * math.sin(n / 7)) for n in range(960)]
+        pcm = b"".join(sample.to_bytes(2, "little", signed=True) for sample in samples)
+
+        async def chunks():
+            for start in range(0, len(pcm), 480):
+                yield pcm[start:start + 480]
+
+        encoded = [c async for c in service._encode_segment(chunks(), AudioFormat.MULAW, None)]
+
+        assert encoded == [encode_audio(pcm, service.output_sample_rate, AudioFormat.MULAW)[0]]
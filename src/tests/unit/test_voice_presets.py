@@ -0,0 +1,69 @@
+"""
+Unit tests for XTTS voice presets and speaker latent caching
+"""
+import pytest
+
+from src.services.tts.voice_presets import VoicePresetRegistry
+
+
+class FakeXtts:
+    """Stand-in for the XTTS model that counts latent computations"""
+
+    device = "cpu"
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_conditioning_latents(self, audio_path):
+        self.calls += 1
+        return f"gpt:{self.calls}", f"spk:{self.calls}"
+
+
+class TestVoicePresetRegistry:
+    """Test cases for VoicePresetRegistry"""
+
+    @pytest.fixture
+    def reference(self, tmp_path):
+        """Reference recording"""
+        path = tmp_path / "lane.wav"
+        path.write_bytes(b"RIFF" + b"\x00" * 100)
+        return path
+
+    @pytest.fixture
+    def registry(self, tmp_path, reference):
+        """Registry with one named preset as default"""
+        return VoicePresetRegistry(
+            tmp_path / "latents",
+            presets={"lane": str(reference)},
+            default_voice="lane"
+        )
+
+    def test_resolve(self, registry, reference):
+        """Test preset, raw path, default and unknown voice resolution"""
+        assert registry.resolve({"voice": "lane"}) == str(reference)
+        assert registry.resolve({"speaker_wav": "/tmp/other.wav"}) == "/tmp/other.wav"
+        assert registry.resolve(None) == str(reference)
+        with pytest.raises(ValueError):
+            registry.resolve({"voice": "missing"})
+
+    def test_latents_computed_once(self, registry, reference):
+        """Test that repeated synthesis reuses cached latents"""
+        xtts = FakeXtts()
+
+        first = registry.get_latents(xtts, str(reference))
+        second = registry.get_latents(xtts, str(reference))
+
+        assert first is second
+        assert xtts.calls == 1
+        assert registry.get_stats()["memory_hits"] == 1
+
+    def test_changed_reference_invalidates(self, registry, reference):
+        """Test that editing the reference file produces new latents"""
+        xtts = FakeXtts()
+        first = registry.get_latents(xtts, str(reference))
+
+        reference.write_bytes(b"RIFF" + b"\x01" * 120)
+        second = registry.get_latents(xtts, str(reference))
+
+        assert first.digest != second.digest
+        assert xtts.calls == 2
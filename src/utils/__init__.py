@@ -1,4 +1,14 @@
 """Utilities module"""
 from .logger import logger, log_service_event, log_performance_metric, log_error
+from .admission import AdmissionController, ServiceSaturatedError
+from .singleflight import SingleFlight
 
-__all__ = ["logger", "log_service_event", "log_performance_metric", "log_error"]
+__all__ = [
+    "logger",
+    "log_service_event",
+    "log_performance_metric",
+    "log_error",
+    "AdmissionController",
+    "ServiceSaturatedError",
+    "SingleFlight",
+]
@@ -0,0 +1,86 @@
+"""
+Admission control for model-backed services
+Bounds concurrent inference and the wait queue in front of it
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+
+class ServiceSaturatedError(RuntimeError):
+    """Raised when a request arrives while the wait queue is full"""
+
+
+class AdmissionController:
+    """
+    In-flight accounting with a bounded wait queue
+
+    - At most `max_concurrency` requests run at once
+    - At most `max_queue` requests wait for a slot
+    - Anything beyond that is rejected immediately with ServiceSaturatedError
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.peak_in_flight = 0
+
+    @property
+    def saturated(self) -> bool:
+        """Whether every concurrency slot is in use"""
+        return self.in_flight >= self.max_concurrency
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold one concurrency slot for the duration of the block
+
+        Raises:
+            ServiceSaturatedError: If the wait queue is full
+        """
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise ServiceSaturatedError(
+                f"{self.name} saturated: {self.in_flight} in flight, {self.waiting} waiting"
+            )
+
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        self.admitted += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get admission statistics
+
+        Returns:
+            In-flight, queue and saturation counters
+        """
+        return {
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "saturated": self.saturated,
+            "utilization": self.in_flight / self.max_concurrency if self.max_concurrency else 0.0,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "peak_in_flight": self.peak_in_flight,
+        }
@@ -0,0 +1,99 @@
+"""
+Single-flight request coalescing
+Concurrent calls for the same key share one execution and its outcome
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+@dataclass
+class _Call:
+    """One in-flight execution and the number of callers awaiting it"""
+    task: asyncio.Task
+    waiters: int = 0
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent work
+
+    - The first caller for a key starts the work as a task; later callers
+      with the same key await that task instead of starting their own
+    - Every caller gets the same result, or the same exception
+    - A cancelled caller does not cancel the work for the others; the work
+      is cancelled only when its last waiter goes away
+    - The key is released as soon as the work finishes, so later calls
+      start fresh (results are expected to be cached by the caller)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `fn` once per key among concurrent callers
+
+        Args:
+            key: Identity of the work
+            fn: Coroutine factory performing the work
+
+        Returns:
+            Result of the shared execution
+
+        Raises:
+            Exception: Whatever the shared execution raised
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._release(key, call))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if call.waiters == 1 and not call.task.done():
+                # Release now: the done callback runs a loop iteration later,
+                # and a caller arriving meanwhile must start fresh work
+                # rather than join the cancelled task
+                self._release(key, call)
+                call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys currently executing"""
+        return len(self._calls)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics
+
+        Returns:
+            Execution and coalesced-call counters
+        """
+        total = self.executions + self.coalesced
+        return {
+            "in_flight": self.in_flight,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalesced_rate": self.coalesced / total if total else 0.0,
+        }
+
+    def _release(self, key: Hashable, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]